@@ -0,0 +1,130 @@
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, TextIO
+
+from simplex_method_full import LinearOptimizer, PricingRule, RationalNumber, ResultCache, SolveOptions, load_problem, solve
+
+RESULT_FIELDS = ['file', 'status', 'objective', 'solution', 'iterations', 'time', 'error']
+
+
+class JsonLinesWriter:
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def write(self, result: Dict[str, object]) -> None:
+        self.stream.write(json.dumps(result, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+class CsvWriter:
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.writer = csv.DictWriter(stream, fieldnames=RESULT_FIELDS)
+        self.writer.writeheader()
+
+    def write(self, result: Dict[str, object]) -> None:
+        row = dict(result)
+        if row['solution'] is not None:
+            row['solution'] = " ".join(row['solution'])
+        self.writer.writerow(row)
+        self.stream.flush()
+
+
+def collect_files(patterns: List[str], suffix: str = '.txt') -> List[str]:
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files.extend(sorted(os.path.join(pattern, name) for name in os.listdir(pattern) if name.endswith(suffix)))
+        else:
+            files.extend(sorted(glob.glob(pattern)))
+    return files
+
+
+def init_worker(backend: str) -> None:
+    RationalNumber.use_backend(backend)
+
+
+def solve_file(path: str, engine: str = 'rational', pricing: str = 'dantzig', presolve: bool = False,
+               max_iterations: Optional[int] = None, time_limit: Optional[float] = None, cache_dir: Optional[str] = None,
+               cache_size: int = 64) -> Dict[str, object]:
+    result = {'file': path, 'status': None, 'objective': None, 'solution': None, 'iterations': 0, 'time': 0.0, 'error': None}
+    started = time.perf_counter()
+    try:
+        # Задачи распределяются по процессам, поэтому повторы находятся только в кэше на диске
+        cache = None if cache_dir is None else ResultCache(0, cache_dir, cache_size * 1024 * 1024)
+        options = SolveOptions(pricing=pricing, presolve=presolve, max_iterations=max_iterations, time_limit=time_limit, cache=cache)
+        solved = solve(load_problem(path), engine, options)
+        result['status'] = solved.status.value
+        result['iterations'] = solved.iterations
+        result['error'] = solved.message
+        # При остановке по пределу записывается решение в последнем базисе
+        if solved.x is not None:
+            result['objective'] = str(solved.objective)
+            result['solution'] = [str(x) for x in solved.x]
+    except Exception as e:
+        result['status'] = 'ERROR'
+        result['error'] = str(e)
+    finally:
+        result['time'] = time.perf_counter() - started
+    return result
+
+
+def run_batch(files: List[str], writer: JsonLinesWriter | CsvWriter, engine: str = 'rational', workers: Optional[int] = None,
+              backend: str = 'native', pricing: str = 'dantzig', presolve: bool = False, max_iterations: Optional[int] = None,
+              time_limit: Optional[float] = None, cache_dir: Optional[str] = None, cache_size: int = 64) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(backend,)) as executor:
+        futures = [executor.submit(solve_file, path, engine, pricing, presolve, max_iterations, time_limit, cache_dir, cache_size)
+                   for path in files]
+        for future in as_completed(futures):
+            result = future.result()
+            writer.write(result)
+            counts[result['status']] = counts.get(result['status'], 0) + 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пакетное решение задач линейного программирования")
+    parser.add_argument('inputs', nargs='+', help="каталоги или шаблоны файлов с задачами")
+    parser.add_argument('--output', default='-', help="файл результатов, '-' для стандартного вывода")
+    parser.add_argument('--format', choices=['jsonl', 'csv'], default=None, help="формат результатов (по расширению файла)")
+    parser.add_argument('--engine', choices=sorted(LinearOptimizer.engines), default='rational', help="движок симплекс-метода")
+    parser.add_argument('--pricing', choices=sorted(PricingRule.rules), default='dantzig', help="правило выбора вводимого столбца")
+    parser.add_argument('--presolve', action='store_true', help="упростить задачу перед решением")
+    parser.add_argument('--max-iterations', type=int, default=None, help="предел числа итераций для одной задачи")
+    parser.add_argument('--time-limit', type=float, default=None, help="предел времени решения одной задачи в секундах")
+    parser.add_argument('--cache-dir', default=None, help="каталог кэша результатов для повторяющихся задач")
+    parser.add_argument('--cache-size', type=int, default=64, help="предельный размер кэша на диске в МиБ")
+    parser.add_argument('--backend', choices=RationalNumber.available_backends(), default='native', help="арифметика дробей")
+    parser.add_argument('--workers', type=int, default=None, help="количество процессов")
+    parser.add_argument('--suffix', default='.txt', help="расширение файлов задач при обходе каталога")
+    args = parser.parse_args()
+
+    files = collect_files(args.inputs, args.suffix)
+    if not files:
+        print("Ошибка: не найдено ни одного файла с задачей", file=sys.stderr)
+        sys.exit(1)
+
+    output_format = args.format or ('csv' if args.output.endswith('.csv') else 'jsonl')
+    stream = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+    started = time.perf_counter()
+    try:
+        writer = CsvWriter(stream) if output_format == 'csv' else JsonLinesWriter(stream)
+        counts = run_batch(files, writer, args.engine, args.workers, args.backend, args.pricing, args.presolve,
+                           args.max_iterations, args.time_limit, args.cache_dir, args.cache_size)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    summary = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items()))
+    print(f"Решено задач: {len(files)} за {time.perf_counter() - started:.2f} с ({summary})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+import argparse
+import json
+import random
+import time
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from simplex_method_full import (FormTransformer, Goal, LinearOptimizer, LinearProblem, LinearTable, Limit, RationalNumber,
+                                 RestrictionType, SolveStatus)
+
+
+class LegacyRationalNumber:
+    def __init__(self, top: str | int | float, bottom: int = 1):
+        self.top, self.bottom = self.parse_fraction(top, bottom)
+        self.reduce()
+
+    def parse_fraction(self, top: str | int | float, bottom: int = 1) -> tuple[int, int]:
+        if isinstance(top, str):
+            parts = top.split('/')
+            top_val = int(parts[0])
+            bottom_val = 1 if len(parts) == 1 else int(parts[1])
+        else:
+            top_val = int(top)
+            bottom_val = int(bottom)
+        return top_val, bottom_val
+
+    def normalize_sign(self) -> None:
+        if self.bottom < 0:
+            self.top = -self.top
+            self.bottom = -self.bottom
+
+    def reduce(self) -> None:
+        gcd = self.find_gcd(abs(self.top), abs(self.bottom))
+        self.top //= gcd
+        self.bottom //= gcd
+        self.normalize_sign()
+
+    def find_gcd(self, a: int, b: int) -> int:
+        return a if b == 0 else self.find_gcd(b, a % b)
+
+    def check_division_by_zero(self, other: 'LegacyRationalNumber', operation: str) -> None:
+        if operation == 'quotient' and other.top == 0:
+            raise ValueError("Деление на ноль")
+
+    def get_operation_result(self, other: 'LegacyRationalNumber', operation: str) -> tuple[int, int]:
+        operations = {
+            'sum': (self.top * other.bottom + other.top * self.bottom, self.bottom * other.bottom),
+            'difference': (self.top * other.bottom - other.top * self.bottom, self.bottom * other.bottom),
+            'product': (self.top * other.top, self.bottom * other.bottom),
+            'quotient': (self.top * other.bottom, self.bottom * other.top)
+        }
+        return operations[operation]
+
+    def compute_fraction(self, other: 'LegacyRationalNumber', operation: str) -> 'LegacyRationalNumber':
+        self.check_division_by_zero(other, operation)
+        top, bottom = self.get_operation_result(other, operation)
+        return LegacyRationalNumber(top, bottom)
+
+    def sum(self, other: 'LegacyRationalNumber') -> 'LegacyRationalNumber':
+        return self.compute_fraction(other, 'sum')
+
+    def difference(self, other: 'LegacyRationalNumber') -> 'LegacyRationalNumber':
+        return self.compute_fraction(other, 'difference')
+
+    def product(self, other: 'LegacyRationalNumber') -> 'LegacyRationalNumber':
+        return self.compute_fraction(other, 'product')
+
+    def quotient(self, other: 'LegacyRationalNumber') -> 'LegacyRationalNumber':
+        return self.compute_fraction(other, 'quotient')
+
+    def order(self, other: 'LegacyRationalNumber') -> int:
+        diff = self.difference(other)
+        if diff.top == 0:
+            return 0
+        return 1 if diff.top > 0 else -1
+
+    def is_equal(self, other: 'LegacyRationalNumber') -> bool:
+        return self.top * other.bottom == other.top * self.bottom
+
+    @property
+    def top(self) -> int:
+        return self._top
+
+    @top.setter
+    def top(self, value: int) -> None:
+        self._top = value
+
+    @property
+    def bottom(self) -> int:
+        return self._bottom
+
+    @bottom.setter
+    def bottom(self, value: int) -> None:
+        self._bottom = value
+
+
+RATIONAL_OPERATIONS: Dict[str, Callable] = {
+    'sum': lambda a, b: a.sum(b),
+    'difference': lambda a, b: a.difference(b),
+    'product': lambda a, b: a.product(b),
+    'quotient': lambda a, b: a.quotient(b),
+    'order': lambda a, b: a.order(b),
+    'is_equal': lambda a, b: a.is_equal(b),
+}
+
+
+def make_operands(number_type: type, count: int, seed: int, digits: int) -> List[tuple]:
+    rng = random.Random(seed)
+    limit = 10 ** digits
+    pairs = []
+    for _ in range(count):
+        a = number_type(rng.randint(-limit, limit), rng.randint(1, limit))
+        b = number_type(rng.choice([-1, 1]) * rng.randint(1, limit), rng.randint(1, limit))
+        pairs.append((a, b))
+    return pairs
+
+
+def time_operation(operation: Callable, pairs: List[tuple], repeat: int) -> float:
+    def run() -> None:
+        for a, b in pairs:
+            operation(a, b)
+    return min(timeit.repeat(run, number=1, repeat=repeat)) / len(pairs) * 1e9
+
+
+def benchmark_rational(count: int = 5000, repeat: int = 5, digits: int = 6, seed: int = 1) -> List[Dict[str, float | str]]:
+    legacy_pairs = make_operands(LegacyRationalNumber, count, seed, digits)
+    results = []
+    for backend in RationalNumber.available_backends():
+        RationalNumber.use_backend(backend)
+        pairs = make_operands(RationalNumber, count, seed, digits)
+        for name, operation in RATIONAL_OPERATIONS.items():
+            legacy_ns = time_operation(operation, legacy_pairs, repeat)
+            current_ns = time_operation(operation, pairs, repeat)
+            results.append({
+                'backend': backend,
+                'operation': name,
+                'legacy_ns': legacy_ns,
+                'current_ns': current_ns,
+                'speedup': legacy_ns / current_ns,
+            })
+    RationalNumber.use_backend('native')
+    return results
+
+
+def print_rational_report(results: List[Dict[str, float | str]]) -> None:
+    print(f"{'Арифметика':<10} {'Операция':<12} {'Было, нс':>10} {'Стало, нс':>10} {'Ускорение':>10}")
+    for row in results:
+        print(f"{row['backend']:<10} {row['operation']:<12} {row['legacy_ns']:>10.0f} {row['current_ns']:>10.0f} {row['speedup']:>9.1f}x")
+
+
+def make_limit(kind: RestrictionType, factors: Dict[int, int], right_side: int) -> Limit:
+    restriction = Limit(kind)
+    for j, value in factors.items():
+        restriction.factors[j] = RationalNumber(value)
+    restriction.right_side = RationalNumber(right_side)
+    return restriction
+
+
+def make_goal(maximize: bool, factors: List[int]) -> Goal:
+    return Goal(maximize, [RationalNumber(value) for value in factors])
+
+
+def random_dense(rows: int, cols: int, seed: int) -> LinearProblem:
+    rng = random.Random(seed)
+    restrictions = [
+        make_limit(RestrictionType.BELOW, {j: rng.randint(1, 20) for j in range(cols)}, rng.randint(50, 500))
+        for _ in range(rows)
+    ]
+    return LinearProblem(make_goal(True, [rng.randint(1, 30) for _ in range(cols)]), restrictions)
+
+
+def random_sparse(rows: int, cols: int, density: float, seed: int) -> LinearProblem:
+    rng = random.Random(seed)
+    restrictions = []
+    for i in range(rows):
+        factors = {j: rng.randint(1, 20) for j in range(cols) if rng.random() < density}
+        factors[i % cols] = rng.randint(1, 20)
+        restrictions.append(make_limit(RestrictionType.BELOW, factors, rng.randint(50, 500)))
+    return LinearProblem(make_goal(True, [rng.randint(1, 30) for _ in range(cols)]), restrictions)
+
+
+def klee_minty(size: int) -> LinearProblem:
+    restrictions = []
+    for i in range(size):
+        factors = {j: 2 ** (i - j + 1) for j in range(i)}
+        factors[i] = 1
+        restrictions.append(make_limit(RestrictionType.BELOW, factors, 5 ** (i + 1)))
+    # Избыточная строка убирает единичный столбец x_n, иначе он сразу попадает в базис и обход куба не начинается
+    restrictions.append(make_limit(RestrictionType.BELOW, {j: 1 for j in range(size)}, size * 5 ** size))
+    return LinearProblem(make_goal(True, [2 ** (size - j - 1) for j in range(size)]), restrictions)
+
+
+def assignment(size: int, seed: int) -> LinearProblem:
+    rng = random.Random(seed)
+    restrictions = []
+    for i in range(size):
+        restrictions.append(make_limit(RestrictionType.EQUALS, {i * size + j: 1 for j in range(size)}, 1))
+    for j in range(size):
+        restrictions.append(make_limit(RestrictionType.EQUALS, {i * size + j: 1 for i in range(size)}, 1))
+    return LinearProblem(make_goal(False, [rng.randint(1, 20) for _ in range(size * size)]), restrictions)
+
+
+def transportation(sources: int, sinks: int, seed: int) -> LinearProblem:
+    rng = random.Random(seed)
+    supply = [rng.randint(10, 40) for _ in range(sources)]
+    demand = [rng.randint(10, 40) for _ in range(sinks - 1)]
+    demand.append(sum(supply) - sum(demand))
+    if demand[-1] <= 0:
+        supply[0] += 1 - demand[-1]
+        demand[-1] = 1
+    restrictions = [make_limit(RestrictionType.EQUALS, {i * sinks + j: 1 for j in range(sinks)}, supply[i]) for i in range(sources)]
+    restrictions += [make_limit(RestrictionType.EQUALS, {i * sinks + j: 1 for i in range(sources)}, demand[j]) for j in range(sinks)]
+    return LinearProblem(make_goal(False, [rng.randint(1, 20) for _ in range(sources * sinks)]), restrictions)
+
+
+def infeasible(size: int) -> LinearProblem:
+    restrictions = [make_limit(RestrictionType.BELOW, {j: 1 for j in range(size)}, size)]
+    restrictions.append(make_limit(RestrictionType.ABOVE, {j: 1 for j in range(size)}, 2 * size))
+    return LinearProblem(make_goal(True, [1] * size), restrictions)
+
+
+def unbounded(size: int) -> LinearProblem:
+    restrictions = [make_limit(RestrictionType.BELOW, {j: 1, j + 1: -1}, j + 1) for j in range(size - 1)]
+    return LinearProblem(make_goal(True, [1] * size), restrictions)
+
+
+def make_lp_suite(scale: int = 1, seed: int = 1) -> Dict[str, Callable[[], LinearProblem]]:
+    return {
+        f'dense {15 * scale}x{10 * scale}': lambda: random_dense(15 * scale, 10 * scale, seed),
+        f'sparse {40 * scale}x{30 * scale}': lambda: random_sparse(40 * scale, 30 * scale, 0.1, seed),
+        f'klee-minty {6 + scale}': lambda: klee_minty(6 + scale),
+        f'assignment {3 + scale}': lambda: assignment(3 + scale, seed),
+        f'transport {2 + scale}x{3 + scale}': lambda: transportation(2 + scale, 3 + scale, seed),
+        f'infeasible {5 * scale}': lambda: infeasible(5 * scale),
+        f'unbounded {5 * scale}': lambda: unbounded(5 * scale),
+    }
+
+
+def table_bits(table: LinearTable) -> int:
+    return max((max(cell.top.bit_length(), cell.bottom.bit_length()) for row in table.matrix for cell in row.entries.values()), default=0)
+
+
+def solve_lp(problem: LinearProblem, engine: str) -> Dict[str, object]:
+    optimizer = LinearOptimizer.create(engine)
+    canonical_form = FormTransformer.transform(problem, native_bounds=optimizer.native_bounds)
+    try:
+        table = optimizer.build_table(canonical_form)
+    except ValueError:
+        return {'status': SolveStatus.INFEASIBLE.value, 'pivots': 0, 'objective': None, 'bits': 0}
+    work_table = optimizer.prepare_table(table)
+    status = optimizer.solve_table(work_table)
+    optimizer.finish_table(table, work_table)
+    objective = table.matrix[0][-1].to_float() if status == SolveStatus.OPTIMAL else None
+    return {'status': status.value, 'pivots': optimizer.iterations, 'objective': objective,
+            'bits': table_bits(table) if engine != 'float' else 0}
+
+
+def benchmark_lp(engines: List[str], scale: int = 1, repeat: int = 3, seed: int = 1) -> List[Dict[str, object]]:
+    results = []
+    for family, build in make_lp_suite(scale, seed).items():
+        for engine in engines:
+            problem = build()
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                outcome = solve_lp(problem, engine)
+                timings.append(time.perf_counter() - started)
+
+            tracemalloc.start()
+            solve_lp(problem, engine)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            outcome.update({'family': family, 'engine': engine, 'time_ms': min(timings) * 1e3, 'peak_kib': peak / 1024})
+            results.append(outcome)
+    return results
+
+
+def print_lp_report(results: List[Dict[str, object]], baseline: Optional[List[Dict[str, object]]] = None) -> None:
+    previous = {(row['family'], row['engine']): row for row in baseline or []}
+    header = f"{'Семейство':<18} {'Движок':<9} {'Статус':<11} {'Итерации':>8} {'Время, мс':>10} {'Память, КиБ':>12} {'Биты':>6} {'Цель':>14}"
+    print(header + (f" {'К эталону':>10}" if previous else ""))
+    for row in results:
+        objective = '-' if row['objective'] is None else f"{row['objective']:.6g}"
+        line = (f"{row['family']:<18} {row['engine']:<9} {row['status']:<11} {row['pivots']:>8} {row['time_ms']:>10.2f} "
+                f"{row['peak_kib']:>12.1f} {row['bits']:>6} {objective:>14}")
+        reference = previous.get((row['family'], row['engine']))
+        if reference is not None:
+            line += f" {row['time_ms'] / reference['time_ms']:>9.2f}x"
+            if reference['status'] != row['status'] or reference['pivots'] != row['pivots']:
+                line += f" (было {reference['status']}, {reference['pivots']} итераций)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Замеры производительности симплекс-метода")
+    parser.add_argument('--suite', choices=['rational', 'lp', 'all'], default='all', help="набор замеров")
+    parser.add_argument('--count', type=int, default=5000, help="количество пар операндов")
+    parser.add_argument('--repeat', type=int, default=5, help="количество повторов замера")
+    parser.add_argument('--digits', type=int, default=6, help="число десятичных знаков в числителе и знаменателе")
+    parser.add_argument('--scale', type=int, default=1, help="множитель размера задач линейного программирования")
+    parser.add_argument('--seed', type=int, default=1, help="зерно генератора задач")
+    parser.add_argument('--engines', nargs='+', default=None, help="движки для сравнения")
+    parser.add_argument('--output', default=None, help="файл JSON для сохранения результатов")
+    parser.add_argument('--baseline', default=None, help="файл JSON с результатами предыдущего запуска для сравнения")
+    args = parser.parse_args()
+
+    if args.suite in ('rational', 'all'):
+        print_rational_report(benchmark_rational(args.count, args.repeat, args.digits))
+    if args.suite in ('lp', 'all'):
+        engines = args.engines or sorted(LinearOptimizer.engines)
+        results = benchmark_lp(engines, args.scale, args.repeat, args.seed)
+        baseline = None
+        if args.baseline:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        if args.suite == 'all':
+            print()
+        print_lp_report(results, baseline)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=1)
+
+
+if __name__ == "__main__":
+    main()
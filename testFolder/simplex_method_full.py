@@ -1,86 +1,222 @@
-from enum import Enum
-from typing import List, Optional
+from enum import Enum, IntEnum
+from typing import Dict, List, Optional, TextIO
+import contextvars
+import hashlib
+import heapq
+import json
+import os
 import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from itertools import combinations
+from math import gcd, lcm
+from fractions import Fraction
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+
+def reduce_native(top: int, bottom: int) -> tuple[int, int]:
+    if bottom < 0:
+        top, bottom = -top, -bottom
+    divisor = gcd(top, bottom)
+    if divisor != 1:
+        top //= divisor
+        bottom //= divisor
+    return top, bottom
+
+
+def reduce_fraction(top: int, bottom: int) -> tuple[int, int]:
+    fraction = Fraction(top, bottom)
+    return fraction.numerator, fraction.denominator
+
+
+def reduce_gmpy2(top: int, bottom: int) -> tuple[int, int]:
+    fraction = gmpy2.mpq(top, bottom)
+    return int(fraction.numerator), int(fraction.denominator)
 
 
 class RationalNumber:
+    __slots__ = ('top', 'bottom')
+
     NULL = None
     UNITY = None
     NEGATIVE_UNITY = None
+    SMALL_LIMIT = 256
+    small_integers: Dict[int, 'RationalNumber'] = {}
+    backends = {
+        'native': reduce_native,
+        'fraction': reduce_fraction,
+        'gmpy2': reduce_gmpy2,
+    }
+    backend = 'native'
+    reduce_pair = staticmethod(reduce_native)
+
+    def __new__(cls, top: str | int | float = 0, bottom: int = 1) -> 'RationalNumber':
+        if type(top) is not int or type(bottom) is not int:
+            top, bottom = cls.parse_fraction(top, bottom)
+        if bottom != 1:
+            if bottom == 0:
+                raise ValueError("Деление на ноль")
+            top, bottom = cls.reduce_pair(top, bottom)
+        return cls.make(top, bottom)
+
+    @classmethod
+    def make(cls, top: int, bottom: int) -> 'RationalNumber':
+        if bottom == 1:
+            cached = cls.small_integers.get(top)
+            if cached is not None:
+                return cached
+        number = object.__new__(cls)
+        number.top = top
+        number.bottom = bottom
+        return number
 
-    def __init__(self, top: str | int | float, bottom: int = 1):
-        self.top, self.bottom = self.parse_fraction(top, bottom)
-        self.reduce()
+    @classmethod
+    def use_backend(cls, name: str) -> None:
+        if name not in cls.backends:
+            raise ValueError(f"Неизвестная арифметика: {name}")
+        if name == 'gmpy2' and gmpy2 is None:
+            raise ValueError("Для арифметики 'gmpy2' требуется gmpy2")
+        cls.backend = name
+        cls.reduce_pair = staticmethod(cls.backends[name])
+
+    @classmethod
+    def available_backends(cls) -> List[str]:
+        return [name for name in cls.backends if name != 'gmpy2' or gmpy2 is not None]
 
-    def parse_fraction(self, top: str | int | float, bottom: int = 1) -> tuple[int, int]:
-        if isinstance(top, str):
-            parts = top.split('/')
-            top_val = int(parts[0])
-            bottom_val = 1 if len(parts) == 1 else int(parts[1])
+    @staticmethod
+    def parse_fraction(top: str | int | float, bottom: int = 1) -> tuple[int, int]:
+        if isinstance(top, (str, float)):
+            value = Fraction(top.replace(' ', '') if isinstance(top, str) else top) / int(bottom)
+            return value.numerator, value.denominator
+        return int(top), int(bottom)
+
+    @classmethod
+    def coerce(cls, value: 'RationalNumber | int') -> 'RationalNumber':
+        return value if type(value) is cls else cls(value)
+
+    def __add__(self, other: 'RationalNumber | int') -> 'RationalNumber':
+        if type(other) is not RationalNumber:
+            other = RationalNumber.coerce(other)
+        a, b = self.bottom, other.bottom
+        if a == b:
+            if a == 1:
+                return RationalNumber.make(self.top + other.top, 1)
+            top, bottom = self.top + other.top, a
         else:
-            top_val = int(top)
-            bottom_val = int(bottom)
-        return top_val, bottom_val
-
-    def normalize_sign(self) -> None:
-        if self.bottom < 0:
-            self.top = -self.top
-            self.bottom = -self.bottom
-
-    def reduce(self) -> None:
-        gcd = self.find_gcd(abs(self.top), abs(self.bottom))
-        self.top //= gcd
-        self.bottom //= gcd
-        self.normalize_sign()
-
-    def find_gcd(self, a: int, b: int) -> int:
-        return a if b == 0 else self.find_gcd(b, a % b)
-
-    def check_division_by_zero(self, other: 'RationalNumber', operation: str) -> None:
-        if operation == 'quotient' and other.top == 0:
+            top, bottom = self.top * b + other.top * a, a * b
+        return RationalNumber.make(*RationalNumber.reduce_pair(top, bottom))
+
+    def __sub__(self, other: 'RationalNumber | int') -> 'RationalNumber':
+        if type(other) is not RationalNumber:
+            other = RationalNumber.coerce(other)
+        a, b = self.bottom, other.bottom
+        if a == b:
+            if a == 1:
+                return RationalNumber.make(self.top - other.top, 1)
+            top, bottom = self.top - other.top, a
+        else:
+            top, bottom = self.top * b - other.top * a, a * b
+        return RationalNumber.make(*RationalNumber.reduce_pair(top, bottom))
+
+    def __mul__(self, other: 'RationalNumber | int') -> 'RationalNumber':
+        if type(other) is not RationalNumber:
+            other = RationalNumber.coerce(other)
+        if self.top == 0 or other.top == 0:
+            return RationalNumber.NULL
+        bottom = self.bottom * other.bottom
+        if bottom == 1:
+            return RationalNumber.make(self.top * other.top, 1)
+        return RationalNumber.make(*RationalNumber.reduce_pair(self.top * other.top, bottom))
+
+    def __truediv__(self, other: 'RationalNumber | int') -> 'RationalNumber':
+        if type(other) is not RationalNumber:
+            other = RationalNumber.coerce(other)
+        if other.top == 0:
             raise ValueError("Деление на ноль")
+        if self.top == 0:
+            return RationalNumber.NULL
+        return RationalNumber.make(*RationalNumber.reduce_pair(self.top * other.bottom, self.bottom * other.top))
 
-    def get_operation_result(self, other: 'RationalNumber', operation: str) -> tuple[int, int]:
-        operations = {
-            'sum': (self.top * other.bottom + other.top * self.bottom, self.bottom * other.bottom),
-            'difference': (self.top * other.bottom - other.top * self.bottom, self.bottom * other.bottom),
-            'product': (self.top * other.top, self.bottom * other.bottom),
-            'quotient': (self.top * other.bottom, self.bottom * other.top)
-        }
-        return operations[operation]
-
-    def compute_fraction(self, other: 'RationalNumber', operation: str) -> 'RationalNumber':
-        self.check_division_by_zero(other, operation)
-        top, bottom = self.get_operation_result(other, operation)
-        return RationalNumber(top, bottom)
+    def __radd__(self, other: int) -> 'RationalNumber':
+        return self + other
 
-    def sum(self, other: 'RationalNumber') -> 'RationalNumber':
-        return self.compute_fraction(other, 'sum')
+    def __rsub__(self, other: int) -> 'RationalNumber':
+        return RationalNumber.coerce(other) - self
 
-    def difference(self, other: 'RationalNumber') -> 'RationalNumber':
-        return self.compute_fraction(other, 'difference')
+    def __rmul__(self, other: int) -> 'RationalNumber':
+        return self * other
 
-    def product(self, other: 'RationalNumber') -> 'RationalNumber':
-        return self.compute_fraction(other, 'product')
+    def __rtruediv__(self, other: int) -> 'RationalNumber':
+        return RationalNumber.coerce(other) / self
 
-    def quotient(self, other: 'RationalNumber') -> 'RationalNumber':
-        return self.compute_fraction(other, 'quotient')
+    def __neg__(self) -> 'RationalNumber':
+        return RationalNumber.make(-self.top, self.bottom)
 
-    def invert(self) -> 'RationalNumber':
-        return RationalNumber(-self.top, self.bottom)
+    def __abs__(self) -> 'RationalNumber':
+        return self if self.top >= 0 else RationalNumber.make(-self.top, self.bottom)
 
-    def absolute(self) -> 'RationalNumber':
-        return RationalNumber(abs(self.top), self.bottom)
+    sum = __add__
+    difference = __sub__
+    product = __mul__
+    quotient = __truediv__
+    invert = __neg__
+    absolute = __abs__
 
     def order(self, other: 'RationalNumber') -> int:
-        diff = self.difference(other)
-        if diff.top == 0:
-            return 0
-        return 1 if diff.top > 0 else -1
+        if self.bottom == other.bottom:
+            left, right = self.top, other.top
+        else:
+            left, right = self.top * other.bottom, other.top * self.bottom
+        return (left > right) - (left < right)
 
     def is_equal(self, other: 'RationalNumber') -> bool:
-        return self.top * other.bottom == other.top * self.bottom
+        return self.top == other.top and self.bottom == other.bottom
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is int:
+            return self.bottom == 1 and self.top == other
+        if type(other) is not RationalNumber:
+            return NotImplemented
+        return self.top == other.top and self.bottom == other.bottom
+
+    def __lt__(self, other: 'RationalNumber | int') -> bool:
+        return self.order(RationalNumber.coerce(other)) < 0
+
+    def __le__(self, other: 'RationalNumber | int') -> bool:
+        return self.order(RationalNumber.coerce(other)) <= 0
+
+    def __gt__(self, other: 'RationalNumber | int') -> bool:
+        return self.order(RationalNumber.coerce(other)) > 0
+
+    def __ge__(self, other: 'RationalNumber | int') -> bool:
+        return self.order(RationalNumber.coerce(other)) >= 0
+
+    def __hash__(self) -> int:
+        return hash(self.top) if self.bottom == 1 else hash((self.top, self.bottom))
+
+    def __bool__(self) -> bool:
+        return self.top != 0
+
+    def __reduce__(self) -> tuple:
+        return RationalNumber, (self.top, self.bottom)
+
+    def __copy__(self) -> 'RationalNumber':
+        return self
+
+    def __deepcopy__(self, memo: dict) -> 'RationalNumber':
+        return self
 
     def format_fraction(self) -> str:
         return str(self.top) if self.bottom == 1 else f"{self.top}/{self.bottom}"
@@ -88,55 +224,175 @@ class RationalNumber:
     def __str__(self) -> str:
         return self.format_fraction()
 
+    def __repr__(self) -> str:
+        return f"RationalNumber({self.format_fraction()!r})"
+
     def to_float(self) -> float:
         return self.top / self.bottom
 
-    @property
-    def top(self) -> int:
-        return self._top
-
-    @top.setter
-    def top(self, value: int) -> None:
-        self._top = value
+    __float__ = to_float
 
-    @property
-    def bottom(self) -> int:
-        return self._bottom
-
-    @bottom.setter
-    def bottom(self, value: int) -> None:
-        self._bottom = value
+    @classmethod
+    def from_float(cls, value: float, max_denominator: int = 10 ** 9) -> 'RationalNumber':
+        fraction = Fraction(value).limit_denominator(max_denominator)
+        return cls(fraction.numerator, fraction.denominator)
 
 
+RationalNumber.small_integers = {
+    value: RationalNumber.make(value, 1)
+    for value in range(-RationalNumber.SMALL_LIMIT, RationalNumber.SMALL_LIMIT + 1)
+}
 RationalNumber.NULL = RationalNumber(0)
 RationalNumber.UNITY = RationalNumber(1)
 RationalNumber.NEGATIVE_UNITY = RationalNumber(-1)
 
 
+class SparseRow:
+    def __init__(self, size: int = 0, entries: Optional[Dict[int, RationalNumber]] = None):
+        self.size = size
+        self.entries: Dict[int, RationalNumber] = entries if entries is not None else {}
+
+    @classmethod
+    def from_dense(cls, values: List[RationalNumber]) -> 'SparseRow':
+        return cls(len(values), {j: value for j, value in enumerate(values) if value.top != 0})
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int | slice) -> RationalNumber | List[RationalNumber]:
+        if isinstance(index, slice):
+            return [self[j] for j in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        return self.entries.get(index, RationalNumber.NULL)
+
+    def __setitem__(self, index: int, value: RationalNumber) -> None:
+        if index < 0:
+            index += self.size
+        elif index >= self.size:
+            self.size = index + 1
+        if value.top == 0:
+            self.entries.pop(index, None)
+        else:
+            self.entries[index] = value
+
+    def __iter__(self):
+        entries = self.entries
+        for j in range(self.size):
+            yield entries.get(j, RationalNumber.NULL)
+
+    def items(self):
+        return self.entries.items()
+
+    def clear(self) -> None:
+        self.size = 0
+        self.entries = {}
+
+    def copy(self) -> 'SparseRow':
+        return SparseRow(self.size, dict(self.entries))
+
+    def append(self, value: RationalNumber) -> None:
+        self[self.size] = value
+
+    def insert(self, index: int) -> None:
+        # Вставка нулевого элемента, элементы правее сдвигаются
+        entries = self.entries
+        for j in sorted((j for j in entries if j >= index), reverse=True):
+            entries[j + 1] = entries.pop(j)
+        self.size += 1
+
+    def resize(self, size: int) -> None:
+        if size < self.size:
+            self.entries = {j: value for j, value in self.entries.items() if j < size}
+        self.size = size
+
+    def negated(self) -> 'SparseRow':
+        return SparseRow(self.size, {j: value.invert() for j, value in self.entries.items()})
+
+    def divide(self, value: RationalNumber) -> None:
+        self.entries = {j: cell.quotient(value) for j, cell in self.entries.items()}
+
+    def subtract_multiple(self, factor: RationalNumber, other: 'SparseRow') -> None:
+        entries = self.entries
+        for j, value in other.entries.items():
+            result = entries.get(j, RationalNumber.NULL).difference(factor.product(value))
+            if result.top == 0:
+                entries.pop(j, None)
+            else:
+                entries[j] = result
+
+    def to_dense(self) -> List[RationalNumber]:
+        return list(self)
+
+
 class RestrictionType(Enum):
     BELOW = 'BELOW'
     ABOVE = 'ABOVE'
     EQUALS = 'EQUALS'
 
 
+class SolveStatus(Enum):
+    OPTIMAL = 'OPTIMAL'
+    INFEASIBLE = 'INFEASIBLE'
+    UNBOUNDED = 'UNBOUNDED'
+    ITERATION_LIMIT = 'ITERATION_LIMIT'
+    TIME_LIMIT = 'TIME_LIMIT'
+    CANCELLED = 'CANCELLED'
+
+
+LIMIT_MESSAGES = {
+    SolveStatus.ITERATION_LIMIT: "Достигнут предел числа итераций",
+    SolveStatus.TIME_LIMIT: "Истекло время, отведённое на решение",
+    SolveStatus.CANCELLED: "Решение прервано",
+}
+
+
+def limit_status(iterations: int, max_iterations: Optional[int], deadline: Optional[float],
+                 cancel_token: Optional['CancelToken']) -> Optional[SolveStatus]:
+    if cancel_token is not None and cancel_token.cancelled:
+        return SolveStatus.CANCELLED
+    if max_iterations is not None and iterations >= max_iterations:
+        return SolveStatus.ITERATION_LIMIT
+    if deadline is not None and time.monotonic() >= deadline:
+        return SolveStatus.TIME_LIMIT
+    return None
+
+
+class CancelToken:
+    def __init__(self):
+        self.event = threading.Event()
+
+    def cancel(self) -> None:
+        self.event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.event.is_set()
+
+
 class Limit:
-    def __init__(self, kind: RestrictionType = RestrictionType.BELOW, factors: List[RationalNumber] = [], right_side: RationalNumber = RationalNumber(0)):
+    def __init__(self, kind: RestrictionType = RestrictionType.BELOW, factors: Optional[List[RationalNumber] | SparseRow] = None, right_side: RationalNumber = RationalNumber(0)):
         self.kind = kind
-        self.factors = factors
+        self.factors = factors if isinstance(factors, SparseRow) else SparseRow.from_dense(factors or [])
         self.right_side = right_side
 
 
 class Goal:
-    def __init__(self, maximize: bool = False, factors: List[RationalNumber] = [], offset: RationalNumber = RationalNumber(0)):
+    def __init__(self, maximize: bool = False, factors: Optional[List[RationalNumber] | SparseRow] = None, offset: RationalNumber = RationalNumber(0)):
         self.maximize = maximize
-        self.factors = factors
+        self.factors = factors if isinstance(factors, SparseRow) else SparseRow.from_dense(factors or [])
         self.offset = offset
 
 
 class LinearProblem:
     def __init__(self, goal: Optional[Goal] = None, restrictions: Optional[List[Limit]] = None):
-        self.goal = goal or Goal(False, [])
+        self.goal = goal or Goal(False)
         self.restrictions = restrictions or []
+        self.names: List[str] = []
+        self.integers: set[int] = set()
+        self.bounds: Dict[int, tuple[Optional[RationalNumber], Optional[RationalNumber]]] = {}
+        # Ограничения на одну переменную, ставшие границами при чтении: номер строки во входных данных -> строка
+        self.bound_rows: Dict[int, Limit] = {}
 
 
 class CanonicalForm:
@@ -144,132 +400,1123 @@ class CanonicalForm:
         self.maximize = False
         self.goal_factors: List[RationalNumber] = []
         self.goal_offset = RationalNumber(0)
-        self.restriction_matrix: List[List[RationalNumber]] = []
+        self.restriction_matrix: List[SparseRow] = []
         self.right_sides: List[RationalNumber] = []
         self.base_indices: List[int] = []
         self.aux_vars = 0
+        self.lower_shifts: Optional[List[RationalNumber]] = None
+        self.upper_bounds: Optional[List[Optional[RationalNumber]]] = None
+        # Свободная переменная x_j = x_j - x_k, где k — добавленный в конец столбец отрицательной части
+        self.free_columns: Dict[int, int] = {}
+
+    def shifted_right_sides(self) -> List[RationalNumber]:
+        # Правые части после замены x = l + x' для движков, которые работают с канонической формой напрямую
+        if self.lower_shifts is None:
+            return list(self.right_sides)
+        right_sides = []
+        for row, right_side in zip(self.restriction_matrix, self.right_sides):
+            for j, factor in row.items():
+                if self.lower_shifts[j].top != 0:
+                    right_side = right_side.difference(factor.product(self.lower_shifts[j]))
+            right_sides.append(right_side)
+        return right_sides
+
+    def shifted_goal_offset(self) -> RationalNumber:
+        offset = self.goal_offset
+        if self.lower_shifts is not None:
+            for factor, shift in zip(self.goal_factors, self.lower_shifts):
+                offset = offset.sum(factor.product(shift))
+        return offset
+
+
+class TraceLevel(IntEnum):
+    SILENT = 0
+    SUMMARY = 1
+    ITERATION = 2
+    ROW_OP = 3
+
+
+class TraceEvent:
+    def __init__(self, level: TraceLevel, kind: str, payload: dict):
+        self.level = level
+        self.kind = kind
+        self.payload = payload
+        self.timestamp = time.time()
+
+    def text(self) -> str:
+        payload = self.payload
+        title = payload.get('title')
+        if self.kind == 'matrix':
+            body = MatrixSolver.format_matrix(payload['matrix'])
+        elif self.kind == 'table':
+            body = TableFormatter.format_table(payload['table'])
+        elif self.kind == 'canonical_form':
+            body = TableFormatter.format_canonical_form(payload['canonical_form'])
+        else:
+            body = payload.get('text', '')
+        return body if title is None else f"{title}\n{body}"
+
+    def to_dict(self) -> dict:
+        record = {'time': self.timestamp, 'level': self.level.name, 'event': self.kind}
+        for key, value in self.payload.items():
+            record[key] = self.serialize(value)
+        return record
+
+    @classmethod
+    def serialize(cls, value: object) -> object:
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            return value
+        if isinstance(value, RationalNumber):
+            return str(value)
+        if isinstance(value, Enum):
+            return value.name
+        if isinstance(value, CanonicalForm):
+            return {
+                'maximize': value.maximize,
+                'goal': cls.serialize(value.goal_factors),
+                'offset': str(value.goal_offset),
+                'rows': cls.serialize(value.restriction_matrix),
+                'right_sides': cls.serialize(value.right_sides),
+            }
+        if hasattr(value, 'matrix') and hasattr(value, 'base_indices'):
+            return {'basis': list(value.base_indices), 'matrix': cls.serialize(value.matrix)}
+        if isinstance(value, dict):
+            return {str(key): cls.serialize(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple, SparseRow)):
+            return [cls.serialize(item) for item in value]
+        return str(value)
+
+
+class TraceSink:
+    def write(self, event: TraceEvent) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class ConsoleSink(TraceSink):
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+
+    def write(self, event: TraceEvent) -> None:
+        print(event.text(), file=self.stream or sys.stdout)
+
+
+class TextFileSink(TraceSink):
+    def __init__(self, path: str):
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def write(self, event: TraceEvent) -> None:
+        self.file.write(event.text() + "\n")
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class JsonLinesSink(TraceSink):
+    def __init__(self, path: str):
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def write(self, event: TraceEvent) -> None:
+        self.file.write(json.dumps(event.to_dict(), ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class Tracer:
+    def __init__(self, level: TraceLevel = TraceLevel.SILENT, sinks: Optional[List[TraceSink]] = None):
+        self.level = level
+        self.sinks = sinks if sinks is not None else [ConsoleSink()]
+
+    @classmethod
+    def console(cls, level: TraceLevel = TraceLevel.ROW_OP) -> 'Tracer':
+        return cls(level, [ConsoleSink()])
+
+    def enabled(self, level: TraceLevel) -> bool:
+        return self.level >= level
+
+    def emit(self, level: TraceLevel, kind: str, **payload) -> None:
+        if self.level < level:
+            return
+        event = TraceEvent(level, kind, payload)
+        for sink in self.sinks:
+            sink.write(event)
+
+    def message(self, level: TraceLevel, text: str) -> None:
+        if self.level >= level:
+            self.emit(level, 'message', text=text)
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+    def __enter__(self) -> 'Tracer':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+SILENT_TRACER = Tracer(TraceLevel.SILENT, [])
 
 
 class LinearTable:
-    def populate_matrix(self, z_row: List[RationalNumber], gauss_matrix: List[List[RationalNumber]]) -> None:
+    def populate_matrix(self, z_row: SparseRow, gauss_matrix: List[SparseRow]) -> None:
         self.matrix.append(z_row)
         for row in gauss_matrix:
-            self.matrix.append(row[:])
-
-    def __init__(self, canonical_form: CanonicalForm):
-        self.maximize = canonical_form.maximize
-        self.aux_vars = canonical_form.aux_vars
-        self.matrix = []
-        self.base_indices = []
-
-        gauss_matrix = self.initialize_matrix(canonical_form)
+            self.matrix.append(row.copy())
+
+    def __init__(self, canonical_form: CanonicalForm, basis_method: str = 'auto', base_indices: Optional[List[int]] = None,
+                 tracer: Tracer = SILENT_TRACER):
+        self.load_source(canonical_form)
+        gauss_matrix = self.initialize_matrix()
+        z_row = self.build_z_row()
+        reduced = False
         try:
-            self.base_indices = MatrixSolver.find_optimal_base(gauss_matrix)
+            if base_indices is not None:
+                self.base_indices = list(base_indices)
+            elif not gauss_matrix:
+                # Все ограничения стали границами переменных, базис пуст
+                reduced = True
+            elif basis_method == 'search':
+                self.base_indices = MatrixSolver.find_optimal_base(gauss_matrix, tracer)
+            elif basis_method == 'phase1':
+                self.base_indices, gauss_matrix = MatrixSolver.find_feasible_base(gauss_matrix, tracer=tracer)
+                reduced = True
+            elif basis_method == 'big_m':
+                self.base_indices, gauss_matrix = MatrixSolver.find_feasible_base(gauss_matrix, z_row, tracer)
+                reduced = True
+            elif basis_method in ('auto', 'dual'):
+                dual_start = MatrixSolver.find_dual_base(gauss_matrix, z_row)
+                if dual_start is None and basis_method == 'dual':
+                    raise ValueError("Базис из дополнительных переменных не является двойственно допустимым")
+                if dual_start is not None and (basis_method == 'dual' or any(row[-1].top < 0 for row in dual_start[1])):
+                    tracer.message(TraceLevel.SUMMARY, "\nНачальный базис двойственно допустим, используется двойственный симплекс-метод")
+                    self.base_indices, gauss_matrix = dual_start
+                else:
+                    self.base_indices, gauss_matrix = MatrixSolver.find_feasible_base(gauss_matrix, tracer=tracer)
+                reduced = True
+            else:
+                raise ValueError(f"Неизвестный метод выбора базиса: {basis_method}")
         except ValueError as e:
             raise ValueError(f"Нет допустимого решения: {str(e)}")
 
-        z_row = self.build_z_row(canonical_form)
         self.populate_matrix(z_row, gauss_matrix)
         self.extend_matrix_rows(self.matrix)
-        self.apply_base_transformations()
+        if reduced:
+            self.price_out_basis()
+        else:
+            self.apply_base_transformations()
+        if self.upper_bounds is not None and all(row[-1].top >= 0 for row in self.matrix[1:]):
+            self.repair_bounds(tracer)
+
+    def load_source(self, canonical_form: CanonicalForm) -> None:
+        self.maximize = canonical_form.maximize
+        self.aux_vars = canonical_form.aux_vars
+        self.matrix = []
+        self.base_indices = []
+        self.source_rows: Optional[List[SparseRow]] = [row.copy() for row in canonical_form.restriction_matrix]
+        self.right_sides: Optional[List[RationalNumber]] = list(canonical_form.right_sides)
+        self.goal_factors: Optional[List[RationalNumber]] = list(canonical_form.goal_factors)
+        self.goal_offset = canonical_form.goal_offset
+        self.complemented: set[int] = set()
+        self.free_columns = dict(canonical_form.free_columns)
+        self.lower_shifts: Optional[List[RationalNumber]] = None
+        self.upper_bounds: Optional[List[Optional[RationalNumber]]] = None
+        if canonical_form.lower_shifts is not None:
+            self.lower_shifts = list(canonical_form.lower_shifts)
+            # Без верхних границ (границы заданы строками) остаётся только сдвиг нижних границ
+            uppers = canonical_form.upper_bounds or [None] * len(self.lower_shifts)
+            self.upper_bounds = [None if upper is None else upper.difference(shift) for upper, shift in zip(uppers, self.lower_shifts)]
+            if any(upper is not None and upper.top < 0 for upper in self.upper_bounds):
+                raise ValueError("Нет допустимого решения: нижняя граница переменной больше верхней")
+
+    @classmethod
+    def from_source(cls, canonical_form: CanonicalForm) -> 'LinearTable':
+        # Таблица с исходной задачей, но без матрицы: базис и матрицу записывает движок, решивший задачу вне точной арифметики
+        table = cls.__new__(cls)
+        table.load_source(canonical_form)
+        return table
 
-    def initialize_matrix(self, canonical_form: CanonicalForm) -> List[List[RationalNumber]]:
-        gauss_matrix = [row[:] for row in canonical_form.restriction_matrix]
-        for i in range(len(gauss_matrix)):
-            gauss_matrix[i].append(canonical_form.right_sides[i])
+    @classmethod
+    def assemble(cls, matrix: List[SparseRow], base_indices: List[int], maximize: bool = True, aux_vars: int = 0) -> 'LinearTable':
+        table = cls.__new__(cls)
+        table.maximize = maximize
+        table.aux_vars = aux_vars
+        table.matrix = matrix
+        table.base_indices = base_indices
+        table.source_rows = None
+        table.right_sides = None
+        table.goal_factors = None
+        table.goal_offset = RationalNumber.NULL
+        table.complemented = set()
+        table.free_columns = {}
+        table.lower_shifts = None
+        table.upper_bounds = None
+        return table
+
+    def initialize_matrix(self) -> List[SparseRow]:
+        width = len(self.goal_factors)
+        gauss_matrix = []
+        for row, right_side in zip(self.source_rows, self.right_sides):
+            row = row.copy()
+            row.resize(width)
+            # Переменные с нижней границей заменяются на x = l + x', правая часть сдвигается
+            if self.lower_shifts is not None:
+                for j, factor in row.items():
+                    if self.lower_shifts[j].top != 0:
+                        right_side = right_side.difference(factor.product(self.lower_shifts[j]))
+            row.append(right_side)
+            gauss_matrix.append(row)
         return gauss_matrix
 
-    def build_z_row(self, canonical_form: CanonicalForm) -> List[RationalNumber]:
-        z_row = [factor.invert() for factor in canonical_form.goal_factors]
-        z_row.append(canonical_form.goal_offset)
+    def build_z_row(self) -> SparseRow:
+        if self.upper_bounds is not None:
+            return self.build_objective_row()
+        z_row = SparseRow.from_dense(self.goal_factors).negated()
+        z_row.append(self.goal_offset)
+        return z_row
+
+    def column_sign(self, column: int) -> RationalNumber:
+        return RationalNumber.NEGATIVE_UNITY if column in self.complemented else RationalNumber.UNITY
+
+    def build_objective_row(self) -> SparseRow:
+        width = len(self.goal_factors)
+        z_row = SparseRow(width)
+        constant = self.goal_offset
+        for j, factor in enumerate(self.goal_factors):
+            if factor.top == 0:
+                continue
+            z_row[j] = factor.product(self.column_sign(j)).invert()
+            constant = constant.sum(factor.product(self.lower_shifts[j]))
+            if j in self.complemented:
+                constant = constant.sum(factor.product(self.upper_bounds[j]))
+        z_row.append(constant)
         return z_row
 
-    def extend_matrix_rows(self, matrix: List[List[RationalNumber]]) -> None:
-        width = len(matrix[0])
+    def complement(self, column: int) -> None:
+        # Замена x = u - x' для переменной на верхней границе; для базисной меняется только её строка
+        bound = self.upper_bounds[column]
+        if column in self.base_indices:
+            row_index = self.base_indices.index(column) + 1
+            row = self.matrix[row_index].negated()
+            row[column] = RationalNumber.UNITY
+            row[-1] = bound.sum(row[-1])
+            self.matrix[row_index] = row
+        else:
+            for row in self.matrix:
+                factor = row[column]
+                if factor.top != 0:
+                    row[-1] = row[-1].difference(factor.product(bound))
+                    row[column] = factor.invert()
+        self.complemented ^= {column}
+
+    def repair_bounds(self, tracer: Tracer = SILENT_TRACER) -> None:
+        violated = [
+            i for i, base_col in enumerate(self.base_indices, 1)
+            if self.upper_bounds[base_col] is not None and self.matrix[i][-1].order(self.upper_bounds[base_col]) > 0
+        ]
+        if not violated:
+            return
+        tracer.message(TraceLevel.SUMMARY, f"\nБазисных переменных выше верхней границы: {len(violated)}, решается вспомогательная задача")
+
+        # Переменная, нарушившая границу, переводится на верхнюю границу, а строка получает искусственную переменную
+        width = len(self.matrix[0]) - 1
+        self.matrix[0] = SparseRow(width + 1)
+        for i in violated:
+            self.complement(self.base_indices[i - 1])
+            self.matrix[i] = self.matrix[i].negated()
+            column = self.insert_column()
+            self.matrix[i][column] = RationalNumber.UNITY
+            self.matrix[0][column] = RationalNumber.UNITY
+            self.base_indices[i - 1] = column
+        self.price_out_basis()
+        LinearOptimizer(mode='primal').run(self)
+        if self.matrix[0][-1].top < 0:
+            raise ValueError("Нет допустимого решения: ограничения несовместны с границами переменных")
+
+        redundant = []
+        for i, base_col in enumerate(self.base_indices, 1):
+            if base_col < width:
+                continue
+            column = next((j for j, value in sorted(self.matrix[i].items()) if j < width and value.top != 0), -1)
+            if column == -1:
+                redundant.append(i)
+            else:
+                self.transform(i, column)
+                self.base_indices[i - 1] = column
+        self.matrix = [row for i, row in enumerate(self.matrix) if i not in redundant]
+        self.base_indices = [base_col for i, base_col in enumerate(self.base_indices, 1) if i not in redundant]
+        for row in self.matrix:
+            right_side = row[-1]
+            row.resize(width)
+            row.append(right_side)
+        del self.upper_bounds[width:], self.lower_shifts[width:]
+
+        self.matrix[0] = self.build_objective_row()
+        self.price_out_basis()
+
+    def extend_matrix_rows(self, matrix: List[SparseRow]) -> None:
+        width = max(len(row) for row in matrix)
         for row in matrix:
-            while len(row) < width:
-                row.append(RationalNumber.NULL)
+            row.resize(width)
 
     def apply_base_transformations(self) -> None:
+        pending = list(range(len(self.base_indices)))
+        ordered_base = self.base_indices[:]
+        for i, base_col in enumerate(self.base_indices):
+            if base_col >= len(self.matrix[0]) - 1:
+                pending.remove(i)
+                continue
+            candidates = ([i] if i in pending else []) + pending
+            row = next((k for k in candidates if not self.matrix[k + 1][base_col].is_equal(RationalNumber.NULL)), -1)
+            if row == -1 or not self.transform(row + 1, base_col):
+                raise ValueError("Не удалось создать таблицу: нет допустимых базисов")
+            pending.remove(row)
+            ordered_base[row] = base_col
+        self.base_indices = ordered_base
+
+    def price_out_basis(self) -> None:
+        z_row = self.matrix[0]
         for i, base_col in enumerate(self.base_indices):
-            if base_col < len(self.matrix[0]) - 1:
-                if not self.transform(i + 1, base_col):
-                    raise ValueError("Не удалось создать таблицу: нет допустимых базисов")
+            factor = z_row[base_col]
+            if factor.top != 0:
+                z_row.subtract_multiple(factor, self.matrix[i + 1])
 
     def normalize_pivot_row(self, pivot_row: int, pivot_col: int) -> bool:
         pivot_element = self.matrix[pivot_row][pivot_col]
         if pivot_element.is_equal(RationalNumber.NULL):
             return False
-        for j in range(len(self.matrix[pivot_row])):
-            self.matrix[pivot_row][j] = self.matrix[pivot_row][j].quotient(pivot_element)
+        if not pivot_element.is_equal(RationalNumber.UNITY):
+            self.matrix[pivot_row].divide(pivot_element)
         return True
 
     def update_other_rows(self, pivot_row: int, pivot_col: int) -> None:
-        for i in range(len(self.matrix)):
-            if i != pivot_row:
-                factor = self.matrix[i][pivot_col]
-                for j in range(len(self.matrix[i])):
-                    self.matrix[i][j] = self.matrix[i][j].difference(
-                        factor.product(self.matrix[pivot_row][j])
-                    )
+        pivot_values = self.matrix[pivot_row]
+        for i, row in enumerate(self.matrix):
+            if i == pivot_row:
+                continue
+            factor = row[pivot_col]
+            if factor.top != 0:
+                row.subtract_multiple(factor, pivot_values)
 
     def transform(self, pivot_row: int, pivot_col: int) -> bool:
+        if not self.normalize_pivot_row(pivot_row, pivot_col):
+            return False
+        self.update_other_rows(pivot_row, pivot_col)
+        return True
+
+    def solve_basis(self, vector: List[RationalNumber]) -> List[RationalNumber]:
+        size = len(self.base_indices)
+        signs = [self.column_sign(j) for j in self.base_indices]
+        system = [[row[j].product(sign) for j, sign in zip(self.base_indices, signs)] + [value] for row, value in zip(self.source_rows, vector)]
+        for k in range(size):
+            pivot_row = next((i for i in range(k, len(system)) if system[i][k].top != 0), -1)
+            if pivot_row == -1:
+                raise ValueError("Базисная матрица вырождена")
+            system[k], system[pivot_row] = system[pivot_row], system[k]
+            pivot = system[k][k]
+            system[k] = [value.quotient(pivot) for value in system[k]]
+            for i in range(len(system)):
+                factor = system[i][k]
+                if i != k and factor.top != 0:
+                    system[i] = [value.difference(factor.product(pivot_value)) for value, pivot_value in zip(system[i], system[k])]
+        # Строки сверх базиса соответствуют удалённым линейно зависимым ограничениям
+        if any(system[i][-1].top != 0 for i in range(size, len(system))):
+            raise ValueError("Система ограничений несовместна")
+        return [system[k][-1] for k in range(size)]
+
+    def copy(self) -> 'LinearTable':
+        table = LinearTable.assemble([row.copy() for row in self.matrix], list(self.base_indices), self.maximize, self.aux_vars)
+        table.goal_offset = self.goal_offset
+        table.complemented = set(self.complemented)
+        table.free_columns = dict(self.free_columns)
+        if self.upper_bounds is not None:
+            table.upper_bounds = list(self.upper_bounds)
+            table.lower_shifts = list(self.lower_shifts)
+        if self.source_rows is not None:
+            table.source_rows = [row.copy() for row in self.source_rows]
+            table.right_sides = list(self.right_sides)
+            table.goal_factors = list(self.goal_factors)
+        return table
+
+    def insert_column(self, position: Optional[int] = None) -> int:
+        column = len(self.matrix[0]) - 1 if position is None else position
+        for row in self.matrix:
+            row.insert(column)
+        self.base_indices[:] = [j + 1 if j >= column else j for j in self.base_indices]
+        self.complemented = {j + 1 if j >= column else j for j in self.complemented}
+        self.free_columns = {j + 1 if j >= column else j: k + 1 if k >= column else k for j, k in self.free_columns.items()}
+        if self.upper_bounds is not None:
+            self.upper_bounds.insert(column, None)
+            self.lower_shifts.insert(column, RationalNumber.NULL)
+        return column
+
+    def append_restriction(self, factors: SparseRow, right_side: RationalNumber) -> None:
+        # Ограничение factors * x + s = right_side выражается через текущий базис,
+        # новая дополнительная переменная s становится базисной, двойственная допустимость сохраняется
+        column = self.insert_column()
+        if self.free_columns:
+            # Коэффициенты заданы для исходных переменных, отрицательная часть свободной переменной входит с обратным знаком
+            factors = factors.copy()
+            for j, negative in self.free_columns.items():
+                if factors[j].top != 0:
+                    factors[negative] = factors[j].invert()
+        row = SparseRow(column + 2, {column: RationalNumber.UNITY})
+        # В таблице столбец может соответствовать сдвинутой или дополненной до верхней границы переменной
+        value = right_side
+        for j, factor in factors.items():
+            if self.upper_bounds is not None:
+                value = value.difference(factor.product(self.lower_shifts[j]))
+                if j in self.complemented:
+                    value = value.difference(factor.product(self.upper_bounds[j]))
+            row[j] = factor.product(self.column_sign(j))
+        row[column + 1] = value
+        for i, base_col in enumerate(self.base_indices, 1):
+            factor = row[base_col]
+            if factor.top != 0:
+                row.subtract_multiple(factor, self.matrix[i])
+        self.matrix.append(row)
+        self.base_indices.append(column)
+        self.aux_vars += 1
+
+        if self.source_rows is not None:
+            for source_row in self.source_rows:
+                source_row.resize(column + 1)
+            source_row = factors.copy()
+            source_row.resize(column + 1)
+            source_row[column] = RationalNumber.UNITY
+            self.source_rows.append(source_row)
+            self.right_sides.append(right_side)
+            self.goal_factors.append(RationalNumber.NULL)
+
+    def add_bound_row(self, index: int, bound: RationalNumber, upper: bool) -> None:
+        sign = RationalNumber.UNITY if upper else RationalNumber.NEGATIVE_UNITY
+        self.append_restriction(SparseRow(index + 1, {index: sign}), bound.product(sign))
+
+    def add_constraint(self, limit: Limit, optimizer: Optional['LinearOptimizer'] = None) -> SolveStatus:
+        width = len(self.matrix[0]) - 1
+        if any(j >= width for j, factor in limit.factors.items() if factor.top != 0):
+            raise ValueError("Ограничение содержит переменную, которой нет в таблице")
+        factors = SparseRow(width, {j: factor for j, factor in limit.factors.items() if factor.top != 0})
+        # Равенство добавляется парой неравенств, каждое со своей дополнительной переменной
+        if limit.kind in (RestrictionType.BELOW, RestrictionType.EQUALS):
+            self.append_restriction(factors, limit.right_side)
+        if limit.kind in (RestrictionType.ABOVE, RestrictionType.EQUALS):
+            self.append_restriction(factors.negated(), limit.right_side.invert())
+        return self.reoptimize(optimizer)
+
+    def add_variable(self, cost: RationalNumber, column: List[RationalNumber] | SparseRow,
+                     optimizer: Optional['LinearOptimizer'] = None) -> SolveStatus:
+        # Новый столбец B^-1 * a ставится перед дополнительными переменными, стоимость задаётся в канонической форме (max)
+        self.check_source()
+        column = column if isinstance(column, SparseRow) else SparseRow.from_dense(column)
+        if any(i >= len(self.source_rows) for i, value in column.items() if value.top != 0):
+            raise ValueError("Столбец новой переменной длиннее числа ограничений")
+        vector = [column[i] for i in range(len(self.source_rows))]
         try:
-            if not self.normalize_pivot_row(pivot_row, pivot_col):
-                return False
-            self.update_other_rows(pivot_row, pivot_col)
-            return True
-        except ValueError as e:
-            print(f"Ошибка: {str(e)}")
+            values = self.solve_basis(vector)
+        except ValueError:
+            raise ValueError("Столбец новой переменной не выражается через текущий базис")
+        reduced_cost = cost.invert()
+        for base_col, value in zip(self.base_indices, values):
+            reduced_cost = reduced_cost.sum(self.goal_factors[base_col].product(self.column_sign(base_col)).product(value))
+
+        position = len(self.matrix[0]) - 1 - self.aux_vars
+        self.insert_column(position)
+        self.matrix[0][position] = reduced_cost
+        for i, value in enumerate(values, 1):
+            self.matrix[i][position] = value
+        for source_row, value in zip(self.source_rows, vector):
+            source_row.insert(position)
+            source_row[position] = value
+        self.goal_factors.insert(position, cost)
+        return self.reoptimize(optimizer)
+
+    def check_source(self) -> None:
+        if self.source_rows is None:
+            raise ValueError("Таблица не хранит исходную задачу, перезапуск невозможен")
+
+    def update_rhs(self, index: int, value: RationalNumber, optimizer: Optional['LinearOptimizer'] = None) -> SolveStatus:
+        self.check_source()
+        delta = value.difference(self.right_sides[index])
+        if delta.top != 0:
+            column = [RationalNumber.NULL] * len(self.right_sides)
+            column[index] = delta
+            try:
+                shifts = self.solve_basis(column)
+            except ValueError:
+                return SolveStatus.INFEASIBLE
+            self.right_sides[index] = value
+            z_shift = RationalNumber.NULL
+            for k, shift in enumerate(shifts):
+                row = self.matrix[k + 1]
+                row[-1] = row[-1].sum(shift)
+                base_col = self.base_indices[k]
+                z_shift = z_shift.sum(self.goal_factors[base_col].product(self.column_sign(base_col)).product(shift))
+            self.matrix[0][-1] = self.matrix[0][-1].sum(z_shift)
+        return self.reoptimize(optimizer)
+
+    def update_objective(self, index: int, value: RationalNumber, optimizer: Optional['LinearOptimizer'] = None) -> SolveStatus:
+        self.check_source()
+        delta = value.difference(self.goal_factors[index])
+        self.shift_objective(index, delta)
+        if index in self.free_columns:
+            self.shift_objective(self.free_columns[index], delta.invert())
+        return self.reoptimize(optimizer)
+
+    def shift_objective(self, index: int, delta: RationalNumber) -> None:
+        self.goal_factors[index] = self.goal_factors[index].sum(delta)
+        if delta.top != 0:
+            z_row = self.matrix[0]
+            if self.upper_bounds is not None:
+                constant = self.lower_shifts[index]
+                if index in self.complemented:
+                    constant = constant.sum(self.upper_bounds[index])
+                z_row[-1] = z_row[-1].sum(delta.product(constant))
+                delta = delta.product(self.column_sign(index))
+            if index in self.base_indices:
+                z_row.subtract_multiple(delta.invert(), self.matrix[self.base_indices.index(index) + 1])
+            z_row[index] = z_row[index].difference(delta)
+
+    def reoptimize(self, optimizer: Optional['LinearOptimizer'] = None) -> SolveStatus:
+        optimizer = optimizer or LinearOptimizer()
+        work_table = optimizer.prepare_table(self)
+        if not optimizer.is_primal_feasible(work_table) and not optimizer.is_optimized(work_table):
+            raise ValueError("Двойственный симплекс-метод требует двойственно допустимой таблицы")
+        status = optimizer.solve_table(work_table)
+        optimizer.finish_table(self, work_table)
+        return status
+
+    def __str__(self) -> str:
+        return "\n".join("\t".join(cell.__str__() for cell in row) for row in self.matrix)
+
+
+class IntegerTable:
+    upper_bounds = None
+    free_columns: Dict[int, int] = {}
+
+    def __init__(self, table: LinearTable):
+        self.maximize = table.maximize
+        self.aux_vars = table.aux_vars
+        self.base_indices = table.base_indices
+        self.rows: List[List[int]] = []
+        self.denominators: List[int] = []
+        self._matrix: Optional[List[SparseRow]] = None
+        self.gcd_calls = 0
+        for row in table.matrix:
+            denominator = lcm(*(cell.bottom for cell in row))
+            self.rows.append([cell.top * (denominator // cell.bottom) for cell in row])
+            self.denominators.append(denominator)
+
+    @property
+    def matrix(self) -> List[SparseRow]:
+        if self._matrix is None:
+            self._matrix = [
+                SparseRow(len(row), {j: RationalNumber(value, denominator) for j, value in enumerate(row) if value != 0})
+                for row, denominator in zip(self.rows, self.denominators)
+            ]
+        return self._matrix
+
+    def reduce_row(self, index: int) -> None:
+        row = self.rows[index]
+        self.gcd_calls += 1
+        divisor = gcd(self.denominators[index], *row)
+        if divisor > 1:
+            self.rows[index] = [value // divisor for value in row]
+            self.denominators[index] //= divisor
+
+    def transform(self, pivot_row: int, pivot_col: int) -> bool:
+        pivot_element = self.rows[pivot_row][pivot_col]
+        if pivot_element == 0:
             return False
+        if pivot_element < 0:
+            self.rows[pivot_row] = [-value for value in self.rows[pivot_row]]
+            pivot_element = -pivot_element
+        self.denominators[pivot_row] = pivot_element
+        self.reduce_row(pivot_row)
+
+        pivot_values = self.rows[pivot_row]
+        pivot_element = self.denominators[pivot_row]
+        for i, row in enumerate(self.rows):
+            if i == pivot_row:
+                continue
+            factor = row[pivot_col]
+            if factor == 0:
+                continue
+            self.rows[i] = [value * pivot_element - factor * pivot_value for value, pivot_value in zip(row, pivot_values)]
+            self.denominators[i] *= pivot_element
+            self.reduce_row(i)
+        self._matrix = None
+        return True
+
+    def write_back(self, table: LinearTable) -> None:
+        table.matrix = [row.copy() for row in self.matrix]
 
     def __str__(self) -> str:
         return "\n".join("\t".join(cell.__str__() for cell in row) for row in self.matrix)
 
 
+class FloatTable:
+    upper_bounds = None
+    free_columns: Dict[int, int] = {}
+
+    def __init__(self, values: 'np.ndarray', base_indices: List[int], maximize: bool = True, aux_vars: int = 0):
+        self.values = np.ascontiguousarray(values, dtype=np.float64)
+        self.base_indices = base_indices
+        self.maximize = maximize
+        self.aux_vars = aux_vars
+        # Номера исходных строк ограничений, если первая фаза удалила линейно зависимые строки
+        self.row_indices: Optional[List[int]] = None
+        self._matrix: Optional[List[SparseRow]] = None
+
+    @classmethod
+    def from_table(cls, table: LinearTable) -> 'FloatTable':
+        values = np.array([[cell.to_float() for cell in row] for row in table.matrix], dtype=np.float64)
+        return cls(values, table.base_indices, table.maximize, table.aux_vars)
+
+    @classmethod
+    def from_canonical(cls, canonical_form: CanonicalForm, optimizer: 'FloatOptimizer') -> Optional['FloatTable']:
+        rows, cols = len(canonical_form.restriction_matrix), len(canonical_form.goal_factors)
+        a = np.zeros((rows, cols))
+        for i, row in enumerate(canonical_form.restriction_matrix):
+            for j, cell in row.items():
+                a[i, j] = cell.to_float()
+        b = np.array([cell.to_float() for cell in canonical_form.shifted_right_sides()], dtype=np.float64)
+        negative = b < 0
+        a[negative] *= -1
+        b[negative] *= -1
+
+        nonzero = np.abs(a) > optimizer.pivot_tol
+        base = [-1] * rows
+        for j in np.flatnonzero(nonzero.sum(axis=0) == 1):
+            i = int(np.argmax(nonzero[:, j]))
+            if base[i] == -1 and a[i, j] > 0:
+                b[i] /= a[i, j]
+                a[i] /= a[i, j]
+                base[i] = int(j)
+        artificial_rows = [i for i in range(rows) if base[i] == -1]
+
+        values = np.zeros((rows + 1, cols + len(artificial_rows) + 1))
+        values[1:, :cols] = a
+        values[1:, -1] = b
+        for k, i in enumerate(artificial_rows):
+            values[i + 1, cols + k] = 1.0
+            base[i] = cols + k
+        table = cls(values, base, canonical_form.maximize, canonical_form.aux_vars)
+
+        if artificial_rows:
+            values[0, cols:-1] = 1.0
+            values[0] -= values[1 + np.array(artificial_rows)].sum(axis=0)
+            optimizer.run(table)
+            # При остановке по пределу первая фаза не завершена, причина остаётся в optimizer.stop_status
+            if optimizer.stop_status is not None:
+                return None
+            values = table.values
+            if values[0, -1] < -optimizer.feasibility_tol:
+                raise ValueError("Система ограничений несовместна")
+            redundant_rows = []
+            for i, base_col in enumerate(table.base_indices):
+                if base_col < cols:
+                    continue
+                candidates = np.flatnonzero(np.abs(values[i + 1, :cols]) > optimizer.pivot_tol)
+                if candidates.size == 0:
+                    redundant_rows.append(i + 1)
+                else:
+                    optimizer.transform(table, i + 1, int(candidates[0]))
+            keep = [i for i in range(rows + 1) if i not in redundant_rows]
+            base = [table.base_indices[i - 1] for i in keep[1:]]
+            values = np.hstack([table.values[keep, :cols], table.values[keep, -1:]])
+            table = cls(values, base, canonical_form.maximize, canonical_form.aux_vars)
+            if redundant_rows:
+                table.row_indices = [i - 1 for i in keep[1:]]
+
+        table.values[0, :cols] = [-cell.to_float() for cell in canonical_form.goal_factors]
+        table.values[0, -1] = canonical_form.shifted_goal_offset().to_float()
+        basic_costs = table.values[0, table.base_indices].copy()
+        table.values[0] -= basic_costs @ table.values[1:]
+        return table
+
+    @property
+    def matrix(self) -> List[SparseRow]:
+        if self._matrix is None:
+            self._matrix = [
+                SparseRow(len(row), {j: RationalNumber.from_float(value) for j, value in enumerate(row) if value != 0.0})
+                for row in self.values.tolist()
+            ]
+        return self._matrix
+
+    def transform(self, pivot_row: int, pivot_col: int) -> None:
+        values = self.values
+        values[pivot_row] /= values[pivot_row, pivot_col]
+        column = values[:, pivot_col].copy()
+        column[pivot_row] = 0.0
+        values -= np.outer(column, values[pivot_row])
+        values[:, pivot_col] = 0.0
+        values[pivot_row, pivot_col] = 1.0
+        self._matrix = None
+
+    def to_table(self) -> LinearTable:
+        return LinearTable.assemble([row.copy() for row in self.matrix], list(self.base_indices), self.maximize, self.aux_vars)
+
+    def __str__(self) -> str:
+        return "\n".join("\t".join(f"{value:g}" for value in row) for row in self.values.tolist())
+
+
+class PricingRule:
+    name = 'dantzig'
+    rules = {}
+    lowest_index = False
+
+    @classmethod
+    def create(cls, rule: 'str | PricingRule') -> 'PricingRule':
+        if isinstance(rule, PricingRule):
+            return rule
+        if rule not in cls.rules:
+            raise ValueError(f"Неизвестное правило выбора столбца: {rule}")
+        return cls.rules[rule]()
+
+    def reset(self, optimizer: 'LinearOptimizer', table: LinearTable) -> None:
+        pass
+
+    def choose(self, optimizer: 'LinearOptimizer', table: LinearTable) -> int:
+        return optimizer.most_negative_column(table)
+
+    def update(self, optimizer: 'LinearOptimizer', table: LinearTable, pivot_row: int, pivot_col: int) -> None:
+        pass
+
+
+class BlandRule(PricingRule):
+    name = 'bland'
+    lowest_index = True
+
+    def choose(self, optimizer: 'LinearOptimizer', table: LinearTable) -> int:
+        return optimizer.first_negative_column(table)
+
+
+class SteepestEdgeRule(PricingRule):
+    name = 'steepest_edge'
+
+    def choose(self, optimizer: 'LinearOptimizer', table: LinearTable) -> int:
+        candidates = optimizer.negative_columns(table)
+        costs = optimizer.float_costs(table, candidates)
+        norms = optimizer.column_norms(table, candidates)
+        incoming_col = -1
+        best_score = 0.0
+        for j, cost, norm in zip(candidates, costs, norms):
+            score = cost * cost / norm
+            if incoming_col == -1 or score > best_score:
+                best_score = score
+                incoming_col = int(j)
+        return incoming_col
+
+
+class DevexRule(PricingRule):
+    name = 'devex'
+
+    def __init__(self):
+        self.weights: Dict[int, float] = {}
+
+    def reset(self, optimizer: 'LinearOptimizer', table: LinearTable) -> None:
+        self.weights = {}
+
+    def choose(self, optimizer: 'LinearOptimizer', table: LinearTable) -> int:
+        candidates = optimizer.negative_columns(table)
+        costs = optimizer.float_costs(table, candidates)
+        incoming_col = -1
+        best_score = 0.0
+        for j, cost in zip(candidates, costs):
+            score = cost * cost / self.weights.get(int(j), 1.0)
+            if incoming_col == -1 or score > best_score:
+                best_score = score
+                incoming_col = int(j)
+        return incoming_col
+
+    def update(self, optimizer: 'LinearOptimizer', table: LinearTable, pivot_row: int, pivot_col: int) -> None:
+        row = optimizer.float_row(table, pivot_row)
+        pivot = row[pivot_col]
+        pivot_weight = self.weights.get(pivot_col, 1.0)
+        for j, value in enumerate(row):
+            if value != 0.0 and j != pivot_col:
+                weight = (value / pivot) ** 2 * pivot_weight
+                if weight > self.weights.get(j, 1.0):
+                    self.weights[j] = weight
+        self.weights[table.base_indices[pivot_row - 1]] = max(pivot_weight / (pivot * pivot), 1.0)
+
+
+PricingRule.rules = {
+    'dantzig': PricingRule,
+    'bland': BlandRule,
+    'steepest_edge': SteepestEdgeRule,
+    'devex': DevexRule,
+}
+
+
 class LinearOptimizer:
+    engines = {}
+    modes = ('auto', 'primal', 'dual')
+    native_bounds = True
+
+    def __init__(self, tracer: Tracer = SILENT_TRACER, mode: str = 'auto', pricing: str | PricingRule = 'dantzig',
+                 stall_limit: int = 50, max_iterations: Optional[int] = None, deadline: Optional[float] = None,
+                 cancel_token: Optional[CancelToken] = None):
+        if mode not in self.modes:
+            raise ValueError(f"Неизвестный режим симплекс-метода: {mode}")
+        self.tracer = tracer
+        self.mode = mode
+        self.pricing = PricingRule.create(pricing)
+        self.active_rule = self.pricing
+        self.fallback_rule = BlandRule()
+        self.stall_limit = stall_limit
+        self.rule_stats: Dict[str, Dict[str, float]] = {}
+        self.iterations = 0
+        # Срок решения задаётся моментом по time.monotonic(), общим для всех этапов и процессов
+        self.max_iterations = max_iterations
+        self.deadline = deadline
+        self.cancel_token = cancel_token
+        self.stop_status: Optional[SolveStatus] = None
+        self.stats: Optional['SolveStats'] = None
+
+    @classmethod
+    def create(cls, engine: str = 'rational', **kwargs) -> 'LinearOptimizer':
+        if engine not in cls.engines:
+            raise ValueError(f"Неизвестный движок: {engine}")
+        return cls.engines[engine](**kwargs)
+
+    def build_table(self, canonical_form: CanonicalForm, basis_method: str = 'auto') -> LinearTable:
+        return LinearTable(canonical_form, basis_method, tracer=self.tracer)
+
+    def prepare_table(self, table: LinearTable) -> LinearTable:
+        return table
+
+    def finish_table(self, table: LinearTable, work_table: LinearTable) -> None:
+        pass
+
     def perform_iteration(self, table: LinearTable, step: int) -> Optional[bool]:
-        print(f"\nИтерация {step}:")
-        TableFormatter.display_table(table)
+        if self.tracer.level >= TraceLevel.ITERATION:
+            self.tracer.emit(TraceLevel.ITERATION, 'table', title=f"\nИтерация {step}:", table=table, step=step)
 
         if self.is_optimized(table):
             return True
+        # Пределы проверяются только перед очередной сменой базиса
+        self.stop_status = self.check_limits(self.iterations)
+        if self.stop_status is not None:
+            return None
 
         incoming_col = self.choose_incoming_variable(table)
-        if incoming_col == -1:
-            print("Функция не ограничена")
+        if incoming_col == -1 or not self.advance(table, incoming_col):
+            self.tracer.message(TraceLevel.SUMMARY, "Функция не ограничена")
             return False
+        return None
 
-        outgoing_row = self.choose_outgoing_variable(table, incoming_col)
+    def advance(self, table: LinearTable, incoming_col: int) -> bool:
+        if table.upper_bounds is not None:
+            outgoing_row, at_upper = self.choose_bounded_step(table, incoming_col)
+            if outgoing_row == 0:
+                table.complement(incoming_col)
+                return True
+            if outgoing_row != -1 and at_upper:
+                table.complement(table.base_indices[outgoing_row - 1])
+        else:
+            outgoing_row = self.choose_outgoing_variable(table, incoming_col)
         if outgoing_row == -1:
-            print("Функция не ограничена")
             return False
 
+        self.active_rule.update(self, table, outgoing_row, incoming_col)
         self.transform(table, outgoing_row, incoming_col)
-        return None
+        return True
+
+    def choose_bounded_step(self, table: LinearTable, incoming_col: int) -> tuple[int, bool]:
+        # Строка 0 означает переход вводимой переменной на верхнюю границу без смены базиса
+        upper_bounds = table.upper_bounds
+        min_ratio = upper_bounds[incoming_col]
+        outgoing_row = -1 if min_ratio is None else 0
+        at_upper = False
+        lowest_index = self.active_rule.lowest_index
+        for i in range(1, len(table.matrix)):
+            row = table.matrix[i]
+            a = row[incoming_col]
+            if a.top == 0:
+                continue
+            if a.top > 0:
+                ratio = row[-1].quotient(a)
+            else:
+                upper = upper_bounds[table.base_indices[i - 1]]
+                if upper is None:
+                    continue
+                ratio = upper.difference(row[-1]).quotient(a.invert())
+            order = 1 if min_ratio is None else ratio.order(min_ratio)
+            if min_ratio is None or order < 0 or (
+                    lowest_index and order == 0 and outgoing_row > 0 and table.base_indices[i - 1] < table.base_indices[outgoing_row - 1]):
+                min_ratio = ratio
+                outgoing_row = i
+                at_upper = a.top < 0
+        return outgoing_row, at_upper
 
     def display_final_result(self, table: LinearTable) -> None:
-        if self.is_optimized(table):
-            print("\nТаблица оптимальных решений:")
-            TableFormatter.display_table(table)
+        if self.is_optimized(table) and self.is_primal_feasible(table):
+            self.tracer.emit(TraceLevel.SUMMARY, 'table', title="\nТаблица оптимальных решений:", table=table)
             self.explore_alternatives(table)
         else:
-            print("\nНе удалось найти оптимального решения.")
-
-    def optimize(self, table: LinearTable) -> None:
+            self.tracer.message(TraceLevel.SUMMARY, "\nНе удалось найти оптимального решения.")
+
+    def run(self, table: LinearTable) -> Optional[bool]:
+        self.iterations = 0
+        self.active_rule = self.pricing
+        self.active_rule.reset(self, table)
+        objective = self.objective_value(table)
+        stalled = 0
         step = 0
+        self.stop_status = None
         while True:
             step += 1
+            started = time.perf_counter()
             result = self.perform_iteration(table, step)
+            if self.stop_status is not None:
+                return None
+            self.count_rule(self.active_rule, time.perf_counter() - started, 'iterations' if result is None else None)
             if result is not None:
-                break
-        self.display_final_result(table)
+                return result
+            self.iterations += 1
+            if self.stats is not None:
+                self.stats.record_pivot(self.table_bits(table))
+
+            previous, objective = objective, self.objective_value(table)
+            if self.has_progress(previous, objective):
+                stalled = 0
+                if self.active_rule is not self.pricing:
+                    self.active_rule = self.pricing
+                    self.active_rule.reset(self, table)
+                continue
+            stalled += 1
+            if stalled >= self.stall_limit and not self.active_rule.lowest_index:
+                self.tracer.message(TraceLevel.ITERATION, f"Целевая функция не меняется {stalled} итераций, переход к правилу Бленда")
+                self.active_rule = self.fallback_rule
+                self.count_rule(self.fallback_rule, 0.0, 'fallbacks')
+
+    def count_rule(self, rule: PricingRule, elapsed: float, counter: Optional[str] = 'iterations') -> None:
+        stats = self.rule_stats.setdefault(rule.name, {'iterations': 0, 'time': 0.0, 'fallbacks': 0})
+        if counter is not None:
+            stats[counter] += 1
+        stats['time'] += elapsed
+
+    def objective_value(self, table: LinearTable) -> RationalNumber:
+        return table.matrix[0][-1]
+
+    def table_bits(self, table: LinearTable) -> int:
+        return max((max(cell.top.bit_length(), cell.bottom.bit_length()) for row in table.matrix for cell in row.entries.values()), default=0)
+
+    def has_progress(self, previous: RationalNumber, current: RationalNumber) -> bool:
+        return current != previous
+
+    def is_primal_feasible(self, table: LinearTable) -> bool:
+        if not all(table.matrix[i][-1].order(RationalNumber.NULL) >= 0 for i in range(1, len(table.matrix))):
+            return False
+        if table.upper_bounds is None:
+            return True
+        return all(upper is None or table.matrix[i][-1].order(upper) <= 0
+                   for i, upper in enumerate((table.upper_bounds[j] for j in table.base_indices), 1))
+
+    def choose_dual_outgoing_row(self, table: LinearTable) -> int:
+        outgoing_row = -1
+        min_val = RationalNumber.NULL
+        for i in range(1, len(table.matrix)):
+            value = table.matrix[i][-1]
+            # Превышение верхней границы учитывается как отрицательное значение дополненной переменной
+            if table.upper_bounds is not None and value.top > 0:
+                upper = table.upper_bounds[table.base_indices[i - 1]]
+                value = RationalNumber.NULL if upper is None else upper.difference(value)
+            if value.order(min_val) < 0:
+                min_val = value
+                outgoing_row = i
+        return outgoing_row
+
+    def choose_dual_incoming_variable(self, table: LinearTable, outgoing_row: int) -> int:
+        z_row = table.matrix[0]
+        row = table.matrix[outgoing_row]
+        incoming_col = -1
+        min_ratio: Optional[RationalNumber] = None
+        for j in sorted(row.entries):
+            a = row[j]
+            if j < len(row) - 1 and a.order(RationalNumber.NULL) < 0:
+                ratio = z_row[j].quotient(a.invert())
+                if min_ratio is None or ratio.order(min_ratio) < 0:
+                    min_ratio = ratio
+                    incoming_col = j
+        return incoming_col
+
+    def perform_dual_iteration(self, table: LinearTable, step: int) -> Optional[bool]:
+        if self.tracer.level >= TraceLevel.ITERATION:
+            self.tracer.emit(TraceLevel.ITERATION, 'table', title=f"\nИтерация двойственного метода {step}:", table=table, step=step)
+
+        outgoing_row = self.choose_dual_outgoing_row(table)
+        if outgoing_row == -1:
+            return True
+        if table.upper_bounds is not None and table.matrix[outgoing_row][-1].top > 0:
+            table.complement(table.base_indices[outgoing_row - 1])
+
+        incoming_col = self.choose_dual_incoming_variable(table, outgoing_row)
+        if incoming_col == -1:
+            self.tracer.message(TraceLevel.SUMMARY, "Система ограничений несовместна")
+            return False
+        self.stop_status = self.check_limits(self.iterations)
+        if self.stop_status is not None:
+            return None
+
+        self.transform(table, outgoing_row, incoming_col)
+        return None
+
+    def run_dual(self, table: LinearTable) -> Optional[bool]:
+        self.iterations = 0
+        step = 0
+        self.stop_status = None
+        while True:
+            step += 1
+            result = self.perform_dual_iteration(table, step)
+            if result is not None or self.stop_status is not None:
+                return result
+            self.iterations += 1
+            if self.stats is not None:
+                self.stats.record_pivot(self.table_bits(table))
+
+    def select_mode(self, table: LinearTable) -> str:
+        if self.mode == 'dual':
+            if not self.is_optimized(table):
+                raise ValueError("Базис не является двойственно допустимым")
+            return 'dual'
+        if self.mode == 'auto' and not self.is_primal_feasible(table) and self.is_optimized(table):
+            return 'dual'
+        return 'primal'
+
+    def solve_table(self, table: LinearTable) -> SolveStatus:
+        if self.select_mode(table) == 'dual':
+            result, failure = self.run_dual(table), SolveStatus.INFEASIBLE
+        else:
+            result, failure = self.run(table), SolveStatus.UNBOUNDED
+        if result is not None:
+            return SolveStatus.OPTIMAL if result else failure
+        self.tracer.message(TraceLevel.SUMMARY, LIMIT_MESSAGES[self.stop_status])
+        return self.stop_status
+
+    def check_limits(self, iterations: int) -> Optional[SolveStatus]:
+        return limit_status(iterations, self.max_iterations, self.deadline, self.cancel_token)
+
+    def optimize(self, table: LinearTable) -> None:
+        work_table = self.prepare_table(table)
+        self.solve_table(work_table)
+        self.display_final_result(work_table)
+        self.finish_table(table, work_table)
 
     def is_optimized(self, table: LinearTable) -> bool:
         z_row = table.matrix[0]
         return all(z_row[i].order(RationalNumber.NULL) >= 0 for i in range(len(z_row) - 1))
 
     def choose_incoming_variable(self, table: LinearTable) -> int:
+        return self.active_rule.choose(self, table)
+
+    def most_negative_column(self, table: LinearTable) -> int:
         z_row = table.matrix[0]
         incoming_col = -1
         min_val = RationalNumber.NULL
@@ -279,41 +1526,56 @@ class LinearOptimizer:
                 incoming_col = i
         return incoming_col
 
+    def first_negative_column(self, table: LinearTable) -> int:
+        z_row = table.matrix[0]
+        return min((j for j, value in z_row.items() if j < len(z_row) - 1 and value.top < 0), default=-1)
+
+    def negative_columns(self, table: LinearTable) -> List[int]:
+        z_row = table.matrix[0]
+        return sorted(j for j, value in z_row.items() if j < len(z_row) - 1 and value.top < 0)
+
+    def float_costs(self, table: LinearTable, columns: List[int]) -> List[float]:
+        z_row = table.matrix[0]
+        return [z_row[j].to_float() for j in columns]
+
+    def column_norms(self, table: LinearTable, columns: List[int]) -> List[float]:
+        norms = []
+        for j in columns:
+            norm = 1.0
+            for row in table.matrix[1:]:
+                value = row.entries.get(j)
+                if value is not None:
+                    norm += value.to_float() ** 2
+            norms.append(norm)
+        return norms
+
+    def float_row(self, table: LinearTable, index: int) -> List[float]:
+        row = table.matrix[index]
+        return [value.to_float() for value in row[:len(row) - 1]]
+
     def choose_outgoing_variable(self, table: LinearTable, incoming_col: int) -> int:
         outgoing_row = -1
         min_ratio: Optional[RationalNumber] = None
+        lowest_index = self.active_rule.lowest_index
         for i in range(1, len(table.matrix)):
             row = table.matrix[i]
             a = row[incoming_col]
             b = row[-1]
             if a.order(RationalNumber.NULL) > 0:
                 ratio = b.quotient(a)
-                if min_ratio is None or ratio.order(min_ratio) < 0:
+                order = 1 if min_ratio is None else ratio.order(min_ratio)
+                if min_ratio is None or order < 0:
                     min_ratio = ratio
                     outgoing_row = i
+                elif lowest_index and order == 0 and table.base_indices[i - 1] < table.base_indices[outgoing_row - 1]:
+                    outgoing_row = i
         return outgoing_row
 
     def transform(self, table: LinearTable, pivot_row: int, pivot_col: int) -> None:
-        pivot_row_values = table.matrix[pivot_row]
-        pivot_element = pivot_row_values[pivot_col]
-
-        for j in range(len(pivot_row_values)):
-            pivot_row_values[j] = pivot_row_values[j].quotient(pivot_element)
-
+        table.normalize_pivot_row(pivot_row, pivot_col)
+        table.update_other_rows(pivot_row, pivot_col)
         table.base_indices[pivot_row - 1] = pivot_col
 
-        for i in range(len(table.matrix)):
-            if i != pivot_row:
-                current_row = table.matrix[i]
-                factor = current_row[pivot_col]
-                for j in range(len(current_row)):
-                    if j == pivot_col:
-                        current_row[j] = RationalNumber.NULL
-                        continue
-                    current_row[j] = current_row[j].difference(
-                        factor.product(pivot_row_values[j])
-                    )
-
     def explore_alternatives(self, table: LinearTable) -> None:
         z_row = table.matrix[0]
         num_vars = len(z_row) - 1
@@ -328,13 +1590,13 @@ class LinearOptimizer:
 
     def display_basic(self, table: LinearTable) -> None:
         num_vars = len(table.matrix[0]) - 1
-        solution = [RationalNumber.NULL] * num_vars
-        for i in range(1, len(table.matrix)):
-            var_index = table.base_indices[i - 1]
-            solution[var_index] = table.matrix[i][-1]
+        solution = self.get_solution(table)
         z_value = table.matrix[0][-1]
-        print("\нОтвет:")
-        print(
+        if self.tracer.level < TraceLevel.SUMMARY:
+            return
+        self.tracer.message(TraceLevel.SUMMARY, "\нОтвет:")
+        self.tracer.message(
+            TraceLevel.SUMMARY,
             f"Оптимальное значение: Z{'max' if table.maximize else 'min'}({', '.join(str(x) for x in solution[:num_vars - table.aux_vars])}) = {z_value}"
         )
 
@@ -349,35 +1611,1155 @@ class LinearOptimizer:
     def display_parametric(self, table: LinearTable, free_col: int) -> None:
         num_vars = len(table.matrix[0]) - 1
         point_a = self.get_solution(table)
-        outgoing_row = self.choose_outgoing_variable(table, free_col)
-        if outgoing_row == -1:
-            print("Альтернативное оптимальное решение неограниченно.")
+        if not self.advance(table, free_col):
+            self.tracer.message(TraceLevel.SUMMARY, "Альтернативное оптимальное решение неограниченно.")
             return
-        self.transform(table, outgoing_row, free_col)
-        print("Альтернативное решение:")
-        TableFormatter.display_table(table)
+        self.tracer.emit(TraceLevel.SUMMARY, 'table', title="Альтернативное решение:", table=table)
         point_b = self.get_solution(table)
         z_value = table.matrix[0][-1]
-        print("\nОтвет:")
-        solution_str = self.format_parametric_solution(point_a, point_b, num_vars, table.aux_vars)
-        print(f"Оптимальное значение: Zmin({', '.join(solution_str)}) = -{z_value}")
+        self.tracer.message(TraceLevel.SUMMARY, "\nОтвет:")
+        if self.tracer.level >= TraceLevel.SUMMARY:
+            solution_str = self.format_parametric_solution(point_a, point_b, num_vars, table.aux_vars)
+            self.tracer.message(TraceLevel.SUMMARY, f"Оптимальное значение: Zmin({', '.join(solution_str)}) = -{z_value}")
+
+    def get_solution(self, table: LinearTable) -> List[RationalNumber]:
+        num_vars = len(table.matrix[0]) - 1
+        solution = [RationalNumber.NULL] * num_vars
+        for i in range(1, len(table.matrix)):
+            var_index = table.base_indices[i - 1]
+            solution[var_index] = table.matrix[i][-1]
+        if table.upper_bounds is not None:
+            for j in table.complemented:
+                solution[j] = table.upper_bounds[j].difference(solution[j])
+            for j, shift in enumerate(table.lower_shifts):
+                if shift.top != 0:
+                    solution[j] = solution[j].sum(shift)
+        for j, negative in table.free_columns.items():
+            solution[j] = solution[j].difference(solution[negative])
+        return solution
+
+    def check_bounds(self, table: LinearTable) -> None:
+        if table.upper_bounds is not None and not self.native_bounds and any(upper is not None for upper in table.upper_bounds):
+            raise ValueError("Движок не поддерживает границы переменных в таблице, используйте строки ограничений")
+
+
+class IntegerOptimizer(LinearOptimizer):
+    native_bounds = False
+
+    def prepare_table(self, table: LinearTable) -> IntegerTable:
+        self.check_bounds(table)
+        return IntegerTable(table)
+
+    def finish_table(self, table: LinearTable, work_table: IntegerTable) -> None:
+        work_table.write_back(table)
+        if self.stats is not None:
+            self.stats.gcd_calls += work_table.gcd_calls
+
+    def table_bits(self, table: IntegerTable) -> int:
+        # Числители хранятся приведёнными к общему знаменателю строки
+        return max((max(denominator.bit_length(), *(abs(value).bit_length() for value in row))
+                    for row, denominator in zip(table.rows, table.denominators)), default=0)
+
+    def is_optimized(self, table: IntegerTable) -> bool:
+        z_row = table.rows[0]
+        return all(z_row[i] >= 0 for i in range(len(z_row) - 1))
+
+    def most_negative_column(self, table: IntegerTable) -> int:
+        z_row = table.rows[0]
+        incoming_col = -1
+        min_val = 0
+        for i in range(len(z_row) - 1):
+            if z_row[i] < min_val:
+                min_val = z_row[i]
+                incoming_col = i
+        return incoming_col
+
+    def first_negative_column(self, table: IntegerTable) -> int:
+        z_row = table.rows[0]
+        return next((j for j in range(len(z_row) - 1) if z_row[j] < 0), -1)
+
+    def negative_columns(self, table: IntegerTable) -> List[int]:
+        z_row = table.rows[0]
+        return [j for j in range(len(z_row) - 1) if z_row[j] < 0]
+
+    def float_costs(self, table: IntegerTable, columns: List[int]) -> List[float]:
+        z_row = table.rows[0]
+        return [z_row[j] / table.denominators[0] for j in columns]
+
+    def column_norms(self, table: IntegerTable, columns: List[int]) -> List[float]:
+        norms = [1.0] * len(columns)
+        for row, denominator in zip(table.rows[1:], table.denominators[1:]):
+            for k, j in enumerate(columns):
+                if row[j]:
+                    norms[k] += (row[j] / denominator) ** 2
+        return norms
+
+    def float_row(self, table: IntegerTable, index: int) -> List[float]:
+        denominator = table.denominators[index]
+        return [value / denominator for value in table.rows[index][:-1]]
+
+    def objective_value(self, table: IntegerTable) -> RationalNumber:
+        return RationalNumber(table.rows[0][-1], table.denominators[0])
+
+    def choose_outgoing_variable(self, table: IntegerTable, incoming_col: int) -> int:
+        outgoing_row = -1
+        best_top = best_bottom = 0
+        lowest_index = self.active_rule.lowest_index
+        for i in range(1, len(table.rows)):
+            row = table.rows[i]
+            a = row[incoming_col]
+            b = row[-1]
+            if a <= 0:
+                continue
+            # b/a < best_top/best_bottom при положительных знаменателях
+            if outgoing_row == -1 or b * best_bottom < best_top * a:
+                best_top, best_bottom = b, a
+                outgoing_row = i
+            elif lowest_index and b * best_bottom == best_top * a and table.base_indices[i - 1] < table.base_indices[outgoing_row - 1]:
+                outgoing_row = i
+        return outgoing_row
+
+    def is_primal_feasible(self, table: IntegerTable) -> bool:
+        return all(row[-1] >= 0 for row in table.rows[1:])
+
+    def choose_dual_outgoing_row(self, table: IntegerTable) -> int:
+        outgoing_row = -1
+        best_top, best_bottom = 0, 1
+        for i in range(1, len(table.rows)):
+            b = table.rows[i][-1]
+            denominator = table.denominators[i]
+            if b * best_bottom < best_top * denominator:
+                best_top, best_bottom = b, denominator
+                outgoing_row = i
+        return outgoing_row
+
+    def choose_dual_incoming_variable(self, table: IntegerTable, outgoing_row: int) -> int:
+        z_row = table.rows[0]
+        row = table.rows[outgoing_row]
+        incoming_col = -1
+        best_top = best_bottom = 0
+        for j in range(len(row) - 1):
+            a = row[j]
+            # z_j/|a| < best_top/best_bottom, знаменатели строк общие для всех столбцов
+            if a < 0 and (incoming_col == -1 or z_row[j] * best_bottom < best_top * -a):
+                best_top, best_bottom = z_row[j], -a
+                incoming_col = j
+        return incoming_col
+
+    def transform(self, table: IntegerTable, pivot_row: int, pivot_col: int) -> None:
+        table.transform(pivot_row, pivot_col)
+        table.base_indices[pivot_row - 1] = pivot_col
+
+
+class FloatOptimizer(LinearOptimizer):
+    native_bounds = False
+
+    def __init__(self, tracer: Tracer = SILENT_TRACER, pivot_tol: float = 1e-9, feasibility_tol: float = 1e-9, optimality_tol: float = 1e-9,
+                 mode: str = 'auto', pricing: str | PricingRule = 'dantzig', stall_limit: int = 50, max_iterations: Optional[int] = None,
+                 deadline: Optional[float] = None, cancel_token: Optional[CancelToken] = None):
+        if np is None:
+            raise ValueError("Для движка 'float' требуется numpy")
+        super().__init__(tracer, mode, pricing, stall_limit, max_iterations, deadline, cancel_token)
+        self.pivot_tol = pivot_tol
+        self.feasibility_tol = feasibility_tol
+        self.optimality_tol = optimality_tol
+        self.phase_iterations = 0
+        self.built_tables: Optional[tuple[LinearTable, FloatTable]] = None
+
+    def build_table(self, canonical_form: CanonicalForm, basis_method: str = 'auto') -> LinearTable:
+        # Первая фаза решается в float64, точная таблица получает матрицу только при записи результата.
+        # Двойственный старт, особые методы выбора базиса и трассировка таблиц требуют точной начальной таблицы
+        if self.mode == 'dual' or basis_method not in ('auto', 'phase1') or self.tracer.level >= TraceLevel.SUMMARY:
+            return super().build_table(canonical_form, basis_method)
+        table = LinearTable.from_source(canonical_form)
+        self.check_bounds(table)
+        self.stop_status = None
+        self.iterations = self.phase_iterations = 0
+        try:
+            work_table = FloatTable.from_canonical(canonical_form, self)
+        except ValueError as e:
+            raise ValueError(f"Нет допустимого решения: {str(e)}")
+        self.phase_iterations = self.iterations
+        # При остановке первой фазы по пределу таблица остаётся без матрицы, причина в stop_status
+        if work_table is None:
+            return table
+        table.base_indices = work_table.base_indices
+        self.built_tables = (table, work_table)
+        return table
+
+    def prepare_table(self, table: LinearTable) -> FloatTable:
+        self.check_bounds(table)
+        if self.built_tables is not None and self.built_tables[0] is table:
+            work_table = self.built_tables[1]
+            self.built_tables = None
+            return work_table
+        return FloatTable.from_table(table)
+
+    def check_limits(self, iterations: int) -> Optional[SolveStatus]:
+        # Итерации первой фазы входят в общий предел
+        return super().check_limits(iterations + self.phase_iterations)
+
+    def solve_table(self, table: FloatTable) -> SolveStatus:
+        status = super().solve_table(table)
+        self.iterations += self.phase_iterations
+        self.phase_iterations = 0
+        return status
+
+    def finish_table(self, table: LinearTable, work_table: FloatTable) -> None:
+        table.matrix = [row.copy() for row in work_table.matrix]
+
+    def table_bits(self, table: FloatTable) -> int:
+        return 0
+
+    def is_optimized(self, table: FloatTable) -> bool:
+        return bool(np.all(table.values[0, :-1] >= -self.optimality_tol))
+
+    def most_negative_column(self, table: FloatTable) -> int:
+        z_row = table.values[0, :-1]
+        incoming_col = int(np.argmin(z_row))
+        return incoming_col if z_row[incoming_col] < -self.optimality_tol else -1
+
+    def first_negative_column(self, table: FloatTable) -> int:
+        candidates = self.negative_columns(table)
+        return int(candidates[0]) if len(candidates) else -1
+
+    def negative_columns(self, table: FloatTable) -> 'np.ndarray':
+        return np.flatnonzero(table.values[0, :-1] < -self.optimality_tol)
+
+    def float_costs(self, table: FloatTable, columns: 'np.ndarray') -> 'np.ndarray':
+        return table.values[0, columns]
+
+    def column_norms(self, table: FloatTable, columns: 'np.ndarray') -> 'np.ndarray':
+        return 1.0 + np.square(table.values[1:, columns]).sum(axis=0)
+
+    def float_row(self, table: FloatTable, index: int) -> List[float]:
+        return table.values[index, :-1].tolist()
+
+    def objective_value(self, table: FloatTable) -> float:
+        return float(table.values[0, -1])
+
+    def has_progress(self, previous: float, current: float) -> bool:
+        return abs(current - previous) > self.optimality_tol * max(1.0, abs(previous))
+
+    def choose_outgoing_variable(self, table: FloatTable, incoming_col: int) -> int:
+        column = table.values[1:, incoming_col]
+        allowed = column > self.pivot_tol
+        if not allowed.any():
+            return -1
+        rhs = np.maximum(table.values[1:, -1], 0.0)
+        ratios = np.full(column.shape, np.inf)
+        np.divide(rhs, column, out=ratios, where=allowed)
+        outgoing_row = int(np.argmin(ratios))
+        if self.active_rule.lowest_index:
+            ties = np.flatnonzero(ratios <= ratios[outgoing_row] + self.feasibility_tol)
+            outgoing_row = int(min(ties, key=lambda i: table.base_indices[i]))
+        return outgoing_row + 1
+
+    def is_primal_feasible(self, table: FloatTable) -> bool:
+        return bool(np.all(table.values[1:, -1] >= -self.feasibility_tol))
+
+    def choose_dual_outgoing_row(self, table: FloatTable) -> int:
+        rhs = table.values[1:, -1]
+        if rhs.size == 0:
+            return -1
+        outgoing_row = int(np.argmin(rhs))
+        return outgoing_row + 1 if rhs[outgoing_row] < -self.feasibility_tol else -1
+
+    def choose_dual_incoming_variable(self, table: FloatTable, outgoing_row: int) -> int:
+        row = table.values[outgoing_row, :-1]
+        allowed = row < -self.pivot_tol
+        if not allowed.any():
+            return -1
+        ratios = np.full(row.shape, np.inf)
+        np.divide(np.maximum(table.values[0, :-1], 0.0), -row, out=ratios, where=allowed)
+        return int(np.argmin(ratios))
+
+    def transform(self, table: FloatTable, pivot_row: int, pivot_col: int) -> None:
+        table.transform(pivot_row, pivot_col)
+        table.base_indices[pivot_row - 1] = pivot_col
+
+
+class HybridOptimizer(FloatOptimizer):
+    def __init__(self, tracer: Tracer = SILENT_TRACER, pivot_tol: float = 1e-9, feasibility_tol: float = 1e-9, optimality_tol: float = 1e-9,
+                 mode: str = 'auto', pricing: str | PricingRule = 'dantzig', stall_limit: int = 50, max_iterations: Optional[int] = None,
+                 deadline: Optional[float] = None, cancel_token: Optional[CancelToken] = None):
+        if np is None:
+            raise ValueError("Для движка 'hybrid' требуется numpy")
+        super().__init__(tracer, pivot_tol, feasibility_tol, optimality_tol, mode, pricing, stall_limit, max_iterations, deadline, cancel_token)
+        self.exact_optimizer = LinearOptimizer(tracer, 'auto', pricing, stall_limit, max_iterations, deadline, cancel_token)
+        self.canonical_form: Optional[CanonicalForm] = None
+        self.source_table: Optional[LinearTable] = None
+        self.exact_table: Optional[LinearTable] = None
+        self.float_iterations = 0
+        self.exact_iterations = 0
+        self.certified = False
+
+    def build_table(self, canonical_form: CanonicalForm, basis_method: str = 'auto') -> LinearTable:
+        self.canonical_form = canonical_form
+        return super().build_table(canonical_form, basis_method)
+
+    def prepare_table(self, table: LinearTable) -> FloatTable:
+        self.source_table = table
+        work_table = super().prepare_table(table)
+        work_table.base_indices = list(work_table.base_indices)
+        return work_table
+
+    def finish_table(self, table: LinearTable, work_table: FloatTable) -> None:
+        table.matrix = self.exact_table.matrix
+        table.base_indices = self.exact_table.base_indices
+
+    def restore_basis(self, work_table: FloatTable) -> Optional[LinearTable]:
+        source = self.source_table
+        if source.matrix:
+            z_row, rows = source.matrix[0], source.matrix[1:]
+        else:
+            # Начальная таблица построена вещественной первой фазой, точные строки берутся из исходной задачи
+            z_row, rows = source.build_z_row(), source.initialize_matrix()
+            if work_table.row_indices is not None:
+                rows = [rows[i] for i in work_table.row_indices]
+        try:
+            rows = MatrixSolver.transform_for_base(rows, work_table.base_indices, pivoting=True)
+        except ValueError:
+            return None
+        table = LinearTable.assemble([z_row.copy()] + rows, list(work_table.base_indices), source.maximize, source.aux_vars)
+        table.price_out_basis()
+        return table
+
+    def restart_table(self) -> Optional[LinearTable]:
+        source = self.source_table
+        if source.matrix:
+            return LinearTable.assemble([row.copy() for row in source.matrix], list(source.base_indices), source.maximize, source.aux_vars)
+        try:
+            return LinearOptimizer.build_table(self, self.canonical_form)
+        except ValueError:
+            return None
+
+    def solve_table(self, table: FloatTable) -> SolveStatus:
+        float_status = super().solve_table(table)
+        self.float_iterations = self.iterations
+
+        # Базис из вещественного решения пересчитывается точно; если он не допустим ни в прямом, ни в двойственном
+        # смысле, точный метод начинает с исходного базиса
+        exact_table = self.restore_basis(table)
+        restarted = exact_table is None or not (self.exact_optimizer.is_primal_feasible(exact_table) or self.exact_optimizer.is_optimized(exact_table))
+        if restarted:
+            self.tracer.message(TraceLevel.SUMMARY, "\nБазис вещественного решения не подтверждён, точное решение с исходного базиса")
+            exact_table = self.restart_table()
+            # Точная первая фаза не нашла допустимого базиса, которого не заметила вещественная
+            if exact_table is None:
+                self.exact_table = self.source_table
+                self.exact_iterations = 0
+                self.certified = False
+                return SolveStatus.INFEASIBLE
+        if float_status in LIMIT_MESSAGES:
+            self.exact_table = exact_table
+            self.exact_iterations = 0
+            self.certified = False
+            return float_status
+
+        if self.max_iterations is not None:
+            self.exact_optimizer.max_iterations = max(self.max_iterations - self.float_iterations, 0)
+        self.exact_optimizer.stats = self.stats
+        status = self.exact_optimizer.solve_table(exact_table)
+        self.exact_table = exact_table
+        self.exact_iterations = self.exact_optimizer.iterations
+        self.certified = not restarted and self.exact_iterations == 0
+        self.iterations = self.float_iterations + self.exact_iterations
+        if not self.certified:
+            self.tracer.message(TraceLevel.SUMMARY, f"Точных итераций после вещественного решения: {self.exact_iterations}")
+        return status
+
+    def display_final_result(self, table: FloatTable) -> None:
+        self.exact_optimizer.display_final_result(self.exact_table)
+
+
+class InteriorPointOptimizer(LinearOptimizer):
+    native_bounds = False
+
+    def __init__(self, tracer: Tracer = SILENT_TRACER, mode: str = 'auto', pricing: str | PricingRule = 'dantzig', stall_limit: int = 50,
+                 max_iterations: Optional[int] = None, deadline: Optional[float] = None, cancel_token: Optional[CancelToken] = None,
+                 barrier_limit: int = 100, barrier_tol: float = 1e-9):
+        if np is None:
+            raise ValueError("Для движка 'interior' требуется numpy")
+        super().__init__(tracer, mode, pricing, stall_limit, max_iterations, deadline, cancel_token)
+        self.barrier_limit = barrier_limit
+        self.barrier_tol = barrier_tol
+        self.barrier_iterations = 0
+        self.crossover_found = False
+
+    def build_table(self, canonical_form: CanonicalForm, basis_method: str = 'auto') -> LinearTable:
+        # Базис для точного симплекс-метода берётся из решения методом внутренней точки;
+        # если он не допустим ни в прямом, ни в двойственном смысле, базис выбирается обычным способом
+        self.crossover_found = False
+        if canonical_form.restriction_matrix and canonical_form.upper_bounds is None:
+            a = np.array([[cell.to_float() for cell in row] for row in canonical_form.restriction_matrix], dtype=np.float64)
+            b = np.array([cell.to_float() for cell in canonical_form.shifted_right_sides()], dtype=np.float64)
+            c = -np.array([cell.to_float() for cell in canonical_form.goal_factors], dtype=np.float64)
+            # Переполнение при расходимости ожидаемо и обрабатывается проверкой конечности итераций
+            with np.errstate(all='ignore'):
+                point = self.barrier(a, b, c)
+            self.tracer.message(TraceLevel.SUMMARY, f"\nМетод внутренней точки: итераций {self.barrier_iterations}")
+            if point is not None:
+                x, _, s = point
+                for order in (np.argsort(s - x, kind='stable'), np.argsort(s, kind='stable')):
+                    table = self.crossover(canonical_form, a, order)
+                    if table is not None:
+                        self.crossover_found = True
+                        return table
+        self.tracer.message(TraceLevel.SUMMARY, "Вершина по решению метода внутренней точки не найдена, базис выбирается обычным способом")
+        return super().build_table(canonical_form, basis_method)
+
+    def barrier(self, a: 'np.ndarray', b: 'np.ndarray', c: 'np.ndarray') -> Optional[tuple['np.ndarray', 'np.ndarray', 'np.ndarray']]:
+        # Прямо-двойственный метод предиктор-корректор Мехротры для min c*x, Ax = b, x >= 0
+        rows, cols = a.shape
+        self.barrier_iterations = 0
+        regularization = 1e-12 * max(1.0, float(np.abs(a).max()) ** 2)
+        try:
+            gram = a @ a.T + regularization * np.eye(rows)
+            x = a.T @ np.linalg.solve(gram, b)
+            y = np.linalg.solve(gram, a @ c)
+        except np.linalg.LinAlgError:
+            return None
+        s = c - a.T @ y
+        x += max(-1.5 * float(x.min()), 0.0)
+        s += max(-1.5 * float(s.min()), 0.0)
+        if x.sum() <= 0.0 or s.sum() <= 0.0:
+            x += 1.0
+            s += 1.0
+        product = float(x @ s)
+        x += 0.5 * product / float(s.sum())
+        s += 0.5 * product / float(x.sum())
+        b_norm = 1.0 + float(np.linalg.norm(b))
+        c_norm = 1.0 + float(np.linalg.norm(c))
+
+        while self.barrier_iterations < self.barrier_limit:
+            primal_residual = a @ x - b
+            dual_residual = a.T @ y + s - c
+            primal, dual = float(c @ x), float(b @ y)
+            if (np.linalg.norm(primal_residual) <= self.barrier_tol * b_norm and np.linalg.norm(dual_residual) <= self.barrier_tol * c_norm
+                    and abs(primal - dual) <= self.barrier_tol * (1.0 + abs(primal))):
+                return x, y, s
+            # Расходимость означает несовместность или неограниченность, статус определит точный метод
+            if not (np.all(np.isfinite(x)) and np.all(np.isfinite(y)) and np.all(np.isfinite(s))) or max(float(np.abs(x).max()), float(np.abs(y).max())) > 1e15:
+                return None
+            if self.check_limits(0) is not None:
+                return None
+
+            mu = float(x @ s) / cols
+            scale = x / s
+            normal = (a * scale) @ a.T + regularization * np.eye(rows)
+
+            def direction(complementarity: 'np.ndarray') -> tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+                dy = np.linalg.solve(normal, -primal_residual - a @ (complementarity / s + scale * dual_residual))
+                dx = complementarity / s + scale * (dual_residual + a.T @ dy)
+                return dx, dy, -dual_residual - a.T @ dy
+
+            try:
+                dx, dy, ds = direction(-x * s)
+                step_x, step_s = self.step_length(x, dx), self.step_length(s, ds)
+                mu_affine = float((x + step_x * dx) @ (s + step_s * ds)) / cols
+                sigma = (mu_affine / mu) ** 3
+                dx, dy, ds = direction(-x * s - dx * ds + sigma * mu)
+            except np.linalg.LinAlgError:
+                return None
+            step_x, step_s = min(1.0, 0.99 * self.step_length(x, dx, None)), min(1.0, 0.99 * self.step_length(s, ds, None))
+            x += step_x * dx
+            y += step_s * dy
+            s += step_s * ds
+            self.barrier_iterations += 1
+        return None
+
+    @staticmethod
+    def step_length(values: 'np.ndarray', direction: 'np.ndarray', limit: Optional[float] = 1.0) -> float:
+        decreasing = direction < 0
+        step = float((-values[decreasing] / direction[decreasing]).min()) if decreasing.any() else np.inf
+        return step if limit is None else min(limit, step)
+
+    def crossover(self, canonical_form: CanonicalForm, a: 'np.ndarray', order: 'np.ndarray') -> Optional[LinearTable]:
+        # Столбцы в порядке убывания x_j - s_j добавляются в базис, пока они линейно независимы
+        rows = a.shape[0]
+        basis = np.zeros((rows, rows))
+        base_indices: List[int] = []
+        for j in order:
+            column = a[:, j]
+            norm = float(np.linalg.norm(column))
+            if norm == 0.0:
+                continue
+            known = basis[:, :len(base_indices)]
+            residual = column - known @ (known.T @ column)
+            residual -= known @ (known.T @ residual)
+            length = float(np.linalg.norm(residual))
+            if length > 1e-9 * norm:
+                basis[:, len(base_indices)] = residual / length
+                base_indices.append(int(j))
+                if len(base_indices) == rows:
+                    break
+        if len(base_indices) < rows:
+            return None
+        # Единичные столбцы остаются в своих строках, иначе исключение заполняет таблицу без необходимости
+        positions: List[Optional[int]] = [None] * rows
+        rest = []
+        for j in sorted(base_indices):
+            nonzero = np.flatnonzero(a[:, j])
+            if nonzero.size == 1 and positions[nonzero[0]] is None:
+                positions[nonzero[0]] = j
+            else:
+                rest.append(j)
+        free = iter(rest)
+        ordered = [j if j is not None else next(free) for j in positions]
+        try:
+            table = LinearTable(canonical_form, base_indices=ordered, tracer=self.tracer)
+        except ValueError:
+            return None
+        return table if self.is_primal_feasible(table) or self.is_optimized(table) else None
+
+
+class BasisFactor:
+    def __init__(self, matrix: 'np.ndarray', pivot_tol: float = 1e-11):
+        self.size = matrix.shape[0]
+        self.lu = matrix.astype(np.float64, copy=True)
+        self.perm = np.arange(self.size)
+        self.etas: List[tuple[int, 'np.ndarray']] = []
+        lu = self.lu
+        for k in range(self.size):
+            p = k + int(np.argmax(np.abs(lu[k:, k])))
+            if abs(lu[p, k]) < pivot_tol:
+                raise ValueError("Вырожденная базисная матрица")
+            if p != k:
+                lu[[k, p]] = lu[[p, k]]
+                self.perm[[k, p]] = self.perm[[p, k]]
+            below = k + 1 + np.flatnonzero(lu[k + 1:, k])
+            if below.size:
+                lu[below, k] /= lu[k, k]
+                lu[below, k + 1:] -= np.outer(lu[below, k], lu[k, k + 1:])
+
+    def ftran(self, vector: 'np.ndarray') -> 'np.ndarray':
+        lu = self.lu
+        x = vector[self.perm].astype(np.float64)
+        for k in range(self.size - 1):
+            if x[k] != 0.0:
+                x[k + 1:] -= lu[k + 1:, k] * x[k]
+        for k in range(self.size - 1, -1, -1):
+            x[k] /= lu[k, k]
+            if x[k] != 0.0:
+                x[:k] -= lu[:k, k] * x[k]
+        for r, eta in self.etas:
+            pivot = x[r] / eta[r]
+            if pivot != 0.0:
+                x -= eta * pivot
+            x[r] = pivot
+        return x
+
+    def btran(self, vector: 'np.ndarray') -> 'np.ndarray':
+        u = vector.astype(np.float64)
+        for r, eta in reversed(self.etas):
+            u[r] = u[r] - (u @ eta - u[r]) / eta[r]
+        lu = self.lu
+        for k in range(self.size):
+            u[k] /= lu[k, k]
+            if u[k] != 0.0:
+                u[k + 1:] -= lu[k, k + 1:] * u[k]
+        for k in range(self.size - 1, 0, -1):
+            if u[k] != 0.0:
+                u[:k] -= lu[k, :k] * u[k]
+        y = np.empty_like(u)
+        y[self.perm] = u
+        return y
+
+    def update(self, row: int, column: 'np.ndarray') -> None:
+        self.etas.append((row, column))
+
+
+class RevisedSimplex:
+    def __init__(self, canonical_form: CanonicalForm, pivot_tol: float = 1e-9, feasibility_tol: float = 1e-9,
+                 optimality_tol: float = 1e-9, refactor_interval: int = 50, stall_limit: int = 50, lowest_index: bool = False,
+                 max_iterations: Optional[int] = None, deadline: Optional[float] = None, cancel_token: Optional[CancelToken] = None):
+        if np is None:
+            raise ValueError("Для движка 'revised' требуется numpy")
+        if canonical_form.upper_bounds is not None:
+            raise ValueError("Движок не поддерживает границы переменных в таблице, используйте строки ограничений")
+        self.canonical_form = canonical_form
+        self.pivot_tol = pivot_tol
+        self.feasibility_tol = feasibility_tol
+        self.optimality_tol = optimality_tol
+        self.refactor_interval = refactor_interval
+        self.stall_limit = stall_limit
+        self.lowest_index = lowest_index
+        self.max_iterations = max_iterations
+        self.deadline = deadline
+        self.cancel_token = cancel_token
+
+        self.rows = len(canonical_form.restriction_matrix)
+        self.cols = len(canonical_form.goal_factors)
+        self.b = np.array([cell.to_float() for cell in canonical_form.shifted_right_sides()], dtype=np.float64)
+        self.c = np.array([cell.to_float() for cell in canonical_form.goal_factors], dtype=np.float64)
+        self.offset = canonical_form.shifted_goal_offset().to_float()
+        self.build_columns(canonical_form.restriction_matrix)
+
+        self.base_indices: List[int] = []
+        self.x_basic = np.zeros(self.rows)
+        self.factor: Optional[BasisFactor] = None
+        self.iterations = 0
+        self.status: Optional[SolveStatus] = None
+        self.solution: List[float] = []
+        self.objective = 0.0
+
+    def build_columns(self, restriction_matrix: List[SparseRow]) -> None:
+        signs = np.where(self.b < 0, -1.0, 1.0)
+        self.b *= signs
+        entries = [(j, i, cell.to_float()) for i, row in enumerate(restriction_matrix) for j, cell in row.items()]
+        entries.sort()
+        self.entry_cols = np.array([e[0] for e in entries], dtype=np.int64)
+        self.entry_rows = np.array([e[1] for e in entries], dtype=np.int64)
+        self.entry_values = np.array([e[2] for e in entries], dtype=np.float64) * signs[self.entry_rows]
+        self.col_starts = np.searchsorted(self.entry_cols, np.arange(self.cols + 1))
+
+    def column(self, j: int) -> 'np.ndarray':
+        vector = np.zeros(self.rows)
+        if j >= self.cols:
+            vector[j - self.cols] = 1.0
+        else:
+            start, end = self.col_starts[j], self.col_starts[j + 1]
+            vector[self.entry_rows[start:end]] = self.entry_values[start:end]
+        return vector
+
+    def price(self, y: 'np.ndarray') -> 'np.ndarray':
+        return np.bincount(self.entry_cols, weights=self.entry_values * y[self.entry_rows], minlength=self.cols)
+
+    def refactor(self) -> None:
+        basis = np.zeros((self.rows, self.rows))
+        for k, j in enumerate(self.base_indices):
+            basis[:, k] = self.column(j)
+        self.factor = BasisFactor(basis)
+        self.x_basic = self.factor.ftran(self.b)
+
+    def initial_base(self) -> List[int]:
+        base = [-1] * self.rows
+        counts = np.diff(self.col_starts)
+        for j in np.flatnonzero(counts == 1):
+            start = self.col_starts[j]
+            i = int(self.entry_rows[start])
+            if base[i] == -1 and self.entry_values[start] > 0:
+                base[i] = int(j)
+        return [j if j != -1 else self.cols + i for i, j in enumerate(base)]
+
+    def iterate(self, costs: 'np.ndarray', allowed: int) -> SolveStatus:
+        # Как и в табличных движках, при застое целевой функции выбор переключается на правило Бленда
+        lowest_index = self.lowest_index
+        stalled = 0
+        objective = float(costs[self.base_indices] @ self.x_basic)
+        while True:
+            if self.factor is None or len(self.factor.etas) >= self.refactor_interval:
+                self.refactor()
+            y = self.factor.btran(costs[self.base_indices])
+            reduced = np.full(allowed, -np.inf)
+            reduced[:self.cols] = costs[:self.cols] - self.price(y)
+            if allowed > self.cols:
+                reduced[self.cols:] = costs[self.cols:allowed] - y[:allowed - self.cols]
+            reduced[[j for j in self.base_indices if j < allowed]] = -np.inf
+            if lowest_index:
+                candidates = np.flatnonzero(reduced > self.optimality_tol)
+                if candidates.size == 0:
+                    return SolveStatus.OPTIMAL
+                incoming = int(candidates[0])
+            else:
+                incoming = int(np.argmax(reduced))
+                if reduced[incoming] <= self.optimality_tol:
+                    return SolveStatus.OPTIMAL
+            stop_status = limit_status(self.iterations, self.max_iterations, self.deadline, self.cancel_token)
+            if stop_status is not None:
+                return stop_status
+
+            w = self.factor.ftran(self.column(incoming))
+            eligible = w > self.pivot_tol
+            if not eligible.any():
+                return SolveStatus.UNBOUNDED
+            ratios = np.full(self.rows, np.inf)
+            np.divide(np.maximum(self.x_basic, 0.0), w, out=ratios, where=eligible)
+            outgoing = int(np.argmin(ratios))
+            if lowest_index:
+                ties = np.flatnonzero(ratios <= ratios[outgoing] + self.pivot_tol)
+                outgoing = int(ties[np.argmin(np.array(self.base_indices)[ties])])
+            theta = ratios[outgoing]
+
+            self.x_basic -= theta * w
+            self.x_basic[outgoing] = theta
+            self.base_indices[outgoing] = incoming
+            self.factor.update(outgoing, w)
+            self.iterations += 1
+
+            previous, objective = objective, float(costs[self.base_indices] @ self.x_basic)
+            if objective > previous + self.optimality_tol:
+                stalled = 0
+                lowest_index = self.lowest_index
+                continue
+            stalled += 1
+            if stalled >= self.stall_limit:
+                lowest_index = True
+
+    def solve(self) -> SolveStatus:
+        self.base_indices = self.initial_base()
+        artificial_count = self.rows
+        self.factor = None
+        if any(j >= self.cols for j in self.base_indices):
+            phase_costs = np.concatenate([np.zeros(self.cols), -np.ones(artificial_count)])
+            status = self.iterate(phase_costs, self.cols + artificial_count)
+            if status in LIMIT_MESSAGES:
+                self.status = status
+                return self.status
+            if phase_costs[self.base_indices] @ self.x_basic < -self.feasibility_tol:
+                self.status = SolveStatus.INFEASIBLE
+                return self.status
+            self.drive_out_artificials()
+
+        costs = np.concatenate([self.c, np.zeros(artificial_count)])
+        self.status = self.iterate(costs, self.cols)
+        x = np.zeros(self.cols + artificial_count)
+        x[self.base_indices] = self.x_basic
+        self.solution = x[:self.cols].tolist()
+        self.objective = float(self.c @ x[:self.cols]) + self.offset
+        return self.status
+
+    def drive_out_artificials(self) -> None:
+        for r, j in enumerate(self.base_indices):
+            if j < self.cols:
+                continue
+            unit = np.zeros(self.rows)
+            unit[r] = 1.0
+            row = self.price(self.factor.btran(unit))
+            row[[k for k in self.base_indices if k < self.cols]] = 0.0
+            candidates = np.flatnonzero(np.abs(row) > self.pivot_tol)
+            if candidates.size == 0:
+                continue
+            incoming = int(candidates[0])
+            w = self.factor.ftran(self.column(incoming))
+            theta = self.x_basic[r] / w[r]
+            self.x_basic -= theta * w
+            self.x_basic[r] = theta
+            self.base_indices[r] = incoming
+            self.factor.update(r, w)
+
+    def to_table(self, tracer: Tracer = SILENT_TRACER) -> LinearTable:
+        # Базис без искусственных переменных допустим и после остановки по пределу или неограниченности
+        if self.status == SolveStatus.INFEASIBLE or any(j >= self.cols for j in self.base_indices):
+            return LinearTable(self.canonical_form, tracer=tracer)
+        return LinearTable(self.canonical_form, base_indices=self.base_indices, tracer=tracer)
+
+
+class RevisedOptimizer(LinearOptimizer):
+    native_bounds = False
+
+    def __init__(self, tracer: Tracer = SILENT_TRACER, mode: str = 'auto', pricing: str | PricingRule = 'dantzig', stall_limit: int = 50,
+                 max_iterations: Optional[int] = None, deadline: Optional[float] = None, cancel_token: Optional[CancelToken] = None,
+                 pivot_tol: float = 1e-9, feasibility_tol: float = 1e-9, optimality_tol: float = 1e-9, refactor_interval: int = 50):
+        if np is None:
+            raise ValueError("Для движка 'revised' требуется numpy")
+        super().__init__(tracer, mode, pricing, stall_limit, max_iterations, deadline, cancel_token)
+        self.pivot_tol = pivot_tol
+        self.feasibility_tol = feasibility_tol
+        self.optimality_tol = optimality_tol
+        self.refactor_interval = refactor_interval
+        self.revised_iterations = 0
+
+    def build_table(self, canonical_form: CanonicalForm, basis_method: str = 'auto') -> LinearTable:
+        # Базис ищется модифицированным симплекс-методом в вещественной арифметике, затем таблица
+        # строится точно и табличный метод подтверждает оптимальность или доводит решение
+        solver = RevisedSimplex(canonical_form, self.pivot_tol, self.feasibility_tol, self.optimality_tol, self.refactor_interval,
+                                self.stall_limit, self.pricing.lowest_index, self.max_iterations, self.deadline, self.cancel_token)
+        status = solver.solve()
+        self.revised_iterations = solver.iterations
+        self.tracer.message(TraceLevel.SUMMARY, f"\nМодифицированный симплекс-метод: итераций {solver.iterations}")
+        if status == SolveStatus.INFEASIBLE:
+            raise ValueError("Нет допустимого решения: система ограничений несовместна")
+        try:
+            table = solver.to_table(self.tracer)
+        except ValueError:
+            table = None
+        if table is None or not (self.is_primal_feasible(table) or self.is_optimized(table)):
+            self.tracer.message(TraceLevel.SUMMARY, "Базис модифицированного метода не подтверждён, базис выбирается обычным способом")
+            table = super().build_table(canonical_form, basis_method)
+        return table
+
+    def check_limits(self, iterations: int) -> Optional[SolveStatus]:
+        # Итерации модифицированного метода входят в общий предел, после его остановки таблица не продолжает решение
+        return super().check_limits(iterations + self.revised_iterations)
+
+    def solve_table(self, table: LinearTable) -> SolveStatus:
+        status = super().solve_table(table)
+        self.iterations += self.revised_iterations
+        self.revised_iterations = 0
+        return status
+
+
+LinearOptimizer.engines = {
+    'rational': LinearOptimizer,
+    'integer': IntegerOptimizer,
+    'float': FloatOptimizer,
+    'hybrid': HybridOptimizer,
+    'interior': InteriorPointOptimizer,
+    'revised': RevisedOptimizer,
+}
+
+
+class NetworkStructure:
+    reversed_kinds = {RestrictionType.BELOW: RestrictionType.ABOVE, RestrictionType.ABOVE: RestrictionType.BELOW,
+                      RestrictionType.EQUALS: RestrictionType.EQUALS}
+
+    def __init__(self, problem: LinearProblem):
+        self.problem = problem
+        self.num_vars = FormTransformer.count_original_vars(problem)
+        self.sources: List[int] = []
+        self.sinks: List[int] = []
+        # Переменная j — дуга из строки-источника в строку-сток
+        self.arcs: List[tuple[int, int]] = []
+        self.lower: List[RationalNumber] = []
+        self.upper: List[Optional[RationalNumber]] = []
+        self.costs: List[RationalNumber] = []
+
+    @classmethod
+    def detect(cls, problem: LinearProblem) -> Optional['NetworkStructure']:
+        structure = cls(problem)
+        return structure if structure.analyze() else None
+
+    def analyze(self) -> bool:
+        # Каждый столбец должен входить ровно в две строки с коэффициентом 1 (или -1 во всей строке),
+        # а строки должны делиться на две доли: источники и стоки
+        problem = self.problem
+        restrictions = problem.restrictions
+        if not restrictions or self.num_vars == 0:
+            return False
+        if any(lower is None or lower.top != 0 or upper is not None for lower, upper in problem.bounds.values()):
+            return False
+        rows_of: List[List[int]] = [[] for _ in range(self.num_vars)]
+        for i, limit in enumerate(restrictions):
+            values = set(limit.factors.entries.values())
+            if values == {RationalNumber.UNITY}:
+                kind, right_side = limit.kind, limit.right_side
+            elif values == {RationalNumber.NEGATIVE_UNITY}:
+                kind, right_side = self.reversed_kinds[limit.kind], limit.right_side.invert()
+            else:
+                return False
+            # Целочисленность решения гарантируется только при целых правых частях
+            if right_side.top < 0 or (problem.integers and right_side.bottom != 1):
+                return False
+            self.lower.append(RationalNumber.NULL if kind == RestrictionType.BELOW else right_side)
+            self.upper.append(None if kind == RestrictionType.ABOVE else right_side)
+            for j in limit.factors.entries:
+                rows_of[j].append(i)
+        if any(len(rows) != 2 for rows in rows_of):
+            return False
+
+        neighbours: List[List[int]] = [[] for _ in restrictions]
+        for first, second in rows_of:
+            neighbours[first].append(second)
+            neighbours[second].append(first)
+        side: List[Optional[int]] = [None] * len(restrictions)
+        for start in range(len(restrictions)):
+            if side[start] is not None:
+                continue
+            side[start] = 0
+            component, stack = [start], [start]
+            while stack:
+                row = stack.pop()
+                for other in neighbours[row]:
+                    if side[other] is None:
+                        side[other] = 1 - side[row]
+                        component.append(other)
+                        stack.append(other)
+                    elif side[other] == side[row]:
+                        return False
+            if not self.close_upper_bounds(component, side):
+                return False
 
-    def get_solution(self, table: LinearTable) -> List[RationalNumber]:
-        num_vars = len(table.matrix[0]) - 1
-        solution = [RationalNumber.NULL] * num_vars
-        for i in range(1, len(table.matrix)):
-            var_index = table.base_indices[i - 1]
-            solution[var_index] = table.matrix[i][-1]
-        return solution
+        self.sources = [i for i, part in enumerate(side) if part == 0]
+        self.sinks = [i for i, part in enumerate(side) if part == 1]
+        self.arcs = [(first, second) if side[first] == 0 else (second, first) for first, second in rows_of]
+        goal = problem.goal
+        self.costs = [goal.factors[j].invert() if goal.maximize else goal.factors[j] for j in range(self.num_vars)]
+        return True
+
+    def close_upper_bounds(self, component: List[int], side: List[Optional[int]]) -> bool:
+        # Поток через строку не больше суммы верхних границ другой доли той же компоненты
+        open_parts = {side[row] for row in component if self.upper[row] is None}
+        if len(open_parts) == 2:
+            return False
+        for part in open_parts:
+            total = RationalNumber.NULL
+            for row in component:
+                if side[row] != part:
+                    total = total.sum(self.upper[row])
+            for row in component:
+                if side[row] == part and self.upper[row] is None:
+                    self.upper[row] = total
+        return True
+
+    @property
+    def is_assignment(self) -> bool:
+        size = len(self.sources)
+        return (size == len(self.sinks) and self.num_vars == size * size and len(set(self.arcs)) == self.num_vars
+                and all(low.is_equal(RationalNumber.UNITY) and high.is_equal(RationalNumber.UNITY) for low, high in zip(self.lower, self.upper)))
+
+    def create_solver(self, **limits) -> 'NetworkSolver':
+        return HungarianMethod(self, **limits) if self.is_assignment else NetworkSimplex(self, **limits)
+
+    def objective(self, solution: List[RationalNumber]) -> RationalNumber:
+        goal = self.problem.goal
+        value = goal.offset
+        for j, x in enumerate(solution):
+            if x.top != 0:
+                value = value.sum(goal.factors[j].product(x))
+        return value
+
+    def integer_costs(self) -> List[int]:
+        scale = lcm(*(cost.bottom for cost in self.costs))
+        return [cost.top * (scale // cost.bottom) for cost in self.costs]
+
+
+class NetworkSolver:
+    def __init__(self, structure: NetworkStructure, max_iterations: Optional[int] = None, deadline: Optional[float] = None,
+                 cancel_token: Optional[CancelToken] = None):
+        self.structure = structure
+        self.max_iterations = max_iterations
+        self.deadline = deadline
+        self.cancel_token = cancel_token
+        self.iterations = 0
+        self.status: Optional[SolveStatus] = None
+        self.solution: List[RationalNumber] = []
+
+    def check_limits(self, iterations: int) -> Optional[SolveStatus]:
+        return limit_status(iterations, self.max_iterations, self.deadline, self.cancel_token)
+
+    def solve(self) -> SolveStatus:
+        raise NotImplementedError
+
+
+class HungarianMethod(NetworkSolver):
+    def solve(self) -> SolveStatus:
+        # Венгерский метод с потенциалами, O(n^3) в целых числах
+        structure = self.structure
+        size = len(structure.sources)
+        source_index = {row: i for i, row in enumerate(structure.sources, 1)}
+        sink_index = {row: j for j, row in enumerate(structure.sinks, 1)}
+        costs = structure.integer_costs()
+        matrix = [[0] * (size + 1) for _ in range(size + 1)]
+        variables = [[0] * (size + 1) for _ in range(size + 1)]
+        for var, (source, sink) in enumerate(structure.arcs):
+            i, j = source_index[source], sink_index[sink]
+            matrix[i][j] = costs[var]
+            variables[i][j] = var
+
+        u, v = [0] * (size + 1), [0] * (size + 1)
+        owner, way = [0] * (size + 1), [0] * (size + 1)
+        for i in range(1, size + 1):
+            self.status = self.check_limits(self.iterations)
+            if self.status is not None:
+                return self.status
+            owner[0] = i
+            column = 0
+            reduced: List[Optional[int]] = [None] * (size + 1)
+            used = [False] * (size + 1)
+            while True:
+                used[column] = True
+                row = owner[column]
+                delta, target = None, 0
+                for j in range(1, size + 1):
+                    if used[j]:
+                        continue
+                    current = matrix[row][j] - u[row] - v[j]
+                    if reduced[j] is None or current < reduced[j]:
+                        reduced[j] = current
+                        way[j] = column
+                    if delta is None or reduced[j] < delta:
+                        delta, target = reduced[j], j
+                for j in range(size + 1):
+                    if used[j]:
+                        u[owner[j]] += delta
+                        v[j] -= delta
+                    else:
+                        reduced[j] -= delta
+                column = target
+                if owner[column] == 0:
+                    break
+            while column:
+                previous = way[column]
+                owner[column] = owner[previous]
+                column = previous
+            self.iterations += 1
+
+        self.solution = [RationalNumber.NULL] * structure.num_vars
+        for j in range(1, size + 1):
+            self.solution[variables[owner[j]][j]] = RationalNumber.UNITY
+        self.status = SolveStatus.OPTIMAL
+        return self.status
+
+
+class NetworkSimplex(NetworkSolver):
+    def solve(self) -> SolveStatus:
+        structure = self.structure
+        if any(high.order(low) < 0 for low, high in zip(structure.lower, structure.upper)):
+            self.status = SolveStatus.INFEASIBLE
+            return self.status
+        sources = set(structure.sources)
+        scale = lcm(*(value.bottom for value in structure.lower + structure.upper))
+        lower = [value.top * (scale // value.bottom) for value in structure.lower]
+        upper = [value.top * (scale // value.bottom) for value in structure.upper]
+
+        # Строка с границами [l, u] становится узлом с запасом l и вспомогательным узлом с запасом u - l;
+        # избыток источников уходит в узел D, недостаток стоков покрывается из узла E через дугу E -> D
+        supply: List[int] = []
+        tails, heads, costs = [], [], []
+        node = {}
+        for row in structure.sources + structure.sinks:
+            node[row] = len(supply)
+            supply.append(lower[row] if row in sources else -lower[row])
+        for (source, sink), cost in zip(structure.arcs, structure.integer_costs()):
+            tails.append(node[source])
+            heads.append(node[sink])
+            costs.append(cost)
+        spare_source, spare_sink = len(supply), len(supply) + 1
+        supply += [sum(upper[row] for row in structure.sinks), -sum(upper[row] for row in structure.sources)]
+        for row in structure.sources + structure.sinks:
+            if upper[row] == lower[row]:
+                continue
+            extra = len(supply)
+            if row in sources:
+                supply.append(upper[row] - lower[row])
+                tails += [extra, extra]
+                heads += [node[row], spare_sink]
+            else:
+                supply.append(lower[row] - upper[row])
+                tails += [node[row], spare_source]
+                heads += [extra, extra]
+            costs += [0, 0]
+        tails.append(spare_source)
+        heads.append(spare_sink)
+        costs.append(0)
+
+        flows = self.run(supply, tails, heads, costs)
+        if flows is None:
+            return self.status
+        self.solution = [RationalNumber(flow, scale) for flow in flows[:structure.num_vars]]
+        return self.status
+
+    def run(self, supply: List[int], tails: List[int], heads: List[int], costs: List[int]) -> Optional[List[int]]:
+        # Сетевой симплекс-метод с искусственным корнем и сильно допустимыми деревьями (правило Каннингема)
+        nodes, real = len(supply), len(tails)
+        root = nodes
+        total = sum(value for value in supply if value > 0)
+        # Любой поток без искусственных дуг дешевле потока хотя бы с одной единицей на них
+        big = 2 * real * max(1, max(map(abs, costs), default=0)) * max(1, total) + 1
+        tails, heads, costs = list(tails), list(heads), list(costs)
+        flow = [0] * real
+        for v in range(nodes):
+            if supply[v] > 0:
+                tails.append(v)
+                heads.append(root)
+            else:
+                tails.append(root)
+                heads.append(v)
+            costs.append(big)
+            flow.append(abs(supply[v]))
+        parent = [root] * nodes + [-1]
+        parent_arc = list(range(real, real + nodes)) + [-1]
+        depth = [1] * nodes + [0]
+        potential = [big if supply[v] > 0 else -big for v in range(nodes)] + [0]
+        children: List[set[int]] = [set() for _ in range(nodes)] + [set(range(nodes))]
+
+        block = max(1, int(real ** 0.5))
+        position = 0
+        while True:
+            entering, best, scanned, k = -1, 0, 0, position
+            while scanned < real:
+                value = costs[k] - potential[tails[k]] + potential[heads[k]]
+                if value < best:
+                    entering, best = k, value
+                k = k + 1 if k + 1 < real else 0
+                scanned += 1
+                if entering != -1 and scanned % block == 0:
+                    break
+            position = k
+            if entering == -1:
+                break
+            self.status = self.check_limits(self.iterations)
+            if self.status is not None:
+                return None
+
+            p, q = tails[entering], heads[entering]
+            a, b = p, q
+            while a != b:
+                if depth[a] >= depth[b]:
+                    a = parent[a]
+                else:
+                    b = parent[b]
+            apex = a
+            path_p, path_q = [], []
+            v = p
+            while v != apex:
+                path_p.append(v)
+                v = parent[v]
+            v = q
+            while v != apex:
+                path_q.append(v)
+                v = parent[v]
+
+            # Уходит последняя блокирующая дуга при обходе цикла от вершины по направлению потока
+            delta, leaving, on_p_side = None, -1, False
+            for v in reversed(path_p):
+                arc = parent_arc[v]
+                if tails[arc] != parent[v] and (delta is None or flow[arc] <= delta):
+                    delta, leaving, on_p_side = flow[arc], v, True
+            for v in path_q:
+                arc = parent_arc[v]
+                if tails[arc] != v and (delta is None or flow[arc] <= delta):
+                    delta, leaving, on_p_side = flow[arc], v, False
+            if delta is None:
+                self.status = SolveStatus.UNBOUNDED
+                return None
+
+            if delta:
+                flow[entering] += delta
+                for v in path_p:
+                    arc = parent_arc[v]
+                    flow[arc] += delta if tails[arc] == parent[v] else -delta
+                for v in path_q:
+                    arc = parent_arc[v]
+                    flow[arc] += delta if tails[arc] == v else -delta
+
+            near, far = (p, q) if on_p_side else (q, p)
+            path = [near]
+            while path[-1] != leaving:
+                path.append(parent[path[-1]])
+            old_arcs = [parent_arc[v] for v in path]
+            for v in path:
+                children[parent[v]].discard(v)
+            parent[near], parent_arc[near] = far, entering
+            for k in range(1, len(path)):
+                parent[path[k]], parent_arc[path[k]] = path[k - 1], old_arcs[k - 1]
+            for v in path:
+                children[parent[v]].add(v)
+
+            stack = [near]
+            while stack:
+                v = stack.pop()
+                w, arc = parent[v], parent_arc[v]
+                depth[v] = depth[w] + 1
+                potential[v] = potential[w] - costs[arc] if heads[arc] == v else potential[w] + costs[arc]
+                stack.extend(children[v])
+            self.iterations += 1
+
+        if any(flow[real:]):
+            self.status = SolveStatus.INFEASIBLE
+            return None
+        self.status = SolveStatus.OPTIMAL
+        return flow[:real]
 
 
 class MatrixSolver:
-    logging_enabled = True
+    BIG_M_FACTOR = 10 ** 6
 
     @classmethod
-    def log(cls, msg: str = "") -> None:
-        if cls.logging_enabled:
-            print(msg)
+    def log(cls, msg: str = "", tracer: Tracer = SILENT_TRACER, level: TraceLevel = TraceLevel.SUMMARY) -> None:
+        tracer.message(level, msg)
 
     @classmethod
     def binomial_coefficient(cls, n: int, k: int) -> int:
@@ -392,44 +2774,44 @@ class MatrixSolver:
         return numerator // denominator
 
     @classmethod
-    def transform_for_base(cls, matrix: List[List[RationalNumber]], base: List[int]) -> List[List[RationalNumber]]:
+    def transform_for_base(cls, matrix: List[SparseRow], base: List[int], tracer: Tracer = SILENT_TRACER,
+                           pivoting: bool = False) -> List[SparseRow]:
         matrix_copy = cls.duplicate_matrix(matrix)
         for i in range(len(matrix)):
             base_col = base[i]
+            if pivoting and matrix_copy[i][base_col].top == 0:
+                swap = next((k for k in range(i + 1, len(matrix)) if matrix_copy[k][base_col].top != 0), -1)
+                if swap != -1:
+                    matrix_copy[i], matrix_copy[swap] = matrix_copy[swap], matrix_copy[i]
             pivot = matrix_copy[i][base_col]
             if pivot.is_equal(RationalNumber.NULL):
-                cls.log("Нулевой поворот, пропуск базиса")
-                cls.display_matrix(matrix_copy)
+                cls.display_matrix(matrix_copy, tracer, "Нулевой поворот, пропуск базиса")
                 raise ValueError("Нулевой поворот")
-            for j in range(len(matrix_copy[i])):
-                matrix_copy[i][j] = matrix_copy[i][j].quotient(pivot)
+            matrix_copy[i].divide(pivot)
             for k in range(len(matrix)):
-                if k != i:
-                    factor = matrix_copy[k][base_col]
-                    for j in range(len(matrix_copy[k])):
-                        matrix_copy[k][j] = matrix_copy[k][j].difference(
-                            factor.product(matrix_copy[i][j])
-                        )
+                factor = matrix_copy[k][base_col]
+                if k != i and factor.top != 0:
+                    matrix_copy[k].subtract_multiple(factor, matrix_copy[i])
         return matrix_copy
 
     @classmethod
-    def find_optimal_base(cls, matrix: List[List[RationalNumber]]) -> List[int]:
+    def find_optimal_base(cls, matrix: List[List[RationalNumber]], tracer: Tracer = SILENT_TRACER) -> List[int]:
         rows = len(matrix)
         cols = len(matrix[0]) - 1
-        cls.log(f"\nФормула количества комбинаций: C({cols}, {rows}) = {cols}! / ({rows}! * ({cols}-{rows})!)")
+        cls.log(f"\nФормула количества комбинаций: C({cols}, {rows}) = {cols}! / ({rows}! * ({cols}-{rows})!)", tracer)
         all_combinations = cls.get_subsets(cols, rows)
-        cls.log(f"Все возможные комбинации: {len(all_combinations)}")
+        cls.log(f"Все возможные комбинации: {len(all_combinations)}", tracer)
 
         best_base = None
         min_negative_rhs = float('inf')
         max_zeros = -1
 
         for base in all_combinations:
-            cls.log(f"\nПроверка базиса: {base}")
+            cls.log(f"\nПроверка базиса: {base}", tracer, TraceLevel.ITERATION)
             negative_count = 0
             zero_count = 0
             try:
-                matrix_copy = cls.transform_for_base(matrix, base)
+                matrix_copy = cls.transform_for_base(matrix, base, tracer)
                 for i in range(rows):
                     rhs = matrix_copy[i][cols]
                     if rhs.order(RationalNumber.NULL) < 0:
@@ -437,60 +2819,171 @@ class MatrixSolver:
                     elif rhs.is_equal(RationalNumber.NULL):
                         zero_count += 1
 
-                cls.log(f"Результат проверки базиса {base}:")
-                cls.log(f"Отрицательных правых частей: {negative_count}")
-                cls.display_matrix(matrix_copy)
+                cls.log(f"Результат проверки базиса {base}:", tracer, TraceLevel.ITERATION)
+                cls.log(f"Отрицательных правых частей: {negative_count}", tracer, TraceLevel.ITERATION)
+                cls.display_matrix(matrix_copy, tracer)
 
                 if negative_count == 0:
-                    cls.log(f"Базис подходит: {base} (нет отрицательных правых частей)")
+                    cls.log(f"Базис подходит: {base} (нет отрицательных правых частей)", tracer)
                     return base
                 elif negative_count < min_negative_rhs or (negative_count == min_negative_rhs and zero_count > max_zeros):
                     best_base = list(base)
                     min_negative_rhs = negative_count
                     max_zeros = zero_count
                 else:
-                    cls.log(f"Базис не лучше текущего лучшего: {base}")
+                    cls.log(f"Базис не лучше текущего лучшего: {base}", tracer, TraceLevel.ITERATION)
             except ValueError as e:
-                cls.log(f"Ошибка при проверке базиса {base}: {str(e)}")
+                cls.log(f"Ошибка при проверке базиса {base}: {str(e)}", tracer, TraceLevel.ITERATION)
                 continue
 
         if best_base is not None:
-            cls.log(f"\nЛучший найденный базис: {best_base} (не идеальный, но с минимальными отрицательными: {min_negative_rhs}, нули: {max_zeros})")
+            cls.log(f"\nЛучший найденный базис: {best_base} (не идеальный, но с минимальными отрицательными: {min_negative_rhs}, нули: {max_zeros})", tracer)
             return best_base
         else:
-            cls.log("\nНи один базис не подошел")
-            cls.display_matrix(matrix)
+            cls.display_matrix(matrix, tracer, "\nНи один базис не подошел", TraceLevel.SUMMARY)
             raise ValueError("Базис не найден")
 
     @classmethod
-    def display_matrix(cls, matrix: List[List[RationalNumber]]) -> None:
+    def find_unit_columns(cls, matrix: List[SparseRow], positive_only: bool = True) -> List[int]:
+        cols = len(matrix[0]) - 1
+        owners: Dict[int, int] = {}
+        for i, row in enumerate(matrix):
+            for j in row.entries:
+                if j < cols:
+                    owners[j] = -1 if j in owners else i
+        unit_columns = [-1] * len(matrix)
+        for j in sorted(owners):
+            i = owners[j]
+            if i != -1 and unit_columns[i] == -1 and (not positive_only or matrix[i][j].order(RationalNumber.NULL) > 0):
+                unit_columns[i] = j
+        return unit_columns
+
+    @classmethod
+    def find_dual_base(cls, matrix: List[SparseRow], z_row: SparseRow) -> Optional[tuple[List[int], List[SparseRow]]]:
+        base = cls.find_unit_columns(matrix, positive_only=False)
+        if -1 in base:
+            return None
+        work = [row.copy() for row in matrix]
+        priced = z_row.copy()
+        for i, base_col in enumerate(base):
+            if not work[i][base_col].is_equal(RationalNumber.UNITY):
+                work[i].divide(work[i][base_col])
+            factor = priced[base_col]
+            if factor.top != 0:
+                priced.subtract_multiple(factor, work[i])
+        cols = len(matrix[0]) - 1
+        if any(j < cols and value.top < 0 for j, value in priced.items()):
+            return None
+        return base, work
+
+    @classmethod
+    def find_feasible_base(cls, matrix: List[SparseRow], z_row: Optional[SparseRow] = None,
+                           tracer: Tracer = SILENT_TRACER) -> tuple[List[int], List[SparseRow]]:
+        cols = len(matrix[0]) - 1
+        work = [row.negated() if row[cols].order(RationalNumber.NULL) < 0 else row.copy() for row in matrix]
+        base = cls.find_unit_columns(work)
+        for i, base_col in enumerate(base):
+            if base_col != -1 and not work[i][base_col].is_equal(RationalNumber.UNITY):
+                work[i].divide(work[i][base_col])
+
+        artificial_rows = [i for i, base_col in enumerate(base) if base_col == -1]
+        cls.log(f"\nФаза I: искусственных переменных {len(artificial_rows)}", tracer)
+        if not artificial_rows:
+            return base, work
+
+        width = cols + len(artificial_rows) + 1
+        for k, i in enumerate(artificial_rows):
+            base[i] = cols + k
+        for i, row in enumerate(work):
+            right_side = row[cols]
+            row.resize(cols)
+            if base[i] >= cols:
+                row[base[i]] = RationalNumber.UNITY
+            row[width - 1] = right_side
+
+        goal = SparseRow(width)
+        if z_row is None:
+            for k in range(len(artificial_rows)):
+                goal[cols + k] = RationalNumber.UNITY
+        else:
+            penalty = cls.big_m(z_row)
+            for j, value in z_row.items():
+                goal[j if j < cols else width - 1] = value
+            for k in range(len(artificial_rows)):
+                goal[cols + k] = penalty
+        optimizer = LinearOptimizer()
+        table = LinearTable.assemble([goal] + work, base)
+        table.price_out_basis()
+        if not optimizer.run(table):
+            cls.log("Задача с большим M не ограничена, переход к фазе I", tracer)
+            return cls.find_feasible_base(matrix, tracer=tracer)
+
+        for i, base_col in enumerate(table.base_indices):
+            if base_col >= cols and table.matrix[i + 1][-1].order(RationalNumber.NULL) > 0:
+                raise ValueError("Система ограничений несовместна")
+
+        redundant_rows = set()
+        for i, base_col in enumerate(table.base_indices):
+            if base_col < cols:
+                continue
+            row = table.matrix[i + 1]
+            pivot_col = min((j for j in row.entries if j < cols), default=-1)
+            if pivot_col == -1:
+                redundant_rows.add(i)
+            else:
+                optimizer.transform(table, i + 1, pivot_col)
+        if redundant_rows:
+            cls.log(f"Удалены линейно зависимые ограничения: {sorted(i + 1 for i in redundant_rows)}", tracer)
+
+        result_base = [base_col for i, base_col in enumerate(table.base_indices) if i not in redundant_rows]
+        result_rows = []
+        for i, row in enumerate(table.matrix[1:]):
+            if i in redundant_rows:
+                continue
+            right_side = row[-1]
+            row.resize(cols)
+            row.append(right_side)
+            result_rows.append(row)
+        cls.log(f"Фаза I завершена, базис: {result_base}", tracer)
+        return result_base, result_rows
+
+    @classmethod
+    def big_m(cls, z_row: SparseRow) -> RationalNumber:
+        largest = RationalNumber.UNITY
+        for j, cell in z_row.items():
+            if j < len(z_row) - 1 and cell.absolute().order(largest) > 0:
+                largest = cell.absolute()
+        return largest.product(RationalNumber(cls.BIG_M_FACTOR))
+
+    @classmethod
+    def format_matrix(cls, matrix: List[List[RationalNumber]]) -> str:
         if not matrix:
-            cls.log("| |")
-            cls.log(" - ")
-            return
+            return "| |\n - "
 
         col_widths = [0] * len(matrix[0])
         for row in matrix:
             for j, cell in enumerate(row):
                 col_widths[j] = max(col_widths[j], len(str(cell)))
 
-        top_border = "┌" + "─".join("─" * (width + 2) for width in col_widths) + "┐"
-        cls.log(top_border)
-
+        lines = ["┌" + "─".join("─" * (width + 2) for width in col_widths) + "┐"]
         for row in matrix:
             cells = [f" {str(cell):<{width}} " for cell, width in zip(row, col_widths)]
-            cls.log("│" + "│".join(cells) + "│")
+            lines.append("│" + "│".join(cells) + "│")
+        lines.append("└" + "─".join("─" * (width + 2) for width in col_widths) + "┘")
+        return "\n".join(lines)
 
-        bottom_border = "└" + "─".join("─" * (width + 2) for width in col_widths) + "┘"
-        cls.log(bottom_border)
+    @classmethod
+    def display_matrix(cls, matrix: List[List[RationalNumber]], tracer: Tracer = SILENT_TRACER, title: Optional[str] = None,
+                       level: TraceLevel = TraceLevel.ROW_OP) -> None:
+        tracer.emit(level, 'matrix', title=title, matrix=matrix)
 
     @classmethod
-    def gauss_jordan(cls, matrix: List[List[RationalNumber]]) -> None:
+    def gauss_jordan(cls, matrix: List[List[RationalNumber]], tracer: Tracer = SILENT_TRACER) -> None:
         row_count = len(matrix)
         col_count = len(matrix[0])
+        trace_rows = tracer.level >= TraceLevel.ROW_OP
 
-        cls.log("Стартовая матрица:\n")
-        cls.display_matrix(matrix)
+        cls.display_matrix(matrix, tracer, "Стартовая матрица:\n")
 
         n = 0
         for m in range(col_count - 1):
@@ -504,148 +2997,1083 @@ class MatrixSolver:
                 continue
 
             matrix[n], matrix[pivot_row] = matrix[pivot_row], matrix[n]
-            cls.log(f"\nЗамена местами строк {cls.get_roman(n + 1)} и {cls.get_roman(pivot_row + 1)}\n")
-            cls.display_matrix(matrix)
+            if trace_rows:
+                cls.display_matrix(matrix, tracer, f"\nЗамена местами строк {cls.get_roman(n + 1)} и {cls.get_roman(pivot_row + 1)}\n")
 
             pivot = matrix[n][m]
             for j in range(col_count):
                 matrix[n][j] = matrix[n][j].quotient(pivot)
-            cls.log(f"\nПосле нормализации строки {cls.get_roman(n + 1)}:\n")
-            cls.display_matrix(matrix)
+            if trace_rows:
+                cls.display_matrix(matrix, tracer, f"\nПосле нормализации строки {cls.get_roman(n + 1)}:\n")
 
             for i in range(row_count):
                 if i != n:
                     factor = matrix[i][m]
                     for j in range(col_count):
                         matrix[i][j] = matrix[i][j].difference(factor.product(matrix[n][j]))
-                    cls.log(f"\n{cls.get_roman(i + 1)} - ({factor}) * {cls.get_roman(n + 1)}\n")
-                    cls.display_matrix(matrix)
+                    if trace_rows:
+                        cls.display_matrix(matrix, tracer, f"\n{cls.get_roman(i + 1)} - ({factor}) * {cls.get_roman(n + 1)}\n")
 
             n += 1
 
-        cls.log("\nРезультат:\n")
-        cls.display_matrix(matrix)
+        cls.display_matrix(matrix, tracer, "\nРезультат:\n")
 
     @classmethod
     def get_subsets(cls, n: int, m: int) -> List[List[int]]:
         return [list(combo) for combo in combinations(range(n), m)]
 
     @classmethod
-    def duplicate_matrix(cls, matrix: List[List[RationalNumber]]) -> List[List[RationalNumber]]:
-        return [[RationalNumber(cell.top, cell.bottom) for cell in row] for row in matrix]
+    def duplicate_matrix(cls, matrix: List[SparseRow]) -> List[SparseRow]:
+        return [row.copy() if isinstance(row, SparseRow) else SparseRow.from_dense(row) for row in matrix]
 
     @classmethod
     def get_roman(cls, number: int) -> str:
         return f"({number})"
 
 
+def solve_branch(table: LinearTable, index: int, bound: RationalNumber, upper: bool, engine: str, options: dict,
+                 stats: Optional['SolveStats'] = None) -> tuple[SolveStatus, LinearTable, int]:
+    table.add_bound_row(index, bound, upper)
+    optimizer = LinearOptimizer.create(engine, **options)
+    optimizer.stats = stats
+    status = table.reoptimize(optimizer)
+    return status, table, optimizer.iterations
+
+
+class BranchAndBound:
+    def __init__(self, engine: str = 'rational', workers: int = 1, tracer: Tracer = SILENT_TRACER, **options):
+        self.engine = engine
+        self.options = options
+        self.workers = workers
+        self.tracer = tracer
+        self.optimizer = LinearOptimizer.create(engine, **options)
+        self.stats: Optional['SolveStats'] = None
+        self.status: Optional[SolveStatus] = None
+        self.objective: Optional[RationalNumber] = None
+        self.solution: Optional[List[RationalNumber]] = None
+        self.table: Optional[LinearTable] = None
+        self.nodes = 0
+        self.iterations = 0
+
+    def choose_branch(self, table: LinearTable, integers: List[int]) -> tuple[int, Optional[RationalNumber]]:
+        # Ветвление по наиболее дробной переменной
+        solution = self.optimizer.get_solution(table)
+        half = RationalNumber(1, 2)
+        index, value, best_distance = -1, None, None
+        for j in integers:
+            if solution[j].bottom == 1:
+                continue
+            distance = RationalNumber(solution[j].top % solution[j].bottom, solution[j].bottom).difference(half).absolute()
+            if best_distance is None or distance.order(best_distance) < 0:
+                index, value, best_distance = j, solution[j], distance
+        return index, value
+
+    def solve(self, problem: LinearProblem) -> SolveStatus:
+        integers = sorted(problem.integers)
+        self.maximize = problem.goal.maximize
+        self.nodes = 1
+        try:
+            canonical_form = FormTransformer.transform(problem)
+            self.var_count = len(canonical_form.goal_factors) - canonical_form.aux_vars
+            table = self.optimizer.build_table(canonical_form)
+        except ValueError:
+            return self.finish(SolveStatus.INFEASIBLE, None)
+        if self.optimizer.stop_status is not None:
+            self.iterations = self.optimizer.iterations
+            return self.finish(self.optimizer.stop_status, None)
+        self.optimizer.stats = self.stats
+        status = table.reoptimize(self.optimizer)
+        self.iterations = self.optimizer.iterations
+        if status != SolveStatus.OPTIMAL:
+            return self.finish(status, None)
+
+        incumbent: Optional[LinearTable] = None
+        heap: List[tuple] = []
+        order = 0
+        candidates = [table]
+        stopped: Optional[SolveStatus] = None
+        executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        node_options = dict(self.options)
+        if executor is not None:
+            # Токен отмены не передаётся в другие процессы, отмена проверяется между партиями узлов
+            node_options.pop('cancel_token', None)
+        try:
+            while stopped is None:
+                for node in candidates:
+                    z_value = node.matrix[0][-1]
+                    if incumbent is not None and z_value.order(incumbent.matrix[0][-1]) <= 0:
+                        continue
+                    index, value = self.choose_branch(node, integers)
+                    if index == -1:
+                        incumbent = node
+                        self.tracer.message(TraceLevel.ITERATION, f"Найдено целочисленное решение: Z = {self.report(z_value)}")
+                        continue
+                    order += 1
+                    heapq.heappush(heap, (z_value.invert(), order, node, index, value))
+
+                # Узлы выбираются по лучшей оценке; поддеревья из одной партии решаются независимо
+                batch = []
+                while heap and len(batch) < max(self.workers, 1):
+                    bound, _, node, index, value = heapq.heappop(heap)
+                    if incumbent is not None and bound.invert().order(incumbent.matrix[0][-1]) <= 0:
+                        heap.clear()
+                        break
+                    batch.append((node, index, value))
+                if not batch:
+                    break
+                stopped = self.optimizer.check_limits(self.iterations)
+                if stopped is not None:
+                    break
+                if self.optimizer.max_iterations is not None:
+                    node_options['max_iterations'] = self.optimizer.max_iterations - self.iterations
+
+                tasks = []
+                for node, index, value in batch:
+                    self.tracer.message(TraceLevel.ITERATION, f"\nВетвление по x{index + 1} = {value}, оценка Z = {self.report(node.matrix[0][-1])}")
+                    lower = RationalNumber(value.top // value.bottom)
+                    tasks.append((node.copy(), index, lower, True))
+                    tasks.append((node, index, lower.sum(RationalNumber.UNITY), False))
+                columns = [list(column) for column in zip(*tasks)]
+                # Итерации узлов в других процессах не попадают в статистику, общий счётчик итераций их учитывает
+                node_stats = self.stats if executor is None else None
+                arguments = columns + [[self.engine] * len(tasks), [node_options] * len(tasks), [node_stats] * len(tasks)]
+                results = executor.map(solve_branch, *arguments) if executor is not None else map(solve_branch, *arguments)
+
+                candidates = []
+                for status, child, iterations in results:
+                    self.nodes += 1
+                    self.iterations += iterations
+                    if status == SolveStatus.OPTIMAL:
+                        candidates.append(child)
+                    elif status in LIMIT_MESSAGES:
+                        stopped = status
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if stopped is not None:
+            # Возвращается лучшее найденное целочисленное решение, если оно есть
+            self.tracer.message(TraceLevel.SUMMARY, LIMIT_MESSAGES[stopped])
+            return self.finish(stopped, incumbent)
+        return self.finish(SolveStatus.OPTIMAL if incumbent is not None else SolveStatus.INFEASIBLE, incumbent)
+
+    def report(self, z_value: RationalNumber) -> RationalNumber:
+        return z_value if self.maximize else z_value.invert()
+
+    def finish(self, status: SolveStatus, table: Optional[LinearTable]) -> SolveStatus:
+        self.status = status
+        self.table = table
+        if table is not None:
+            self.objective = self.report(table.matrix[0][-1])
+            self.solution = self.optimizer.get_solution(table)[:self.var_count]
+        self.tracer.message(TraceLevel.SUMMARY, f"\nМетод ветвей и границ: узлов {self.nodes}, итераций {self.iterations}")
+        return status
+
+
+class SensitivityAnalysis:
+    def __init__(self, problem: LinearProblem, table: LinearTable):
+        table.check_source()
+        if any(value.top < 0 for value in table.matrix[0][:-1]) or not LinearOptimizer().is_primal_feasible(table):
+            raise ValueError("Анализ чувствительности требует оптимальной таблицы")
+        self.problem = problem
+        self.table = table
+        # Каноническая задача всегда на максимум; для минимизации знак целевой функции меняется
+        self.sense = RationalNumber.UNITY if problem.goal.maximize else RationalNumber.NEGATIVE_UNITY
+        self.var_count = FormTransformer.count_original_vars(problem)
+        self.shadow_prices: List[Optional[RationalNumber]] = []
+        self.rhs_ranges: List[tuple[Optional[RationalNumber], Optional[RationalNumber]]] = []
+        self.reduced_costs: List[RationalNumber] = []
+        self.cost_ranges: List[tuple[Optional[RationalNumber], Optional[RationalNumber]]] = []
+        # Номера строк во входных данных: строки-границы из problem.bound_rows не входят в problem.restrictions
+        self.row_numbers: List[int] = []
+        self.bound_prices: Dict[int, Optional[RationalNumber]] = {}
+        self.analyze_rows()
+        self.analyze_columns()
+        self.analyze_bound_rows()
+
+    @staticmethod
+    def scale_range(low: Optional[RationalNumber], high: Optional[RationalNumber],
+                    factor: RationalNumber) -> tuple[Optional[RationalNumber], Optional[RationalNumber]]:
+        low = None if low is None else low.product(factor)
+        high = None if high is None else high.product(factor)
+        return (low, high) if factor.top > 0 else (high, low)
+
+    def analyze_rows(self) -> None:
+        table = self.table
+        base_values = [table.matrix[k + 1][-1] for k in range(len(table.base_indices))]
+        base_uppers = [None if table.upper_bounds is None else table.upper_bounds[j] for j in table.base_indices]
+        for i, restriction in enumerate(self.problem.restrictions):
+            # Строки с отрицательной правой частью в канонической форме умножены на -1
+            sign = RationalNumber.NEGATIVE_UNITY if restriction.right_side.top < 0 else RationalNumber.UNITY
+            unit = [RationalNumber.NULL] * len(table.right_sides)
+            unit[i] = RationalNumber.UNITY
+            try:
+                column = table.solve_basis(unit)
+            except ValueError:
+                # Линейно зависимое ограничение было удалено, двойственная оценка не определена
+                self.shadow_prices.append(None)
+                self.rhs_ranges.append((None, None))
+                continue
+
+            price = RationalNumber.NULL
+            for k, value in enumerate(column):
+                base_col = table.base_indices[k]
+                price = price.sum(table.goal_factors[base_col].product(table.column_sign(base_col)).product(value))
+            self.shadow_prices.append(price.product(sign).product(self.sense))
+
+            # Базисные значения должны остаться в пределах [0, u]
+            low: Optional[RationalNumber] = None
+            high: Optional[RationalNumber] = None
+            for value, upper, shift in zip(base_values, base_uppers, column):
+                if shift.top == 0:
+                    continue
+                to_zero = value.invert().quotient(shift)
+                to_upper = None if upper is None else upper.difference(value).quotient(shift)
+                lower_limit, upper_limit = (to_zero, to_upper) if shift.top > 0 else (to_upper, to_zero)
+                if lower_limit is not None and (low is None or lower_limit.order(low) > 0):
+                    low = lower_limit
+                if upper_limit is not None and (high is None or upper_limit.order(high) < 0):
+                    high = upper_limit
+            low, high = self.scale_range(low, high, sign)
+            self.rhs_ranges.append((
+                None if low is None else restriction.right_side.sum(low),
+                None if high is None else restriction.right_side.sum(high),
+            ))
+
+    def analyze_columns(self) -> None:
+        table = self.table
+        z_row = table.matrix[0]
+        nonbasic = [j for j in range(len(z_row) - 1) if j not in table.base_indices]
+        for j in range(self.var_count):
+            cost = table.goal_factors[j]
+            sign = table.column_sign(j)
+            self.reduced_costs.append(z_row[j].product(sign).product(self.sense.invert()))
+            if j not in table.base_indices:
+                # Переменная на верхней границе остаётся там при любом росте коэффициента
+                low, high = (None, z_row[j]) if sign.top > 0 else (z_row[j].invert(), None)
+            else:
+                row = table.matrix[table.base_indices.index(j) + 1]
+                low, high = None, None
+                for k in nonbasic:
+                    factor = row[k]
+                    if factor.top == 0:
+                        continue
+                    limit = z_row[k].quotient(factor.invert())
+                    if factor.top < 0 and (high is None or limit.order(high) < 0):
+                        high = limit
+                    elif factor.top > 0 and (low is None or limit.order(low) > 0):
+                        low = limit
+                low, high = self.scale_range(low, high, sign)
+            low = None if low is None else cost.sum(low)
+            high = None if high is None else cost.sum(high)
+            self.cost_ranges.append(self.scale_range(low, high, self.sense))
+
+    def analyze_bound_rows(self) -> None:
+        problem = self.problem
+        number = 0
+        for _ in problem.restrictions:
+            while number in problem.bound_rows:
+                number += 1
+            self.row_numbers.append(number)
+            number += 1
+
+        # Оценка активной границы равна приведённой стоимости переменной относительно настоящих ограничений,
+        # делённой на коэффициент строки; неактивная граница имеет нулевую оценку
+        solution = LinearOptimizer().get_solution(self.table)
+        claimed = set()
+        for number, restriction in sorted(problem.bound_rows.items()):
+            (j, factor), = restriction.factors.items()
+            value = restriction.right_side.quotient(factor)
+            kind = restriction.kind
+            if factor.top < 0:
+                kind = {RestrictionType.BELOW: RestrictionType.ABOVE, RestrictionType.ABOVE: RestrictionType.BELOW}.get(kind, kind)
+            lower, upper = problem.bounds.get(j, (RationalNumber.NULL, None))
+            sides = set()
+            if kind != RestrictionType.BELOW and lower is not None and lower.is_equal(value):
+                sides.add('lower')
+            if kind != RestrictionType.ABOVE and upper is not None and upper.is_equal(value):
+                sides.add('upper')
+            if not solution[j].is_equal(value) or not sides or {(j, side) for side in sides} <= claimed:
+                self.bound_prices[number] = RationalNumber.NULL
+                continue
+            claimed.update((j, side) for side in sides)
+            reduced = problem.goal.factors[j]
+            for i, row in enumerate(problem.restrictions):
+                coefficient = row.factors[j]
+                if coefficient.top == 0:
+                    continue
+                if self.shadow_prices[i] is None:
+                    reduced = None
+                    break
+                reduced = reduced.difference(self.shadow_prices[i].product(coefficient))
+            # Граница, совпавшая с другой, активна только если оценка указывает в её сторону
+            if reduced is not None and len(sides) == 1:
+                direction = reduced.product(self.sense).order(RationalNumber.NULL)
+                if (direction < 0 and 'upper' in sides) or (direction > 0 and 'lower' in sides):
+                    reduced = RationalNumber.NULL
+            self.bound_prices[number] = None if reduced is None else reduced.quotient(factor)
+
+
+TASK_TERM_PATTERN = re.compile(r'\s*([+-])?\s*(\d+(?:\.\d*)?(?:/\d+)?|\.\d+)?\s*(?:x(\d+))?\s*')
+TASK_SENSE_PATTERN = re.compile(r'->\s*(max|min)')
+TASK_RESTRICTION_PATTERN = re.compile(r'^(.*?)(<=|>=|=)(.*)$')
+TASK_INTEGER_PATTERN = re.compile(r'^int\s*:?\s*(x\d+(?:\s*[,\s]\s*x\d+)*)\s*$')
+MPS_SECTIONS = {'NAME', 'OBJSENSE', 'ROWS', 'COLUMNS', 'RHS', 'RANGES', 'BOUNDS', 'ENDATA'}
+LP_SECTION_PATTERN = re.compile(
+    r'^\s*(maximi[sz]e|maximum|max|minimi[sz]e|minimum|min|subject\s+to|such\s+that|s\.t\.|st|bounds?|generals?|gen|'
+    r'integers?|binar(?:y|ies)|bin|end)(?=\s|$)', re.IGNORECASE)
+LP_TOKEN_PATTERN = re.compile(
+    r'\s*(<=|>=|=<|=>|[<>=+\-:]|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|[A-Za-z_!"#$%&()/,;?@`\'{}|~][\w!"#$%&()/,.;?@`\'{}|~\[\]]*)')
+LP_NUMBER_PATTERN = re.compile(r'(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+LP_OPERATORS = {
+    '<=': RestrictionType.BELOW, '=<': RestrictionType.BELOW, '<': RestrictionType.BELOW,
+    '>=': RestrictionType.ABOVE, '=>': RestrictionType.ABOVE, '>': RestrictionType.ABOVE,
+    '=': RestrictionType.EQUALS,
+}
+LP_OPERATORS_REVERSED = {'<=': '>=', '=<': '>=', '<': '>', '>=': '<=', '=>': '<=', '>': '<', '=': '='}
+MPS_ROW_TYPES = {'L': RestrictionType.BELOW, 'G': RestrictionType.ABOVE, 'E': RestrictionType.EQUALS}
+
+
+class ModelBuilder:
+    def __init__(self):
+        self.problem = LinearProblem()
+        self.columns: Dict[str, int] = {}
+
+    def column(self, name: str) -> int:
+        index = self.columns.get(name)
+        if index is None:
+            index = len(self.problem.names)
+            self.columns[name] = index
+            self.problem.names.append(name)
+        return index
+
+    def add_limit(self, kind: RestrictionType, factors: SparseRow, right_side: RationalNumber) -> Limit:
+        restriction = Limit(kind, factors, right_side)
+        self.problem.restrictions.append(restriction)
+        return restriction
+
+    def set_bound(self, index: int, lower: Optional[RationalNumber] = RationalNumber.NULL, upper: Optional[RationalNumber] = None,
+                  keep_lower: bool = False, keep_upper: bool = False) -> None:
+        current_lower, current_upper = self.problem.bounds.get(index, (RationalNumber.NULL, None))
+        self.problem.bounds[index] = (current_lower if keep_lower else lower, current_upper if keep_upper else upper)
+
+    def finish(self) -> LinearProblem:
+        self.problem.goal.factors.resize(max(len(self.problem.names), len(self.problem.goal.factors)))
+        return self.problem
+
+
 class ProblemReader:
     @staticmethod
-    def read_problem(file_path: str) -> 'LinearProblem':
-        problem = LinearProblem()
+    def parse_number(text: str) -> RationalNumber:
+        # Целые коэффициенты встречаются чаще всего и не требуют разбора через Fraction
+        digits = text[1:] if text[:1] in ('+', '-') else text
+        if digits.isdigit():
+            return RationalNumber(int(text))
+        return RationalNumber(text)
+
+    @staticmethod
+    def detect_format(file_path: str) -> str:
+        lowered = file_path.lower()
+        if lowered.endswith('.mps'):
+            return 'mps'
+        if lowered.endswith('.lp'):
+            return 'lp'
+        return 'task'
+
+    @staticmethod
+    def read_problem(file_path: str, file_format: Optional[str] = None) -> 'LinearProblem':
+        file_format = file_format or ProblemReader.detect_format(file_path)
+        if file_format not in ProblemReader.formats:
+            raise ValueError(f"Неизвестный формат задачи: {file_format}")
         with open(file_path, 'r', encoding='utf-8') as f:
-            lines = [line.strip() for line in f if line.strip()]
+            return ProblemReader.formats[file_format](f)
+
+    @staticmethod
+    def read_task(lines) -> 'LinearProblem':
+        problem = LinearProblem()
+        row = 0
         for line in lines:
+            line = line.strip()
+            if not line:
+                continue
             if line.startswith('Z :'):
                 problem.goal = ProblemReader.read_goal(line)
+            elif line.startswith('int'):
+                problem.integers.update(ProblemReader.read_integers(line))
             else:
-                problem.restrictions.append(ProblemReader.read_restriction(line))
+                restriction = ProblemReader.read_restriction(line)
+                if len(restriction.factors.entries) == 1:
+                    ProblemReader.read_bound(problem, restriction)
+                    problem.bound_rows[row] = restriction
+                else:
+                    problem.restrictions.append(restriction)
+                row += 1
         return problem
 
+    @staticmethod
+    def read_bound(problem: 'LinearProblem', restriction: 'Limit') -> None:
+        # Ограничение на одну переменную становится её границей; неотрицательность сохраняется
+        (index, factor), = restriction.factors.items()
+        value = restriction.right_side.quotient(factor)
+        kind = restriction.kind
+        if factor.top < 0:
+            kind = {RestrictionType.BELOW: RestrictionType.ABOVE, RestrictionType.ABOVE: RestrictionType.BELOW}.get(kind, kind)
+        lower, upper = problem.bounds.get(index, (RationalNumber.NULL, None))
+        if kind != RestrictionType.BELOW and value.order(lower) > 0:
+            lower = value
+        if kind != RestrictionType.ABOVE and (upper is None or value.order(upper) < 0):
+            upper = value
+        problem.bounds[index] = (lower, upper)
+
     @staticmethod
     def read_goal(line: str) -> 'Goal':
         line = line[3:].strip()
         maximize = 'max' in line
-        expr = re.sub(r'->\s*(max|min)', '', line).strip()
+        expr = TASK_SENSE_PATTERN.sub('', line).strip()
         goal = Goal(maximize=maximize)
-        ProblemReader.read_terms(expr, goal.factors, goal.offset)
+        goal.offset = ProblemReader.read_terms(expr, goal.factors)
         return goal
 
+    @staticmethod
+    def read_integers(line: str) -> List[int]:
+        match = TASK_INTEGER_PATTERN.match(line)
+        if match is None:
+            raise ValueError(f"Недопустимое объявление целочисленных переменных: {line}")
+        indices = [int(index) - 1 for index in re.findall(r'x(\d+)', match.group(1))]
+        if any(index < 0 for index in indices):
+            raise ValueError(f"Недопустимый номер переменной: {line}")
+        return indices
+
     @staticmethod
     def read_restriction(line: str) -> 'Limit':
-        restriction = Limit()
-        if '<=' in line:
-            operator = '<='
-            restriction.kind = RestrictionType.BELOW
-        elif '>=' in line:
-            operator = '>='
-            restriction.kind = RestrictionType.ABOVE
-        elif '=' in line:
-            operator = '='
-            restriction.kind = RestrictionType.EQUALS
-        else:
+        match = TASK_RESTRICTION_PATTERN.match(line)
+        if match is None:
             raise ValueError(f"Недопустимое ограничение: {line}")
-
-        parts = line.split(operator)
-        if len(parts) != 2:
+        left_part, operator, right_part = match.group(1).strip(), match.group(2), match.group(3).strip()
+        if '<' in right_part or '>' in right_part or '=' in right_part:
             raise ValueError(f"Недопустимый формат ограничения: {line}")
-        left_part = parts[0].strip()
-        right_part = parts[1].strip()
 
-        restriction.factors = []
-        ProblemReader.read_terms(left_part, restriction.factors, RationalNumber.NULL)
+        restriction = Limit(LP_OPERATORS[operator])
+        offset = ProblemReader.read_terms(left_part, restriction.factors)
         try:
-            restriction.right_side = RationalNumber(right_part)
+            restriction.right_side = ProblemReader.parse_number(right_part).difference(offset)
         except ValueError:
             raise ValueError(f"Недопустимая правая часть в ограничении: {right_part}")
         return restriction
 
     @staticmethod
-    def read_terms(expr: str, factors: List[RationalNumber], offset: RationalNumber) -> None:
+    def read_terms(expr: str, factors: SparseRow) -> RationalNumber:
         factors.clear()
-        terms = re.findall(r'([+-]?\s*\d*\.?\d*\s*x\d+|[+-]?\s*\d+\.?\d*|[+-]?\s*x\d+)', expr)
-        max_var_index = 0
-        for term in terms:
-            term = term.strip()
-            if not term:
-                continue
-            if 'x' in term:
-                match = re.match(r'([+-]?\s*\d*\.?\d*)?\s*x(\d+)', term)
-                if not match:
-                    raise ValueError(f"Недопустимый термин: {term}")
-                factor_str = match.group(1).strip() if match.group(1) else ''
-                var_index = int(match.group(2)) - 1
-
-                if factor_str in ('', '+'):
-                    factor = '1'
-                elif factor_str == '-':
-                    factor = '-1'
+        offset = RationalNumber.NULL
+        position = 0
+        expr = expr.strip()
+        while position < len(expr):
+            match = TASK_TERM_PATTERN.match(expr, position)
+            sign, number, index = match.groups()
+            if match.end() == position or (number is None and index is None):
+                raise ValueError(f"Недопустимый термин: {expr[position:].strip()}")
+            value = ProblemReader.parse_number(number) if number else RationalNumber.UNITY
+            if sign == '-':
+                value = value.invert()
+            if index is None:
+                offset = offset.sum(value)
+            else:
+                var_index = int(index) - 1
+                factors[var_index] = factors[var_index].sum(value)
+            position = match.end()
+        return offset
+
+    @staticmethod
+    def read_mps(lines) -> 'LinearProblem':
+        builder = ModelBuilder()
+        problem = builder.problem
+        rows: Dict[str, Optional[Limit]] = {}
+        objective_row = None
+        ranges: Dict[str, RationalNumber] = {}
+        section = None
+        integer_block = False
+        for line in lines:
+            if not line.strip() or line.startswith('*'):
+                continue
+            tokens = line.split()
+            if not line[0].isspace() and tokens[0] in MPS_SECTIONS:
+                section = tokens[0]
+                if section == 'OBJSENSE' and len(tokens) > 1:
+                    problem.goal.maximize = tokens[1].startswith('MAX')
+                continue
+
+            if section == 'OBJSENSE':
+                problem.goal.maximize = tokens[0].startswith('MAX')
+            elif section == 'ROWS':
+                kind, name = tokens[0].upper(), tokens[1]
+                if kind == 'N':
+                    if objective_row is None:
+                        objective_row = name
+                    else:
+                        rows[name] = None
+                elif kind in MPS_ROW_TYPES:
+                    rows[name] = builder.add_limit(MPS_ROW_TYPES[kind], SparseRow(), RationalNumber.NULL)
+                else:
+                    raise ValueError(f"Недопустимый тип строки MPS: {kind}")
+            elif section == 'COLUMNS':
+                if len(tokens) >= 3 and tokens[1] == "'MARKER'":
+                    integer_block = tokens[2] == "'INTORG'"
+                    continue
+                index = builder.column(tokens[0])
+                if integer_block:
+                    problem.integers.add(index)
+                for name, value in zip(tokens[1::2], tokens[2::2]):
+                    if name == objective_row:
+                        problem.goal.factors[index] = ProblemReader.parse_number(value)
+                    elif name not in rows:
+                        raise ValueError(f"Неизвестная строка MPS: {name}")
+                    elif rows[name] is not None:
+                        rows[name].factors[index] = ProblemReader.parse_number(value)
+            elif section in ('RHS', 'RANGES'):
+                pairs = tokens[1:] if len(tokens) % 2 else tokens
+                for name, value in zip(pairs[::2], pairs[1::2]):
+                    if section == 'RANGES':
+                        ranges[name] = ProblemReader.parse_number(value)
+                    elif name == objective_row:
+                        problem.goal.offset = ProblemReader.parse_number(value).invert()
+                    elif name not in rows:
+                        raise ValueError(f"Неизвестная строка MPS: {name}")
+                    elif rows[name] is not None:
+                        rows[name].right_side = ProblemReader.parse_number(value)
+            elif section == 'BOUNDS':
+                ProblemReader.read_mps_bound(builder, tokens)
+            elif section != 'NAME':
+                raise ValueError(f"Недопустимая строка MPS: {line.strip()}")
+
+        for name, value in ranges.items():
+            restriction = rows.get(name)
+            if restriction is None:
+                raise ValueError(f"Неизвестная строка MPS: {name}")
+            ProblemReader.apply_range(builder, restriction, value)
+        return builder.finish()
+
+    @staticmethod
+    def read_mps_bound(builder: ModelBuilder, tokens: List[str]) -> None:
+        kind = tokens[0].upper()
+        # Имя набора границ в свободном MPS может отсутствовать
+        if kind in ('UP', 'LO', 'FX', 'LI', 'UI'):
+            name, value = tokens[-2], ProblemReader.parse_number(tokens[-1])
+        else:
+            name, value = tokens[2] if len(tokens) > 2 else tokens[1], None
+        index = builder.column(name)
+        if kind == 'UP':
+            builder.set_bound(index, upper=value, keep_lower=True)
+        elif kind in ('LO', 'LI'):
+            builder.set_bound(index, lower=value, keep_upper=True)
+        elif kind == 'FX':
+            builder.set_bound(index, value, value)
+        elif kind == 'FR':
+            builder.set_bound(index, None, None)
+        elif kind == 'MI':
+            builder.set_bound(index, lower=None, keep_upper=True)
+        elif kind == 'PL':
+            builder.set_bound(index, upper=None, keep_lower=True)
+        elif kind == 'BV':
+            builder.set_bound(index, RationalNumber.NULL, RationalNumber.UNITY)
+            builder.problem.integers.add(index)
+        elif kind == 'UI':
+            builder.set_bound(index, upper=value, keep_lower=True)
+            builder.problem.integers.add(index)
+        else:
+            raise ValueError(f"Недопустимый тип границы MPS: {kind}")
+        if kind == 'LI':
+            builder.problem.integers.add(index)
+
+    @staticmethod
+    def apply_range(builder: ModelBuilder, restriction: Limit, value: RationalNumber) -> None:
+        # Диапазон превращает строку в двустороннее ограничение, вторую сторону добавляем отдельной строкой
+        right_side = restriction.right_side
+        if restriction.kind == RestrictionType.BELOW:
+            builder.add_limit(RestrictionType.ABOVE, restriction.factors.copy(), right_side.difference(value.absolute()))
+        elif restriction.kind == RestrictionType.ABOVE:
+            builder.add_limit(RestrictionType.BELOW, restriction.factors.copy(), right_side.sum(value.absolute()))
+        elif value.order(RationalNumber.NULL) > 0:
+            restriction.kind = RestrictionType.ABOVE
+            builder.add_limit(RestrictionType.BELOW, restriction.factors.copy(), right_side.sum(value))
+        elif value.order(RationalNumber.NULL) < 0:
+            restriction.kind = RestrictionType.BELOW
+            builder.add_limit(RestrictionType.ABOVE, restriction.factors.copy(), right_side.sum(value))
+
+    @staticmethod
+    def read_lp(lines) -> 'LinearProblem':
+        builder = ModelBuilder()
+        problem = builder.problem
+        section = None
+        pending: List[str] = []
+        for line in lines:
+            line = line.split('\\', 1)[0]
+            match = LP_SECTION_PATTERN.match(line)
+            if match is not None:
+                if section == 'objective':
+                    ProblemReader.read_lp_objective(builder, pending)
+                elif pending:
+                    raise ValueError(f"Незавершённое выражение: {' '.join(pending)}")
+                pending = []
+                keyword = match.group(1).lower()
+                if keyword.startswith('max') or keyword.startswith('min'):
+                    section = 'objective'
+                    problem.goal.maximize = keyword.startswith('max')
+                elif keyword.startswith('bound'):
+                    section = 'bounds'
+                elif keyword.startswith('gen') or keyword.startswith('int'):
+                    section = 'integers'
+                elif keyword.startswith('bin'):
+                    section = 'binaries'
+                elif keyword == 'end':
+                    section = 'end'
                 else:
-                    factor = factor_str.replace(' ', '')
-                if factor.startswith('+'):
-                    factor = factor[1:]
-                factor_value = RationalNumber(factor)
-                while len(factors) <= var_index:
-                    factors.append(RationalNumber.NULL)
-                factors[var_index] = factor_value
-                max_var_index = max(max_var_index, var_index)
+                    section = 'constraints'
+                line = line[match.end():]
+
+            tokens = ProblemReader.read_lp_tokens(line)
+            if not tokens:
+                continue
+            if section == 'objective':
+                pending.extend(tokens)
+            elif section == 'constraints':
+                pending.extend(tokens)
+                if ProblemReader.is_lp_statement_complete(pending):
+                    ProblemReader.read_lp_constraint(builder, pending)
+                    pending = []
+            elif section == 'bounds':
+                ProblemReader.read_lp_bound(builder, tokens)
+            elif section in ('integers', 'binaries'):
+                for name in tokens:
+                    index = builder.column(name)
+                    problem.integers.add(index)
+                    if section == 'binaries':
+                        builder.set_bound(index, RationalNumber.NULL, RationalNumber.UNITY)
+            elif section != 'end':
+                raise ValueError(f"Строка вне раздела LP: {line.strip()}")
+
+        if section == 'objective':
+            ProblemReader.read_lp_objective(builder, pending)
+        elif pending:
+            raise ValueError(f"Незавершённое выражение: {' '.join(pending)}")
+        return builder.finish()
+
+    @staticmethod
+    def read_lp_tokens(line: str) -> List[str]:
+        tokens = []
+        position = 0
+        line = line.rstrip()
+        while position < len(line):
+            match = LP_TOKEN_PATTERN.match(line, position)
+            if match is None:
+                raise ValueError(f"Недопустимый символ в LP: {line[position:].strip()}")
+            tokens.append(match.group(1))
+            position = match.end()
+        return tokens
+
+    @staticmethod
+    def strip_label(tokens: List[str]) -> List[str]:
+        return tokens[2:] if len(tokens) > 1 and tokens[1] == ':' else tokens
+
+    @staticmethod
+    def is_lp_statement_complete(tokens: List[str]) -> bool:
+        tokens = ProblemReader.strip_label(tokens)
+        operators = [k for k, token in enumerate(tokens) if token in LP_OPERATORS]
+        if not operators:
+            return False
+        tail = [token for token in tokens[operators[-1] + 1:] if token not in ('+', '-')]
+        if len(tail) == 1 and LP_NUMBER_PATTERN.fullmatch(tail[0]):
+            return True
+        # Запись вида «константа <= выражение» завершается вместе со строкой
+        head = [token for token in tokens[:operators[0]] if token not in ('+', '-')]
+        return len(operators) == 1 and len(head) == 1 and LP_NUMBER_PATTERN.fullmatch(head[0]) is not None and bool(tail)
+
+    @staticmethod
+    def read_lp_expression(builder: ModelBuilder, tokens: List[str]) -> tuple[SparseRow, RationalNumber]:
+        factors = SparseRow()
+        offset = RationalNumber.NULL
+        sign = RationalNumber.UNITY
+        value: Optional[RationalNumber] = None
+        for token in tokens:
+            if token in ('+', '-'):
+                if value is not None:
+                    offset = offset.sum(sign.product(value))
+                    value = None
+                    sign = RationalNumber.UNITY
+                if token == '-':
+                    sign = sign.invert()
+            elif LP_NUMBER_PATTERN.fullmatch(token):
+                if value is not None:
+                    raise ValueError(f"Два числа подряд в выражении: {' '.join(tokens)}")
+                value = ProblemReader.parse_number(token)
             else:
-                try:
-                    offset.sum(RationalNumber(term.replace(' ', '')))
-                except ValueError:
-                    raise ValueError(f"Недопустимый постоянный термин: {term}")
+                index = builder.column(token)
+                factor = sign if value is None else sign.product(value)
+                factors[index] = factors[index].sum(factor)
+                value = None
+                sign = RationalNumber.UNITY
+        if value is not None:
+            offset = offset.sum(sign.product(value))
+        return factors, offset
+
+    @staticmethod
+    def read_lp_objective(builder: ModelBuilder, tokens: List[str]) -> None:
+        factors, offset = ProblemReader.read_lp_expression(builder, ProblemReader.strip_label(tokens))
+        builder.problem.goal.factors = factors
+        builder.problem.goal.offset = offset
+
+    @staticmethod
+    def read_lp_constraint(builder: ModelBuilder, tokens: List[str]) -> None:
+        tokens = ProblemReader.strip_label(tokens)
+        operators = [k for k, token in enumerate(tokens) if token in LP_OPERATORS]
+        if len(operators) == 2:
+            # Двусторонняя запись: нижняя <= выражение <= верхняя
+            first, second = operators
+            middle = tokens[first + 1:second]
+            ProblemReader.read_lp_constraint(builder, middle + [LP_OPERATORS_REVERSED[tokens[first]]] + tokens[:first])
+            ProblemReader.read_lp_constraint(builder, middle + tokens[second:])
+            return
+        if len(operators) != 1:
+            raise ValueError(f"Недопустимое ограничение LP: {' '.join(tokens)}")
+
+        k = operators[0]
+        factors, left_offset = ProblemReader.read_lp_expression(builder, tokens[:k])
+        right_factors, right_offset = ProblemReader.read_lp_expression(builder, tokens[k + 1:])
+        for index, value in right_factors.items():
+            factors[index] = factors[index].difference(value)
+        builder.add_limit(LP_OPERATORS[tokens[k]], factors, right_offset.difference(left_offset))
+
+    @staticmethod
+    def read_lp_bound(builder: ModelBuilder, tokens: List[str]) -> None:
+        if len(tokens) == 2 and tokens[1].lower() == 'free':
+            builder.set_bound(builder.column(tokens[0]), None, None)
+            return
+        operators = [k for k, token in enumerate(tokens) if token in LP_OPERATORS]
+        parts = []
+        start = 0
+        for k in operators + [len(tokens)]:
+            parts.append(tokens[start:k])
+            start = k + 1
+        if len(operators) == 2:
+            lower, name, upper = parts
+            index = builder.column(ProblemReader.lp_bound_name(name))
+            if LP_OPERATORS[tokens[operators[0]]] == RestrictionType.ABOVE:
+                lower, upper = upper, lower
+            builder.set_bound(index, ProblemReader.lp_bound_value(lower), ProblemReader.lp_bound_value(upper))
+            return
+        if len(operators) != 1:
+            raise ValueError(f"Недопустимая граница LP: {' '.join(tokens)}")
+
+        operator = tokens[operators[0]]
+        left, right = parts
+        if not ProblemReader.is_lp_name(left):
+            left, right = right, left
+            operator = LP_OPERATORS_REVERSED[operator]
+        kind = LP_OPERATORS[operator]
+        index = builder.column(ProblemReader.lp_bound_name(left))
+        value = ProblemReader.lp_bound_value(right)
+        if kind == RestrictionType.BELOW:
+            builder.set_bound(index, upper=value, keep_lower=True)
+        elif kind == RestrictionType.ABOVE:
+            builder.set_bound(index, lower=value, keep_upper=True)
+        else:
+            builder.set_bound(index, value, value)
+
+    @staticmethod
+    def is_lp_name(tokens: List[str]) -> bool:
+        return len(tokens) == 1 and not LP_NUMBER_PATTERN.fullmatch(tokens[0]) and tokens[0].lower() not in ('inf', 'infinity')
+
+    @staticmethod
+    def lp_bound_name(tokens: List[str]) -> str:
+        if not ProblemReader.is_lp_name(tokens):
+            raise ValueError(f"Недопустимая переменная в границе LP: {' '.join(tokens)}")
+        return tokens[0]
+
+    @staticmethod
+    def lp_bound_value(tokens: List[str]) -> Optional[RationalNumber]:
+        negative = tokens.count('-') % 2 == 1
+        digits = [token for token in tokens if token not in ('+', '-')]
+        if len(digits) == 1 and digits[0].lower() in ('inf', 'infinity'):
+            return None
+        if len(digits) != 1 or not LP_NUMBER_PATTERN.fullmatch(digits[0]):
+            raise ValueError(f"Недопустимое значение границы LP: {' '.join(tokens)}")
+        value = ProblemReader.parse_number(digits[0])
+        return value.invert() if negative else value
+
+
+ProblemReader.formats = {
+    'task': ProblemReader.read_task,
+    'mps': ProblemReader.read_mps,
+    'lp': ProblemReader.read_lp,
+}
+
+
+class Presolver:
+    def __init__(self, problem: LinearProblem, max_passes: int = 20, tracer: Tracer = SILENT_TRACER):
+        self.problem = problem
+        self.max_passes = max_passes
+        self.tracer = tracer
+        self.column_count = FormTransformer.count_original_vars(problem)
+        self.stack: List[tuple] = []
+        self.status: Optional[SolveStatus] = None
+        self.stats: Dict[str, int] = {
+            'empty_rows': 0, 'singleton_rows': 0, 'duplicate_rows': 0, 'redundant_rows': 0, 'fixed_columns': 0, 'empty_columns': 0,
+        }
+
+    def presolve(self) -> LinearProblem:
+        problem = self.problem
+        self.maximize = problem.goal.maximize
+        self.goal: Dict[int, RationalNumber] = dict(problem.goal.factors.items())
+        self.offset = problem.goal.offset
+        self.rows = [[restriction.kind, dict(restriction.factors.items()), restriction.right_side] for restriction in problem.restrictions]
+        self.lower: Dict[int, Optional[RationalNumber]] = {j: bounds[0] for j, bounds in problem.bounds.items()}
+        self.upper: Dict[int, Optional[RationalNumber]] = {j: bounds[1] for j, bounds in problem.bounds.items()}
+        self.fixed: Dict[int, RationalNumber] = {}
+        for j in range(self.column_count):
+            self.round_bounds(j)
+            self.check_bounds(j)
+
+        for _ in range(self.max_passes):
+            changed = self.fix_columns()
+            changed |= self.reduce_rows()
+            changed |= self.merge_duplicate_rows()
+            changed |= self.remove_dominated_rows()
+            changed |= self.fix_empty_columns()
+            if not changed:
+                break
+
+        reduced = self.build_problem()
+        # Без ограничений задача решена полностью: оставшиеся переменные могут расти неограниченно
+        if not self.rows:
+            self.status = SolveStatus.UNBOUNDED if len(self.fixed) < self.column_count else SolveStatus.OPTIMAL
+        self.tracer.message(
+            TraceLevel.SUMMARY,
+            f"\nПредобработка: удалено строк {len(problem.restrictions) - len(reduced.restrictions)}, "
+            f"зафиксировано переменных {len(self.fixed)}"
+        )
+        return reduced
+
+    def get_lower(self, j: int) -> Optional[RationalNumber]:
+        return self.lower.get(j, RationalNumber.NULL)
+
+    def get_upper(self, j: int) -> Optional[RationalNumber]:
+        return self.upper.get(j)
+
+    def variable_name(self, j: int) -> str:
+        return self.problem.names[j] if j < len(self.problem.names) else f"x{j + 1}"
+
+    def fix(self, j: int, value: RationalNumber) -> None:
+        self.fixed[j] = value
+        self.stack.append(('fix', j, value))
+        factor = self.goal.pop(j, None)
+        if factor is not None:
+            self.offset = self.offset.sum(factor.product(value))
+        for row in self.rows:
+            factor = row[1].pop(j, None)
+            if factor is not None:
+                row[2] = row[2].difference(factor.product(value))
+
+    def fix_columns(self) -> bool:
+        changed = False
+        for j in range(self.column_count):
+            lower, upper = self.get_lower(j), self.get_upper(j)
+            if j not in self.fixed and lower is not None and upper is not None and lower.is_equal(upper):
+                self.fix(j, lower)
+                self.stats['fixed_columns'] += 1
+                changed = True
+        return changed
+
+    def tighten(self, j: int, kind: RestrictionType, value: RationalNumber) -> None:
+        lower, upper = self.get_lower(j), self.get_upper(j)
+        if kind != RestrictionType.ABOVE and (upper is None or value.order(upper) < 0):
+            self.upper[j] = upper = value
+        if kind != RestrictionType.BELOW and (lower is None or value.order(lower) > 0):
+            self.lower[j] = lower = value
+        self.round_bounds(j)
+        self.check_bounds(j)
+
+    def round_bounds(self, j: int) -> None:
+        # Границы целочисленной переменной сужаются до целых, иначе фиксация дала бы дробное значение
+        if j not in self.problem.integers:
+            return
+        lower, upper = self.get_lower(j), self.get_upper(j)
+        if lower is not None and lower.bottom != 1:
+            self.lower[j] = RationalNumber(-(-lower.top // lower.bottom))
+        if upper is not None and upper.bottom != 1:
+            self.upper[j] = RationalNumber(upper.top // upper.bottom)
+
+    def check_bounds(self, j: int) -> None:
+        lower, upper = self.get_lower(j), self.get_upper(j)
+        if lower is not None and upper is not None and lower.order(upper) > 0:
+            raise ValueError(f"Система ограничений несовместна: противоречивые границы переменной {self.variable_name(j)}")
+
+    def reduce_rows(self) -> bool:
+        kept = []
+        for kind, factors, right_side in self.rows:
+            if not factors:
+                sign = RationalNumber.NULL.order(right_side)
+                if (kind == RestrictionType.BELOW and sign > 0) or (kind == RestrictionType.ABOVE and sign < 0) or \
+                        (kind == RestrictionType.EQUALS and sign != 0):
+                    raise ValueError("Система ограничений несовместна: пустое ограничение")
+                self.stats['empty_rows'] += 1
+            elif len(factors) == 1:
+                (j, factor), = factors.items()
+                if factor.order(RationalNumber.NULL) < 0:
+                    kind = {RestrictionType.BELOW: RestrictionType.ABOVE, RestrictionType.ABOVE: RestrictionType.BELOW}.get(kind, kind)
+                self.tighten(j, kind, right_side.quotient(factor))
+                self.stats['singleton_rows'] += 1
+            else:
+                kept.append([kind, factors, right_side])
+        changed = len(kept) != len(self.rows)
+        self.rows = kept
+        return changed
+
+    def merge_duplicate_rows(self) -> bool:
+        groups: Dict[tuple, List[RationalNumber | None]] = {}
+        order = []
+        for kind, factors, right_side in self.rows:
+            first = factors[min(factors)]
+            scale = first.absolute()
+            if first.order(RationalNumber.NULL) < 0:
+                scale = scale.invert()
+                kind = {RestrictionType.BELOW: RestrictionType.ABOVE, RestrictionType.ABOVE: RestrictionType.BELOW}.get(kind, kind)
+            key = tuple(sorted((j, value.quotient(scale)) for j, value in factors.items()))
+            value = right_side.quotient(scale)
+            if key not in groups:
+                groups[key] = [None, None, 0]
+                order.append(key)
+            bounds = groups[key]
+            bounds[2] += 1
+            if kind != RestrictionType.BELOW and (bounds[0] is None or value.order(bounds[0]) > 0):
+                bounds[0] = value
+            if kind != RestrictionType.ABOVE and (bounds[1] is None or value.order(bounds[1]) < 0):
+                bounds[1] = value
+        if len(order) == len(self.rows):
+            return False
 
-        while len(factors) <= max_var_index:
-            factors.append(RationalNumber.NULL)
+        rows = []
+        for key in order:
+            lower, upper, count = groups[key]
+            factors = dict(key)
+            if lower is not None and upper is not None and lower.order(upper) > 0:
+                raise ValueError("Система ограничений несовместна: противоречивые пропорциональные ограничения")
+            if lower is not None and upper is not None and lower.is_equal(upper):
+                rows.append([RestrictionType.EQUALS, factors, lower])
+            else:
+                if upper is not None:
+                    rows.append([RestrictionType.BELOW, factors, upper])
+                if lower is not None:
+                    rows.append([RestrictionType.ABOVE, dict(key), lower])
+        # Пара строк диапазонного ограничения собирается заново без изменений и не должна продлевать проходы
+        changed = len(rows) != len(self.rows)
+        self.stats['duplicate_rows'] += len(self.rows) - len(rows)
+        self.rows = rows
+        return changed
+
+    def activity_bounds(self, factors: Dict[int, RationalNumber]) -> tuple[Optional[RationalNumber], Optional[RationalNumber]]:
+        low = high = RationalNumber.NULL
+        for j, factor in factors.items():
+            lower, upper = self.get_lower(j), self.get_upper(j)
+            if factor.order(RationalNumber.NULL) < 0:
+                lower, upper = upper, lower
+            low = None if low is None or lower is None else low.sum(factor.product(lower))
+            high = None if high is None or upper is None else high.sum(factor.product(upper))
+        return low, high
+
+    def remove_dominated_rows(self) -> bool:
+        kept = []
+        for kind, factors, right_side in self.rows:
+            low, high = self.activity_bounds(factors)
+            if (kind != RestrictionType.ABOVE and low is not None and low.order(right_side) > 0) or \
+                    (kind != RestrictionType.BELOW and high is not None and high.order(right_side) < 0):
+                raise ValueError("Система ограничений несовместна: ограничение недостижимо при заданных границах")
+            redundant_below = high is not None and high.order(right_side) <= 0
+            redundant_above = low is not None and low.order(right_side) >= 0
+            if (kind == RestrictionType.BELOW and redundant_below) or (kind == RestrictionType.ABOVE and redundant_above) or \
+                    (kind == RestrictionType.EQUALS and redundant_below and redundant_above):
+                self.stats['redundant_rows'] += 1
+            else:
+                kept.append([kind, factors, right_side])
+        changed = len(kept) != len(self.rows)
+        self.rows = kept
+        return changed
+
+    def fix_empty_columns(self) -> bool:
+        used = set()
+        for row in self.rows:
+            used.update(row[1])
+        changed = False
+        for j in range(self.column_count):
+            if j in self.fixed or j in used:
+                continue
+            factor = self.goal.get(j, RationalNumber.NULL)
+            direction = factor.order(RationalNumber.NULL) * (1 if self.maximize else -1)
+            lower, upper = self.get_lower(j), self.get_upper(j)
+            if direction > 0:
+                value = upper
+            elif direction < 0:
+                value = lower
+            elif lower is not None:
+                value = lower
+            else:
+                value = RationalNumber.NULL if upper is None or upper.order(RationalNumber.NULL) >= 0 else upper
+            # Без ограничивающей границы переменная оставляется решателю, чтобы он сообщил о неограниченности
+            if value is None:
+                continue
+            self.fix(j, value)
+            self.stats['empty_columns'] += 1
+            changed = True
+        return changed
+
+    def build_problem(self) -> LinearProblem:
+        kept = [j for j in range(self.column_count) if j not in self.fixed]
+        index = {j: k for k, j in enumerate(kept)}
+        self.stack.append(('compress', kept))
+
+        goal = Goal(self.maximize, SparseRow(len(kept), {index[j]: value for j, value in self.goal.items()}), self.offset)
+        restrictions = [
+            Limit(kind, SparseRow(len(kept), {index[j]: value for j, value in factors.items()}), right_side)
+            for kind, factors, right_side in self.rows
+        ]
+        reduced = LinearProblem(goal, restrictions)
+        reduced.names = [self.problem.names[j] for j in kept] if self.problem.names else []
+        reduced.integers = {index[j] for j in self.problem.integers if j in index}
+        for j in kept:
+            lower, upper = self.get_lower(j), self.get_upper(j)
+            if upper is not None or lower is None or not lower.is_equal(RationalNumber.NULL):
+                reduced.bounds[index[j]] = (lower, upper)
+        return reduced
+
+    def postsolve(self, solution: List[RationalNumber]) -> List[RationalNumber]:
+        values = list(solution)
+        for record in reversed(self.stack):
+            if record[0] == 'compress':
+                expanded = [RationalNumber.NULL] * self.column_count
+                for k, j in enumerate(record[1]):
+                    expanded[j] = values[k]
+                values = expanded
+            elif record[0] == 'fix':
+                values[record[1]] = record[2]
+        return values
 
 
 class FormTransformer:
     @staticmethod
-    def transform(problem: 'LinearProblem') -> 'CanonicalForm':
+    def transform(problem: 'LinearProblem', tracer: Tracer = SILENT_TRACER, native_bounds: bool = False) -> 'CanonicalForm':
         canonical_form = CanonicalForm()
         canonical_form.maximize = True if not problem.goal.maximize else problem.goal.maximize  # min -> max, max остается max
-        canonical_form.goal_offset = problem.goal.offset
+        canonical_form.goal_offset = problem.goal.offset if problem.goal.maximize else problem.goal.offset.invert()
         original_var_count = FormTransformer.count_original_vars(problem)
 
-        canonical_form.goal_factors = (problem.goal.factors if problem.goal.maximize else [factor.invert() for factor in problem.goal.factors])
+        canonical_form.goal_factors = (list(problem.goal.factors) if problem.goal.maximize else [factor.invert() for factor in problem.goal.factors])
 
         aux_counter = 0
         canonical_form.base_indices = []
 
-        for restriction in problem.restrictions:
-            row = restriction.factors[:]
-            while len(row) < original_var_count:
-                row.append(RationalNumber.NULL)
+        free_vars = sorted(j for j, (lower, _) in problem.bounds.items() if lower is None)
+        bound_rows = FormTransformer.bound_restrictions(problem, native_bounds)
+        for restriction in problem.restrictions + bound_rows:
+            row = restriction.factors.copy()
+            row.resize(original_var_count)
             if restriction.kind == RestrictionType.BELOW:
                 FormTransformer.add_positive_aux(row, aux_counter)
                 canonical_form.base_indices.append(original_var_count + aux_counter)
@@ -660,19 +4088,104 @@ class FormTransformer:
 
         for i in range(len(canonical_form.right_sides)):
             if canonical_form.right_sides[i].order(RationalNumber.NULL) < 0:
-                canonical_form.restriction_matrix[i] = [factor.invert() for factor in canonical_form.restriction_matrix[i]]
+                canonical_form.restriction_matrix[i] = canonical_form.restriction_matrix[i].negated()
                 canonical_form.right_sides[i] = canonical_form.right_sides[i].invert()
 
-        total_vars = original_var_count + aux_counter
-        canonical_form.aux_vars = aux_counter
+        # Свободные переменные x = x+ - x-: отрицательные части добавляются после дополнительных переменных
+        # и считаются вспомогательными, поэтому не попадают в решение
+        total_vars = original_var_count + aux_counter + len(free_vars)
+        canonical_form.aux_vars = aux_counter + len(free_vars)
+        canonical_form.free_columns = {j: original_var_count + aux_counter + k for k, j in enumerate(free_vars)}
 
         for row in canonical_form.restriction_matrix:
-            while len(row) < total_vars:
-                row.append(RationalNumber.NULL)
+            row.resize(total_vars)
         while len(canonical_form.goal_factors) < total_vars:
             canonical_form.goal_factors.append(RationalNumber.NULL)
+        for j, negative in canonical_form.free_columns.items():
+            for row in canonical_form.restriction_matrix:
+                if row[j].top != 0:
+                    row[negative] = row[j].invert()
+            canonical_form.goal_factors[negative] = canonical_form.goal_factors[j].invert()
+        if native_bounds and problem.bounds:
+            canonical_form.lower_shifts, canonical_form.upper_bounds = FormTransformer.column_bounds(problem, total_vars)
+        elif any(lower is not None and lower.top < 0 for lower, _ in problem.bounds.values()):
+            # Отрицательная нижняя граница не выражается строкой x >= l при x >= 0, поэтому выполняется сдвиг x = l + x'
+            canonical_form.lower_shifts = [RationalNumber.NULL] * total_vars
+            for j, (lower, _) in problem.bounds.items():
+                if lower is not None and lower.top < 0:
+                    canonical_form.lower_shifts[j] = lower
+
+        tracer.emit(TraceLevel.SUMMARY, 'canonical_form', title="\nКаноническая форма:", canonical_form=canonical_form)
+
+        # Исключение по Гауссу-Жордану здесь только для вывода, поэтому выполняется лишь при подробной трассировке
+        if tracer.level >= TraceLevel.ROW_OP:
+            initial_matrix = [row.to_dense() for row in canonical_form.restriction_matrix]
+            for i in range(len(initial_matrix)):
+                initial_matrix[i].append(canonical_form.right_sides[i])
+
+            MatrixSolver.display_matrix(initial_matrix, tracer, "\nИсходная матрица:")
+            tracer.message(TraceLevel.ROW_OP, "\nВыполнение исключения по Гауссу-Джордану:")
+            MatrixSolver.gauss_jordan(initial_matrix, tracer)
+            MatrixSolver.display_matrix(initial_matrix, tracer, "\nМатрица после преобразований методом Гаусса-Жордана:")
+
+        return canonical_form
+
+    @staticmethod
+    def add_positive_aux(row: SparseRow, aux_index: int) -> None:
+        row[len(row) + aux_index] = RationalNumber.UNITY
+
+    @staticmethod
+    def add_negative_aux(row: SparseRow, aux_index: int) -> None:
+        row[len(row) + aux_index] = RationalNumber.NEGATIVE_UNITY
+
+    @staticmethod
+    def bound_restrictions(problem: 'LinearProblem', native_bounds: bool = False) -> List[Limit]:
+        # Верхняя граница свободной переменной остаётся строкой и при встроенных границах:
+        # она ограничивает разность двух столбцов
+        restrictions = []
+        for index, (lower, upper) in sorted(problem.bounds.items()):
+            if native_bounds and lower is not None:
+                continue
+            row = SparseRow(index + 1, {index: RationalNumber.UNITY})
+            if lower is None:
+                if upper is not None:
+                    restrictions.append(Limit(RestrictionType.BELOW, row, upper))
+                continue
+            if upper is not None and lower.is_equal(upper):
+                restrictions.append(Limit(RestrictionType.EQUALS, row, upper))
+                continue
+            if lower.order(RationalNumber.NULL) > 0:
+                restrictions.append(Limit(RestrictionType.ABOVE, row.copy(), lower))
+            if upper is not None:
+                restrictions.append(Limit(RestrictionType.BELOW, row, upper))
+        return restrictions
+
+    @staticmethod
+    def column_bounds(problem: 'LinearProblem', total_vars: int) -> tuple[List[RationalNumber], List[Optional[RationalNumber]]]:
+        lower_shifts = [RationalNumber.NULL] * total_vars
+        upper_bounds: List[Optional[RationalNumber]] = [None] * total_vars
+        for index, (lower, upper) in problem.bounds.items():
+            if lower is None:
+                continue
+            lower_shifts[index] = lower
+            upper_bounds[index] = upper
+        return lower_shifts, upper_bounds
+
+    @staticmethod
+    def count_original_vars(problem: 'LinearProblem') -> int:
+        max_vars = max(len(problem.goal.factors), len(problem.names), max(problem.bounds, default=-1) + 1)
+        for restriction in problem.restrictions:
+            max_vars = max(max_vars, len(restriction.factors))
+        return max_vars
+
+
+class TableFormatter:
+    @staticmethod
+    def format_problem(problem: 'LinearProblem') -> None:
+        pass
 
-        print("\nКаноническая форма:")
+    @staticmethod
+    def format_canonical_form(canonical_form: 'CanonicalForm') -> str:
         terms = []
         first_term = True
         for i, factor in enumerate(canonical_form.goal_factors):
@@ -687,15 +4200,14 @@ class FormTransformer:
         if not canonical_form.goal_offset.is_equal(RationalNumber.NULL):
             sign = '+' if canonical_form.goal_offset.order(RationalNumber.NULL) > 0 else '-'
             goal_str += f" {sign} {canonical_form.goal_offset.absolute()}"
-        print("Уравнение Z:")
-        print(f"Z = {goal_str} -> {'max' if canonical_form.maximize else 'min'}")
-
+        lines = ["Уравнение Z:", f"Z = {goal_str} -> {'max' if canonical_form.maximize else 'min'}"]
 
-        restriction_lines = []
+        lines.append("Ограничения:")
+        lines.append("{")
         for i, row in enumerate(canonical_form.restriction_matrix):
             terms = []
             first_term = True
-            for j, factor in enumerate(row):
+            for j, factor in sorted(row.items()):
                 if not factor.is_equal(RationalNumber.NULL):
                     if first_term:
                         terms.append(f"{factor}x{j + 1}")
@@ -703,57 +4215,19 @@ class FormTransformer:
                     else:
                         sign = '+' if factor.order(RationalNumber.NULL) > 0 else '-'
                         terms.append(f" {sign} {factor.absolute()}x{j + 1}")
-            restriction_line = "".join(terms).strip() + f" = {canonical_form.right_sides[i]}"
-            restriction_lines.append(restriction_line)
-
-        print("Ограничения:")
-        print("{")
-        for line in restriction_lines:
-            print(f" {line}")
-        print("}")
-
-        initial_matrix = [row[:] for row in canonical_form.restriction_matrix]
-        for i in range(len(initial_matrix)):
-            initial_matrix[i].append(canonical_form.right_sides[i])
-
-        print("\nИсходная матрица:")
-        MatrixSolver.display_matrix(initial_matrix)
-
-        print("\nВыполнение исключения по Гауссу-Джордану:")
-        MatrixSolver.gauss_jordan(initial_matrix)
-
-        print("\nМатрица после преобразований методом Гаусса-Жордана:")
-        MatrixSolver.display_matrix(initial_matrix)
-
-        return canonical_form
-
-    @staticmethod
-    def add_positive_aux(row: List[RationalNumber], aux_index: int) -> None:
-        for _ in range(aux_index):
-            row.append(RationalNumber.NULL)
-        row.append(RationalNumber.UNITY)
-
-    @staticmethod
-    def add_negative_aux(row: List[RationalNumber], aux_index: int) -> None:
-        for _ in range(aux_index):
-            row.append(RationalNumber.NULL)
-        row.append(RationalNumber.NEGATIVE_UNITY)
-
-    @staticmethod
-    def count_original_vars(problem: 'LinearProblem') -> int:
-        max_vars = len(problem.goal.factors)
-        for restriction in problem.restrictions:
-            max_vars = max(max_vars, len(restriction.factors))
-        return max_vars
-
-
-class TableFormatter:
-    @staticmethod
-    def format_problem(problem: 'LinearProblem') -> None:
-        pass
+            lines.append(f" {''.join(terms).strip()} = {canonical_form.right_sides[i]}")
+        lines.append("}")
+        if canonical_form.upper_bounds is not None:
+            bounds = []
+            for j, (lower, upper) in enumerate(zip(canonical_form.lower_shifts, canonical_form.upper_bounds)):
+                if upper is not None or lower.top != 0:
+                    bounds.append(f" {lower} <= x{j + 1}" + ("" if upper is None else f" <= {upper}"))
+            lines.append("Границы переменных:")
+            lines.extend(bounds)
+        return "\n".join(lines)
 
     @staticmethod
-    def display_table(table: 'LinearTable') -> None:
+    def format_table(table: 'LinearTable') -> str:
         width = len(table.matrix[0])
         headers = [f"x{i + 1}" for i in range(width - 1)] + ["1"]
         rows = []
@@ -771,21 +4245,55 @@ class TableFormatter:
         col_widths = [max(w, len(h)) for w, h in zip(col_widths, headers)]
         basis_col_width = max(len(basis_var) for basis_var in basis_vars + ["Базис"])
 
-        top_border = "┌" + "─" * (basis_col_width + 2) + "┬" + "─".join("─" * (w + 2) for w in col_widths) + "┐"
-        print(top_border)
+        lines = ["┌" + "─" * (basis_col_width + 2) + "┬" + "─".join("─" * (w + 2) for w in col_widths) + "┐"]
 
         header_cells = [f" {'Базис':<{basis_col_width}} "] + [f" {h:<{w}} " for h, w in zip(headers, col_widths)]
-        print("│" + "│".join(header_cells) + "│")
-
-        separator = "├" + "─" * (basis_col_width + 2) + "┼" + "─".join("─" * (w + 2) for w in col_widths) + "┤"
-        print(separator)
+        lines.append("│" + "│".join(header_cells) + "│")
+        lines.append("├" + "─" * (basis_col_width + 2) + "┼" + "─".join("─" * (w + 2) for w in col_widths) + "┤")
 
         for basis_var, row in zip(basis_vars, rows):
             cells = [f" {basis_var:<{basis_col_width}} "] + [f" {str(cell):<{w}} " for cell, w in zip(row, col_widths)]
-            print("│" + "│".join(cells) + "│")
+            lines.append("│" + "│".join(cells) + "│")
+
+        lines.append("└" + "─" * (basis_col_width + 2) + "┴" + "─".join("─" * (w + 2) for w in col_widths) + "┘")
+        return "\n".join(lines)
+
+    @staticmethod
+    def format_sensitivity(analysis: SensitivityAnalysis) -> str:
+        def interval(bounds: tuple[Optional[RationalNumber], Optional[RationalNumber]]) -> str:
+            low, high = bounds
+            return f"[{'-inf' if low is None else low}; {'+inf' if high is None else high}]"
+
+        names = analysis.problem.names
+        lines = ["Ограничения:"]
+        rows = {number: i for i, number in enumerate(analysis.row_numbers)}
+        for number in sorted(set(rows) | set(analysis.bound_prices)):
+            if number in analysis.bound_prices:
+                (j, _), = analysis.problem.bound_rows[number].factors.items()
+                name = names[j] if j < len(names) else f"x{j + 1}"
+                price = analysis.bound_prices[number]
+                lines.append(f" {number + 1}: граница переменной {name}, двойственная оценка {'-' if price is None else price}")
+                continue
+            i = rows[number]
+            restriction = analysis.problem.restrictions[i]
+            price = analysis.shadow_prices[i]
+            lines.append(
+                f" {number + 1}: двойственная оценка {'-' if price is None else price}, "
+                f"правая часть {restriction.right_side} в пределах {interval(analysis.rhs_ranges[i])}"
+            )
+        lines.append("Переменные:")
+        for j in range(analysis.var_count):
+            name = names[j] if j < len(names) else f"x{j + 1}"
+            cost = analysis.problem.goal.factors[j]
+            lines.append(
+                f" {name}: приведённая стоимость {analysis.reduced_costs[j]}, "
+                f"коэффициент {cost} в пределах {interval(analysis.cost_ranges[j])}"
+            )
+        return "\n".join(lines)
 
-        bottom_border = "└" + "─" * (basis_col_width + 2) + "┴" + "─".join("─" * (w + 2) for w in col_widths) + "┘"
-        print(bottom_border)
+    @staticmethod
+    def display_table(table: 'LinearTable') -> None:
+        print(TableFormatter.format_table(table))
 
     @staticmethod
     def get_symbol(kind: 'RestrictionType') -> str:
@@ -796,8 +4304,456 @@ class TableFormatter:
         }[kind]
 
 
-def load_problem(file_path: str) -> 'LinearProblem':
-    return ProblemReader.read_problem(file_path)
+class SolveStats:
+    operations = {'sum': '__add__', 'difference': '__sub__', 'product': '__mul__', 'quotient': '__truediv__'}
+    # Подсчёт ведётся в статистику текущего контекста, поэтому параллельные решения в потоках не смешивают счётчики
+    current: contextvars.ContextVar[Optional['SolveStats']] = contextvars.ContextVar('solve_stats', default=None)
+    lock = threading.Lock()
+    users = 0
+    originals: Dict[str, object] = {}
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self.pivots = 0
+        self.operation_counts: Dict[str, int] = dict.fromkeys(self.operations, 0)
+        self.gcd_calls = 0
+        # Наибольшая длина числителя или знаменателя в битах после каждой итерации
+        self.bit_lengths: List[int] = []
+        self.token: Optional[contextvars.Token] = None
+
+    def measure(self, phase: str, function, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.timings[phase] = self.timings.get(phase, 0.0) + time.perf_counter() - started
+
+    def record_pivot(self, bits: int) -> None:
+        self.pivots += 1
+        self.bit_lengths.append(bits)
+
+    @property
+    def max_bits(self) -> int:
+        return max(self.bit_lengths, default=0)
+
+    def start_counting(self) -> None:
+        # Вложенный подсчёт в том же контексте не запускается, операции достаются внешнему
+        if SolveStats.current.get() is not None:
+            return
+        self.token = SolveStats.current.set(self)
+        with SolveStats.lock:
+            if SolveStats.users == 0:
+                SolveStats.install()
+            SolveStats.users += 1
+
+    def stop_counting(self) -> None:
+        if self.token is None:
+            return
+        SolveStats.current.reset(self.token)
+        self.token = None
+        with SolveStats.lock:
+            SolveStats.users -= 1
+            if SolveStats.users == 0:
+                SolveStats.uninstall()
+
+    @classmethod
+    def install(cls) -> None:
+        # Методы RationalNumber подменяются, пока идёт хотя бы один подсчёт; операции вне подсчитываемых
+        # контекстов проходят через обёртку без учёта
+        cls.originals = {name: RationalNumber.__dict__[name] for name in list(cls.operations) + list(cls.operations.values())}
+        for name, special in cls.operations.items():
+            wrapper = cls.counted(name, RationalNumber.__dict__[special])
+            setattr(RationalNumber, name, wrapper)
+            setattr(RationalNumber, special, wrapper)
+        reduce_pair = RationalNumber.reduce_pair
+        current = cls.current
+
+        def counted_reduce(top: int, bottom: int) -> tuple[int, int]:
+            stats = current.get()
+            if stats is not None:
+                stats.gcd_calls += 1
+            return reduce_pair(top, bottom)
+        RationalNumber.reduce_pair = staticmethod(counted_reduce)
+
+    @classmethod
+    def counted(cls, name: str, method):
+        current = cls.current
+
+        def wrapper(number: RationalNumber, other: 'RationalNumber | int') -> RationalNumber:
+            stats = current.get()
+            if stats is not None:
+                stats.operation_counts[name] += 1
+            return method(number, other)
+        return wrapper
+
+    @classmethod
+    def uninstall(cls) -> None:
+        for name, value in cls.originals.items():
+            setattr(RationalNumber, name, value)
+        cls.originals = {}
+        # Арифметика могла смениться во время подсчёта, поэтому сокращение берётся из текущей, а не из сохранённой
+        RationalNumber.use_backend(RationalNumber.backend)
+
+    def to_dict(self) -> dict:
+        return {
+            'timings': dict(self.timings),
+            'pivots': self.pivots,
+            'operations': dict(self.operation_counts),
+            'gcd_calls': self.gcd_calls,
+            'max_bits': self.max_bits,
+            'bit_lengths': list(self.bit_lengths),
+        }
+
+
+class SolveOptions:
+    def __init__(self, engine: str = 'rational', mode: str = 'auto', pricing: str | PricingRule = 'dantzig', basis_method: str = 'auto',
+                 presolve: bool = False, sensitivity: bool = False, workers: int = 1, tracer: Tracer = SILENT_TRACER,
+                 engine_options: Optional[dict] = None, max_iterations: Optional[int] = None, time_limit: Optional[float] = None,
+                 cancel_token: Optional[CancelToken] = None, stats: Optional[SolveStats] = None, cache: Optional['ResultCache'] = None,
+                 network: bool = True):
+        self.engine = engine
+        self.mode = mode
+        self.pricing = pricing
+        self.basis_method = basis_method
+        self.presolve = presolve
+        self.sensitivity = sensitivity
+        self.workers = workers
+        self.tracer = tracer
+        self.engine_options = engine_options or {}
+        self.max_iterations = max_iterations
+        self.time_limit = time_limit
+        self.cancel_token = cancel_token
+        self.stats = stats
+        self.cache = cache
+        self.network = network
+
+
+class SolveResult:
+    def __init__(self, status: Optional[SolveStatus] = None):
+        self.status = status
+        self.objective: Optional[RationalNumber] = None
+        self.x: Optional[List[RationalNumber]] = None
+        self.basis: Optional[List[int]] = None
+        self.iterations = 0
+        self.nodes = 0
+        self.timings: Dict[str, float] = {}
+        self.table: Optional[LinearTable] = None
+        self.sensitivity: Optional[SensitivityAnalysis] = None
+        self.stats: Optional[SolveStats] = None
+        self.message: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            'status': None if self.status is None else self.status.value,
+            'objective': None if self.objective is None else str(self.objective),
+            'x': None if self.x is None else [str(value) for value in self.x],
+            'basis': self.basis,
+            'iterations': self.iterations,
+            'nodes': self.nodes,
+            'timings': dict(self.timings),
+            'stats': None if self.stats is None else self.stats.to_dict(),
+            'message': self.message,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SolveResult':
+        result = cls(None if data['status'] is None else SolveStatus(data['status']))
+        result.objective = None if data['objective'] is None else RationalNumber(data['objective'])
+        result.x = None if data['x'] is None else [RationalNumber(value) for value in data['x']]
+        result.basis = None if data['basis'] is None else list(data['basis'])
+        result.iterations = data['iterations']
+        result.nodes = data['nodes']
+        result.message = data['message']
+        return result
+
+    def copy(self) -> 'SolveResult':
+        result = SolveResult(self.status)
+        result.objective = self.objective
+        result.x = None if self.x is None else list(self.x)
+        result.basis = None if self.basis is None else list(self.basis)
+        result.iterations = self.iterations
+        result.nodes = self.nodes
+        result.table = None if self.table is None else self.table.copy()
+        result.message = self.message
+        return result
+
+
+class ResultCache:
+    # Результаты при остановке по пределу зависят от пределов и не сохраняются
+    statuses = {SolveStatus.OPTIMAL, SolveStatus.INFEASIBLE, SolveStatus.UNBOUNDED}
+
+    def __init__(self, max_entries: int = 128, directory: Optional[str] = None, max_bytes: int = 64 * 1024 * 1024):
+        if max_entries < 0 or max_bytes < 0:
+            raise ValueError("Размер кэша не может быть отрицательным")
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[str, SolveResult] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def accepts(options: 'SolveOptions') -> bool:
+        # Трассировка, статистика и анализ чувствительности требуют настоящего решения
+        return options.tracer.level < TraceLevel.SUMMARY and options.stats is None and not options.sensitivity
+
+    @staticmethod
+    def fraction_key(value: Optional[RationalNumber]) -> Optional[str]:
+        return None if value is None else f"{value.top}/{value.bottom}"
+
+    @classmethod
+    def row_key(cls, factors: SparseRow) -> List[list]:
+        return [[j, cls.fraction_key(value)] for j, value in sorted(factors.items()) if value.top != 0]
+
+    @classmethod
+    def problem_key(cls, problem: LinearProblem, engine: str, options: 'SolveOptions') -> str:
+        # Порядок ограничений сохраняется: от него зависят номера дополнительных переменных в базисе
+        goal = problem.goal
+        model = {
+            'vars': FormTransformer.count_original_vars(problem),
+            'goal': [goal.maximize, cls.row_key(goal.factors), cls.fraction_key(goal.offset)],
+            'restrictions': [[limit.kind.name, cls.row_key(limit.factors), cls.fraction_key(limit.right_side)] for limit in problem.restrictions],
+            'integers': sorted(problem.integers),
+            'bounds': [[j, cls.fraction_key(lower), cls.fraction_key(upper)] for j, (lower, upper) in sorted(problem.bounds.items())],
+            'engine': engine,
+            'mode': options.mode,
+            'pricing': options.pricing if isinstance(options.pricing, str) else type(options.pricing).__name__,
+            'basis_method': options.basis_method,
+            'presolve': options.presolve,
+            'engine_options': options.engine_options,
+            # Сетевой путь и число процессов метода ветвей и границ меняют базис, число итераций и выбор среди равных решений
+            'network': options.network,
+            'workers': options.workers,
+        }
+        text = json.dumps(model, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[SolveResult]:
+        result = self.entries.get(key)
+        if result is not None:
+            self.entries.move_to_end(key)
+        elif self.directory is not None:
+            result = self.load(key)
+            if result is not None:
+                self.remember(key, result)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result.copy()
+
+    def put(self, key: str, result: SolveResult) -> None:
+        if result.status not in self.statuses:
+            return
+        stored = result.copy()
+        self.remember(key, stored)
+        if self.directory is not None:
+            self.store(key, stored)
+
+    def remember(self, key: str, result: SolveResult) -> None:
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.json')
+
+    def load(self, key: str) -> Optional[SolveResult]:
+        path = self.path(key)
+        try:
+            with open(path, encoding='utf-8') as file:
+                result = SolveResult.from_dict(json.load(file))
+        except (OSError, ValueError, KeyError):
+            return None
+        # Время изменения файла служит меткой последнего обращения для вытеснения
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def store(self, key: str, result: SolveResult) -> None:
+        data = result.to_dict()
+        del data['timings'], data['stats']
+        path = self.path(key)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary, 'w', encoding='utf-8') as file:
+                json.dump(data, file, ensure_ascii=False)
+            os.replace(temporary, path)
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                try:
+                    info = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                files.append((info.st_mtime, info.st_size, name))
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self) -> None:
+        self.entries.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
+
+
+def solve(problem: LinearProblem, engine: Optional[str] = None, options: Optional[SolveOptions] = None) -> SolveResult:
+    options = options or SolveOptions()
+    # После предобработки строки и столбцы таблицы относятся к сокращённой задаче, а не к исходной
+    if options.sensitivity and options.presolve:
+        raise ValueError("Анализ чувствительности несовместим с предобработкой задачи")
+    engine = engine or options.engine
+    tracer = options.tracer
+    result = SolveResult()
+    started = time.perf_counter()
+    limits = {
+        'max_iterations': options.max_iterations,
+        'deadline': None if options.time_limit is None else time.monotonic() + options.time_limit,
+        'cancel_token': options.cancel_token,
+    }
+
+    def mark(stage: str, since: float) -> float:
+        now = time.perf_counter()
+        result.timings[stage] = now - since
+        return now
+
+    cache, key = options.cache, None
+    if cache is not None and ResultCache.accepts(options):
+        key = cache.problem_key(problem, engine, options)
+        cached = cache.get(key)
+        if cached is not None:
+            cached.timings['total'] = time.perf_counter() - started
+            return cached
+
+    stats = result.stats = options.stats
+    try:
+        if stats is not None:
+            stats.start_counting()
+        presolver = None
+        if options.presolve:
+            presolver = Presolver(problem, tracer=tracer)
+            stage = time.perf_counter()
+            try:
+                problem = presolver.presolve()
+            except ValueError as e:
+                result.status, result.message = SolveStatus.INFEASIBLE, str(e)
+                return result
+            mark('presolve', stage)
+            if presolver.status is not None:
+                result.status = presolver.status
+                if presolver.status == SolveStatus.OPTIMAL:
+                    result.objective = problem.goal.offset
+                    result.x = presolver.postsolve([])
+                return result
+
+        # Транспортные задачи и задачи о назначениях решаются без таблицы; при трассировке и анализе
+        # чувствительности нужна таблица, поэтому используется обычный путь
+        structure = None
+        if options.network and tracer.level < TraceLevel.SUMMARY and not options.sensitivity:
+            structure = NetworkStructure.detect(problem)
+        if structure is not None:
+            solver = structure.create_solver(**limits)
+            stage = time.perf_counter()
+            result.status = solver.solve()
+            mark('network', stage)
+            result.iterations = solver.iterations
+            result.message = LIMIT_MESSAGES.get(result.status)
+            if result.status == SolveStatus.OPTIMAL:
+                result.objective = structure.objective(solver.solution)
+                result.x = presolver.postsolve(solver.solution) if presolver is not None else solver.solution
+            return result
+
+        if problem.integers:
+            solver = BranchAndBound(engine, options.workers, tracer, mode=options.mode, pricing=options.pricing, **limits, **options.engine_options)
+            solver.stats = stats
+            stage = time.perf_counter()
+            result.status = solver.solve(problem)
+            mark('branch_and_bound', stage)
+            result.iterations, result.nodes, result.table = solver.iterations, solver.nodes, solver.table
+            result.message = LIMIT_MESSAGES.get(result.status)
+            if solver.table is not None:
+                result.objective = solver.objective
+                result.x = presolver.postsolve(solver.solution) if presolver is not None else solver.solution
+                result.basis = list(solver.table.base_indices)
+            return result
+
+        optimizer = LinearOptimizer.create(engine, tracer=tracer, mode=options.mode, pricing=options.pricing, **limits, **options.engine_options)
+        optimizer.stats = stats
+        stage = time.perf_counter()
+        try:
+            canonical_form = FormTransformer.transform(problem, tracer, optimizer.native_bounds)
+            stage = mark('transform', stage)
+            # Прямой симплекс-метод требует допустимого базиса, двойственный старт ему не подходит
+            basis_method = 'phase1' if options.mode == 'primal' and options.basis_method == 'auto' else options.basis_method
+            table = optimizer.build_table(canonical_form, basis_method)
+        except ValueError as e:
+            result.status, result.message = SolveStatus.INFEASIBLE, str(e)
+            return result
+        stage = mark('basis', stage)
+        # Движок с вещественной первой фазой может остановиться по пределу до нахождения допустимого базиса
+        if optimizer.stop_status is not None:
+            result.status, result.iterations = optimizer.stop_status, optimizer.iterations
+            result.message = LIMIT_MESSAGES[result.status]
+            return result
+        tracer.emit(TraceLevel.SUMMARY, 'table', title="\nПервоначальная таблица:", table=table)
+
+        work_table = optimizer.prepare_table(table)
+        result.status = optimizer.solve_table(work_table)
+        optimizer.finish_table(table, work_table)
+        stage = mark('simplex', stage)
+        result.iterations = optimizer.iterations
+        result.table = table
+        result.message = LIMIT_MESSAGES.get(result.status)
+        # При остановке по пределу возвращаются текущий базис и значение целевой функции в нём
+        if result.status == SolveStatus.OPTIMAL or result.message is not None:
+            z_value = table.matrix[0][-1]
+            solution = optimizer.get_solution(table)
+            solution = solution[:len(solution) - table.aux_vars]
+            result.objective = z_value if problem.goal.maximize else z_value.invert()
+            result.x = presolver.postsolve(solution) if presolver is not None else solution
+            result.basis = list(table.base_indices)
+            if options.sensitivity and result.status == SolveStatus.OPTIMAL:
+                result.sensitivity = SensitivityAnalysis(problem, table)
+                stage = mark('sensitivity', stage)
+
+        # Вывод ответа может перейти к альтернативному решению, поэтому таблица результата копируется заранее
+        if tracer.level >= TraceLevel.SUMMARY:
+            result.table = table.copy()
+            optimizer.display_final_result(work_table)
+            mark('display', stage)
+        return result
+    finally:
+        result.timings['total'] = time.perf_counter() - started
+        if stats is not None:
+            stats.stop_counting()
+            stats.timings.update(result.timings)
+        if key is not None:
+            cache.put(key, result)
+
+
+def load_problem(file_path: str, file_format: Optional[str] = None) -> 'LinearProblem':
+    return ProblemReader.read_problem(file_path, file_format)
 
 
 def main():
@@ -813,15 +4769,19 @@ def main():
             break
 
     try:
+        tracer = Tracer.console(TraceLevel.ROW_OP)
         TableFormatter.format_problem(problem)
-        canonical_form = FormTransformer.transform(problem)
-        table = LinearTable(canonical_form)
-
-        print("\nПервоначальная таблица:")
-        TableFormatter.display_table(table)
-
-        optimizer = LinearOptimizer()
-        optimizer.optimize(table)
+        result = solve(problem, options=SolveOptions(tracer=tracer))
+        if result.message is not None:
+            print(f"Ошибка: {result.message}")
+        elif problem.integers:
+            if result.status == SolveStatus.OPTIMAL:
+                tracer.message(
+                    TraceLevel.SUMMARY,
+                    f"Целочисленное решение: Z{'max' if problem.goal.maximize else 'min'}({', '.join(str(x) for x in result.x)}) = {result.objective}"
+                )
+            else:
+                tracer.message(TraceLevel.SUMMARY, "Целочисленного решения нет")
     except Exception as e:
         print(f"Ошибка: {str(e)}")
 
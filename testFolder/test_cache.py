@@ -0,0 +1,50 @@
+import os
+
+from simplex_benchmark import random_dense
+from simplex_method_full import RationalNumber, ResultCache, SolveOptions, SolveResult, SolveStatus, solve
+
+
+def optimal_result(value: int) -> SolveResult:
+    result = SolveResult(SolveStatus.OPTIMAL)
+    result.objective = RationalNumber(value)
+    result.x = [RationalNumber(value)]
+    return result
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    cache.put('a', optimal_result(1))
+    cache.put('b', optimal_result(2))
+    assert cache.get('a').objective == RationalNumber(1)
+    cache.put('c', optimal_result(3))
+    assert list(cache.entries) == ['a', 'c']
+    assert cache.get('b') is None
+
+
+def test_limit_stops_are_not_cached():
+    cache = ResultCache()
+    cache.put('a', SolveResult(SolveStatus.ITERATION_LIMIT))
+    assert cache.get('a') is None
+
+
+def test_disk_tier_survives_new_cache(tmp_path):
+    first = ResultCache(directory=str(tmp_path))
+    expected = solve(random_dense(6, 4, 3), options=SolveOptions(cache=first))
+    second = ResultCache(directory=str(tmp_path))
+    result = solve(random_dense(6, 4, 3), options=SolveOptions(cache=second))
+    assert second.hits == 1
+    assert result.status == expected.status
+    assert result.objective == expected.objective
+    assert result.x == expected.x
+    assert result.basis == expected.basis
+
+
+def test_disk_tier_evicts_oldest_files(tmp_path):
+    cache = ResultCache(directory=str(tmp_path))
+    cache.put('old', optimal_result(1))
+    cache.put('new', optimal_result(2))
+    os.utime(cache.path('old'), (1, 1))
+    cache.max_bytes = os.path.getsize(cache.path('new'))
+    cache.evict()
+    assert not os.path.exists(cache.path('old'))
+    assert os.path.exists(cache.path('new'))
@@ -0,0 +1,126 @@
+import pytest
+
+from simplex_benchmark import make_goal, make_limit, make_lp_suite
+from simplex_method_full import (LIMIT_MESSAGES, FloatOptimizer, FloatTable, FormTransformer, Goal, HybridOptimizer, LinearOptimizer,
+                                 LinearProblem, Limit, RationalNumber, RestrictionType, SolveOptions, SolveStats, SolveStatus, np, solve)
+
+R = RationalNumber
+
+needs_numpy = pytest.mark.skipif(np is None, reason="требуется numpy")
+
+
+def mixed_problem() -> LinearProblem:
+    # Ограничения всех трёх видов: без первой фазы базис не найти
+    return LinearProblem(Goal(True, [R(3), R(2), R(4)]), [
+        Limit(RestrictionType.BELOW, [R(1), R(1), R(2)], R(4)),
+        Limit(RestrictionType.ABOVE, [R(2), R(0), R(3)], R(5)),
+        Limit(RestrictionType.EQUALS, [R(1), R(3), R(0)], R(2)),
+    ])
+
+
+@needs_numpy
+def test_float_solve_does_no_rational_arithmetic_before_write_back(monkeypatch):
+    counts = {}
+    finish_table = FloatOptimizer.finish_table
+
+    def spy(optimizer, table, work_table):
+        stats = SolveStats.current.get()
+        counts.update(stats.operation_counts, gcd_calls=stats.gcd_calls)
+        finish_table(optimizer, table, work_table)
+
+    monkeypatch.setattr(FloatOptimizer, 'finish_table', spy)
+    result = solve(mixed_problem(), 'float', SolveOptions(stats=SolveStats()))
+    assert result.status == SolveStatus.OPTIMAL
+    assert result.objective == R(10)
+    assert counts and not any(counts.values())
+
+
+@needs_numpy
+def test_hybrid_float_phase_starts_without_exact_table(monkeypatch):
+    expected = solve(mixed_problem()).objective
+    counts = {}
+    restore_basis = HybridOptimizer.restore_basis
+
+    def spy(optimizer, work_table):
+        stats = SolveStats.current.get()
+        counts.update(stats.operation_counts, gcd_calls=stats.gcd_calls)
+        return restore_basis(optimizer, work_table)
+
+    monkeypatch.setattr(HybridOptimizer, 'restore_basis', spy)
+    optimizer = HybridOptimizer()
+    monkeypatch.setattr(LinearOptimizer, 'create', classmethod(lambda cls, engine, **kwargs: optimizer))
+    result = solve(mixed_problem(), 'hybrid', SolveOptions(stats=SolveStats()))
+    assert result.status == SolveStatus.OPTIMAL
+    assert result.objective == expected
+    assert optimizer.certified
+    assert counts and not any(counts.values())
+
+
+@needs_numpy
+@pytest.mark.parametrize('engine', ['float', 'hybrid'])
+@pytest.mark.parametrize('integers', [set(), {0, 1}])
+def test_float_phase_one_stops_at_iteration_limit(engine, integers):
+    problem = mixed_problem()
+    problem.integers = integers
+    result = solve(problem, engine, SolveOptions(max_iterations=0))
+    assert result.status == SolveStatus.ITERATION_LIMIT
+    assert result.message == LIMIT_MESSAGES[SolveStatus.ITERATION_LIMIT]
+    assert result.iterations == 0
+    assert result.x is None
+
+
+@needs_numpy
+def test_from_canonical_reports_phase_one_stop():
+    optimizer = FloatOptimizer(max_iterations=0)
+    assert FloatTable.from_canonical(FormTransformer.transform(mixed_problem()), optimizer) is None
+    assert optimizer.stop_status == SolveStatus.ITERATION_LIMIT
+
+
+def suite_problems():
+    return list(make_lp_suite().items())
+
+
+@pytest.mark.parametrize('engine', [name for name in LinearOptimizer.engines if name != 'rational'])
+@pytest.mark.parametrize('name,make', suite_problems())
+def test_engines_agree_on_benchmark_families(engine, name, make):
+    if engine != 'integer' and np is None:
+        pytest.skip("требуется numpy")
+    options = SolveOptions(network=False)
+    expected = solve(make(), 'rational', options)
+    result = solve(make(), engine, options)
+    assert result.status == expected.status
+    if engine == 'float':
+        # Вещественный движок возвращает приближённое значение целевой функции
+        assert result.objective is None or result.objective.to_float() == pytest.approx(expected.objective.to_float(), rel=1e-9)
+    else:
+        assert result.objective == expected.objective
+
+
+@pytest.mark.parametrize('name,make', suite_problems())
+def test_integer_engine_repeats_rational_pivots(name, make):
+    options = SolveOptions(network=False)
+    expected = solve(make(), 'rational', options)
+    result = solve(make(), 'integer', options)
+    assert result.iterations == expected.iterations
+    assert result.basis == expected.basis
+    if expected.table is not None:
+        assert [row.entries for row in result.table.matrix] == [row.entries for row in expected.table.matrix]
+
+
+def knapsack_problem() -> LinearProblem:
+    problem = LinearProblem(make_goal(True, [5, 4, 3, 7, 6]), [
+        make_limit(RestrictionType.BELOW, {0: 2, 1: 3, 2: 1, 3: 4, 4: 5}, 11),
+        make_limit(RestrictionType.BELOW, {0: 3, 1: 1, 2: 2, 3: 2, 4: 3}, 9),
+    ])
+    problem.integers = {0, 1, 2, 3, 4}
+    return problem
+
+
+@pytest.mark.parametrize('workers', [2, 4])
+def test_branch_and_bound_workers_match_sequential(workers):
+    expected = solve(knapsack_problem())
+    result = solve(knapsack_problem(), options=SolveOptions(workers=workers))
+    assert expected.status == SolveStatus.OPTIMAL
+    assert result.status == expected.status
+    assert result.objective == expected.objective == R(22)
+    assert all(value.bottom == 1 for value in result.x)
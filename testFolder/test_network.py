@@ -0,0 +1,19 @@
+import pytest
+
+from simplex_benchmark import assignment, transportation
+from simplex_method_full import HungarianMethod, NetworkSimplex, NetworkStructure, SolveOptions, SolveStatus, solve
+
+
+@pytest.mark.parametrize('seed', range(1, 6))
+@pytest.mark.parametrize('make,solver_type', [
+    (lambda seed: transportation(3, 4, seed), NetworkSimplex),
+    (lambda seed: assignment(4, seed), HungarianMethod),
+])
+def test_network_path_matches_tableau(seed, make, solver_type):
+    structure = NetworkStructure.detect(make(seed))
+    assert isinstance(structure.create_solver(), solver_type)
+    result = solve(make(seed))
+    expected = solve(make(seed), options=SolveOptions(network=False))
+    assert result.status == expected.status == SolveStatus.OPTIMAL
+    assert result.objective == expected.objective
+    assert structure.objective(result.x) == result.objective
@@ -0,0 +1,43 @@
+from simplex_method_full import Goal, LinearProblem, Limit, Presolver, RationalNumber, RestrictionType, SolveOptions, SolveStatus, solve
+
+R = RationalNumber
+
+
+def ranged_problem() -> LinearProblem:
+    # -2 <= x1 - x2 <= 2 задаётся парой строк с одинаковыми коэффициентами
+    return LinearProblem(Goal(True, [R(1), R(2)]), [
+        Limit(RestrictionType.BELOW, [R(1), R(-1)], R(2)),
+        Limit(RestrictionType.ABOVE, [R(1), R(-1)], R(-2)),
+        Limit(RestrictionType.BELOW, [R(1), R(1)], R(6)),
+    ])
+
+
+def test_ranged_row_does_not_repeat_passes(monkeypatch):
+    calls = []
+    merge_duplicate_rows = Presolver.merge_duplicate_rows
+
+    def spy(presolver):
+        calls.append(1)
+        return merge_duplicate_rows(presolver)
+
+    monkeypatch.setattr(Presolver, 'merge_duplicate_rows', spy)
+    presolver = Presolver(ranged_problem())
+    reduced = presolver.presolve()
+    assert len(calls) == 1
+    assert presolver.stats['duplicate_rows'] == 0
+    assert len(reduced.restrictions) == 3
+
+
+def test_ranged_row_solution_matches_without_presolve():
+    plain = solve(ranged_problem())
+    reduced = solve(ranged_problem(), options=SolveOptions(presolve=True))
+    assert plain.status == reduced.status == SolveStatus.OPTIMAL
+    assert plain.objective == reduced.objective == R(10)
+    assert reduced.x == [R(2), R(4)]
+
+
+def test_conflicting_bounds_are_infeasible():
+    problem = LinearProblem(Goal(False, [R(-3), R(2), R(3)]), [Limit(RestrictionType.ABOVE, [R(5), R(5), R(4)], R(3))])
+    problem.bounds[1] = (R(3), R(2))
+    result = solve(problem, options=SolveOptions(presolve=True))
+    assert result.status == SolveStatus.INFEASIBLE
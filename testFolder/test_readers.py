@@ -0,0 +1,95 @@
+import pytest
+
+from simplex_method_full import ProblemReader, RationalNumber, RestrictionType, solve
+
+R = RationalNumber
+
+# Одна и та же задача в трёх форматах: ограничения всех видов, границы и целочисленная переменная
+SOURCES = {
+    'task': """
+Z : 3x1 + 2x2 + x3 -> max
+x1 + x2 + x3 <= 10
+x1 - x2 >= -2
+x1 + 2x3 = 8
+x2 <= 4
+x3 >= 1
+int x1
+""",
+    'mps': """
+NAME          sample
+OBJSENSE
+    MAX
+ROWS
+ N  obj
+ L  c1
+ G  c2
+ E  c3
+COLUMNS
+    MARKER    'MARKER'    'INTORG'
+    x1        obj         3          c1        1
+    x1        c2          1          c3        1
+    MARKER    'MARKER'    'INTEND'
+    x2        obj         2          c1        1
+    x2        c2          -1
+    x3        obj         1          c1        1
+    x3        c3          2
+RHS
+    RHS       c1          10         c2        -2
+    RHS       c3          8
+BOUNDS
+ UP BND       x2          4
+ LO BND       x3          1
+ENDATA
+""",
+    'lp': """
+Maximize
+ obj: 3 x1 + 2 x2 + x3
+Subject To
+ c1: x1 + x2 + x3 <= 10
+ c2: x1 - x2 >= -2
+ c3: x1 + 2 x3 = 8
+Bounds
+ x2 <= 4
+ x3 >= 1
+General
+ x1
+End
+""",
+}
+
+EXTENSIONS = {'task': '.txt', 'mps': '.mps', 'lp': '.lp'}
+
+
+def describe(problem):
+    def row(factors):
+        return {j: value for j, value in factors.items() if value.top != 0}
+
+    return {
+        'goal': (problem.goal.maximize, row(problem.goal.factors), problem.goal.offset),
+        'restrictions': [(limit.kind, row(limit.factors), limit.right_side) for limit in problem.restrictions],
+        'bounds': dict(problem.bounds),
+        'integers': set(problem.integers),
+    }
+
+
+EXPECTED = {
+    'goal': (True, {0: R(3), 1: R(2), 2: R(1)}, R(0)),
+    'restrictions': [
+        (RestrictionType.BELOW, {0: R(1), 1: R(1), 2: R(1)}, R(10)),
+        (RestrictionType.ABOVE, {0: R(1), 1: R(-1)}, R(-2)),
+        (RestrictionType.EQUALS, {0: R(1), 2: R(2)}, R(8)),
+    ],
+    'bounds': {1: (R(0), R(4)), 2: (R(1), None)},
+    'integers': {0},
+}
+
+
+@pytest.mark.parametrize('file_format', list(SOURCES))
+def test_reader_round_trip(tmp_path, file_format):
+    path = tmp_path / ('sample' + EXTENSIONS[file_format])
+    path.write_text(SOURCES[file_format], encoding='utf-8')
+    problem = ProblemReader.read_problem(str(path))
+    assert describe(problem) == EXPECTED
+    result = solve(problem)
+    assert result.objective == R(25)
+    assert result.x == [R(6), R(3), R(1)]
@@ -0,0 +1,38 @@
+from simplex_method_full import ProblemReader, RationalNumber, SolveOptions, SolveStatus, TableFormatter, solve
+
+R = RationalNumber
+
+
+def test_bound_rows_keep_their_numbers_and_duals():
+    problem = ProblemReader.read_task([
+        "Z : 3x1 + 2x2 -> max",
+        "x1 <= 3",
+        "x1 + x2 <= 4",
+        "2x2 >= 0",
+    ])
+    assert [restriction.right_side for restriction in problem.restrictions] == [R(4)]
+    assert sorted(problem.bound_rows) == [0, 2]
+
+    result = solve(problem, options=SolveOptions(sensitivity=True))
+    assert result.status == SolveStatus.OPTIMAL
+    analysis = result.sensitivity
+    assert analysis.row_numbers == [1]
+    assert analysis.shadow_prices == [R(2)]
+    # Рост границы x1 <= 3 на единицу даёт 3 - 2 = 1, граница x2 >= 0 не активна
+    assert analysis.bound_prices == {0: R(1), 2: R(0)}
+    lines = TableFormatter.format_sensitivity(analysis).splitlines()
+    assert lines[1].startswith(" 1: граница переменной x1, двойственная оценка 1")
+    assert lines[2].startswith(" 2: двойственная оценка 2")
+    assert lines[3].startswith(" 3: граница переменной x2, двойственная оценка 0")
+
+
+def test_bound_row_dual_for_minimization():
+    problem = ProblemReader.read_task([
+        "Z : x1 + 2x2 -> min",
+        "x1 + x2 >= 4",
+        "2x2 >= 2",
+    ])
+    result = solve(problem, options=SolveOptions(sensitivity=True))
+    assert result.objective == R(5)
+    # Граница x2 >= 1 задана строкой 2x2 >= 2, оценка приходится на единицу её правой части
+    assert result.sensitivity.bound_prices == {1: R(1, 2)}
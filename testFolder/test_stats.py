@@ -0,0 +1,27 @@
+from simplex_method_full import RationalNumber, SolveStats
+
+
+def test_backend_switch_during_counting_survives_uninstall():
+    stats = SolveStats()
+    stats.start_counting()
+    try:
+        RationalNumber.use_backend('fraction')
+    finally:
+        stats.stop_counting()
+    try:
+        assert RationalNumber.backend == 'fraction'
+        assert RationalNumber.reduce_pair is RationalNumber.backends['fraction']
+        assert RationalNumber(6, 4) == RationalNumber(3, 2)
+    finally:
+        RationalNumber.use_backend('native')
+
+
+def test_counting_restores_arithmetic():
+    operations = {name: RationalNumber.__dict__[name] for name in SolveStats.operations}
+    stats = SolveStats()
+    stats.start_counting()
+    RationalNumber(1, 3) + RationalNumber(1, 6)
+    stats.stop_counting()
+    assert stats.operation_counts and stats.gcd_calls
+    assert {name: RationalNumber.__dict__[name] for name in SolveStats.operations} == operations
+    assert RationalNumber.reduce_pair is RationalNumber.backends['native']
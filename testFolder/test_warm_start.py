@@ -0,0 +1,50 @@
+from simplex_benchmark import make_limit, random_dense
+from simplex_method_full import RationalNumber, RestrictionType, SolveStatus, solve
+
+R = RationalNumber
+
+
+def base_problem():
+    return random_dense(6, 4, 3)
+
+
+def solved_table():
+    result = solve(base_problem())
+    assert result.status == SolveStatus.OPTIMAL
+    return result.table
+
+
+def test_update_rhs_matches_fresh_solve():
+    table = solved_table()
+    assert table.update_rhs(2, R(40)) == SolveStatus.OPTIMAL
+    problem = base_problem()
+    problem.restrictions[2].right_side = R(40)
+    assert table.matrix[0][-1] == solve(problem).objective
+
+
+def test_update_objective_matches_fresh_solve():
+    table = solved_table()
+    assert table.update_objective(1, R(50)) == SolveStatus.OPTIMAL
+    problem = base_problem()
+    problem.goal.factors[1] = R(50)
+    assert table.matrix[0][-1] == solve(problem).objective
+
+
+def test_add_constraint_matches_fresh_solve():
+    table = solved_table()
+    limit = make_limit(RestrictionType.BELOW, {0: 1, 1: 1, 2: 1, 3: 1}, 7)
+    assert table.add_constraint(limit) == SolveStatus.OPTIMAL
+    problem = base_problem()
+    problem.restrictions.append(limit)
+    assert table.matrix[0][-1] == solve(problem).objective
+
+
+def test_add_variable_matches_fresh_solve():
+    table = solved_table()
+    assert table.add_variable(R(25), [R(1)] * 6) == SolveStatus.OPTIMAL
+    problem = base_problem()
+    problem.goal.factors.resize(5)
+    problem.goal.factors[4] = R(25)
+    for limit in problem.restrictions:
+        limit.factors[4] = R(1)
+    assert table.matrix[0][-1] == solve(problem).objective